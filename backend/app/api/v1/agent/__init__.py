@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+from app.api.v1.agent import stream
+
+router = APIRouter(prefix="/agent")
+
+router.include_router(stream.router)
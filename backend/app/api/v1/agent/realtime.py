@@ -0,0 +1,70 @@
+"""
+에이전트 응답 Socket.IO 스트리밍
+
+클라이언트가 `ask` 이벤트({"question", "session_id"})를 보내면 SSE 엔드포인트와 같은 이벤트
+(cache_hit/retrieval/token/done/error)를 같은 이름으로 해당 연결에 emit 합니다.
+연결이 끊기면 진행 중인 그래프 실행을 취소합니다.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+import socketio
+from pydantic import ValidationError
+
+from app.api.v1.agent.stream import stream_events
+from app.config.setting import settings
+from app.core.logger import get_logger
+from app.schema.agent import AgentQuestionRequest
+
+logger = get_logger("api.agent.realtime")
+
+sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+
+# 연결별 진행 중인 실행 태스크
+_running: Dict[str, asyncio.Task] = {}
+
+
+@sio.event
+async def connect(sid: str, environ: Dict[str, Any], auth: Optional[Dict[str, Any]] = None) -> None:
+    """연결 인증 (HTTP 와 같이 PROD 환경에서 ACCESS_TOKEN 이 설정된 경우만)"""
+    if settings.ENVIRONMENT != "PROD" or not settings.ACCESS_TOKEN:
+        return
+    token = (auth or {}).get("token")
+    if token is None:
+        scheme, _, token = environ.get("HTTP_AUTHORIZATION", "").partition(" ")
+        if scheme.lower() != "bearer":
+            token = None
+    if token != settings.ACCESS_TOKEN:
+        logger.bind(sid=sid).warning("유효하지 않은 액세스 토큰")
+        raise socketio.exceptions.ConnectionRefusedError("Invalid access token")
+
+
+@sio.event
+async def disconnect(sid: str, *args: Any) -> None:
+    task = _running.pop(sid, None)
+    if task is not None:
+        task.cancel()
+
+
+@sio.event
+async def ask(sid: str, data: Dict[str, Any]) -> None:
+    """질문을 받아 그래프 이벤트를 스트리밍 (연결당 동시에 1개 실행)"""
+    try:
+        request = AgentQuestionRequest.model_validate(data)
+    except ValidationError as e:
+        await sio.emit("error", {"detail": e.errors(include_url=False, include_context=False)}, to=sid)
+        return
+    if sid in _running:
+        await sio.emit("error", {"detail": "Another question is in progress"}, to=sid)
+        return
+
+    _running[sid] = asyncio.current_task()
+    try:
+        async for event in stream_events(request.question, request.session_id):
+            await sio.emit(event["event"], event["data"], to=sid)
+    finally:
+        _running.pop(sid, None)
+
+
+# FastAPI 앱에 /socket.io 로 마운트 (마운트 경로 아래 요청을 모두 처리)
+socketio_app = socketio.ASGIApp(sio, socketio_path=None)
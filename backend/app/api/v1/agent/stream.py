@@ -0,0 +1,56 @@
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.graph.example.graph_orchestrator import get_example_graph
+from app.core.logger import get_logger
+from app.schema.agent import AgentQuestionRequest
+
+router = APIRouter(prefix="/example", tags=["Agent-Example"])
+
+logger = get_logger("api.agent.stream")
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """그래프 이벤트를 SSE 메시지로 변환"""
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+
+
+async def stream_events(question: str, session_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """그래프 스트리밍 이벤트 (실행 중 오류는 error 이벤트로 전달, SSE/Socket.IO 공용)"""
+    try:
+        async for event in get_example_graph().astream(question, session_id):
+            yield event
+    except Exception as e:
+        logger.bind(session_id=session_id, error=str(e)).error("그래프 스트리밍 실패")
+        yield {"event": "error", "data": {"detail": "Internal server error"}}
+
+
+@router.post(
+    "/stream",
+    summary="에이전트 응답 스트리밍 (SSE)",
+    description=(
+        "질문에 대한 에이전트 응답을 Server-Sent Events 로 스트리밍합니다.\n\n"
+        "- `cache_hit`: 응답 캐시에서 답변 (이어서 전체 답변이 `token` 1개로 전달됨)\n"
+        "- `retrieval`: 문서 검색 완료 (`documents`: 검색 문서 수)\n"
+        "- `token`: 응답 토큰 (`content`)\n"
+        "- `done`: 최종 답변과 실행 시간, 첫 토큰까지 시간, 토큰 사용량, 비용, 캐시 hit 여부\n"
+        "- `error`: 실행 실패"
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_answer(request: AgentQuestionRequest) -> StreamingResponse:
+    """에이전트 응답 스트리밍"""
+
+    async def body() -> AsyncIterator[str]:
+        async for event in stream_events(request.question, request.session_id):
+            yield format_sse(event)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        # 프록시 버퍼링을 끄지 않으면 토큰이 모여서 전달됨
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-from app.api.v1 import user
+from app.api.v1 import agent, user
 
 api_router = APIRouter()
 
-api_router.include_router(user.router)
\ No newline at end of file
+api_router.include_router(user.router)
+api_router.include_router(agent.router)
\ No newline at end of file
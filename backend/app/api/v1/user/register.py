@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
+from app.config.setting import settings
 from app.container import Container
+from app.core.counter import CountMode
 from app.service.user import UserService
 from app.database.session import UnitOfWork
 from app.schema.user import (
@@ -9,9 +14,11 @@ from app.schema.user import (
     UserUpdateRequest, 
     UserResponse, 
     UserListResponse,
+    UserImportResponse,
     SuccessResponse
 )
 from app.dto.user import UserCreateDTO, UserUpdateDTO
+from app.util.record_io import RECORD_MEDIA_TYPES
 
 router = APIRouter(prefix="/test", tags=["User-Test"])
 
@@ -74,12 +81,52 @@ async def create_user_controller_transaction(
             )
             
             created_user = await user_service.create_user_with_session(session, user_dto)
-            
-            return UserResponse(
-                email=created_user.email,
-                name=created_user.name,
-                created_at=created_user.created_at
-            )
+        
+        # 커밋 이후 캐시/카운터 반영
+        await user_service.after_user_created(created_user)
+        
+        return UserResponse(
+            email=created_user.email,
+            name=created_user.name,
+            created_at=created_user.created_at
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
+@router.post(
+    "/import",
+    response_model=UserImportResponse,
+    summary="사용자 대량 생성",
+    description=(
+        "NDJSON 또는 CSV(헤더: email,name) 요청 본문을 스트리밍으로 읽어 사용자를 대량 생성합니다.\n\n"
+        "검증 실패/이미 존재하는 행은 건너뛰고 `errors` 에 줄 번호와 사유를 반환합니다. "
+        "배치 단위로 커밋되므로 중간에 실패하면 이전 배치까지는 반영됩니다."
+    )
+)
+@inject
+async def import_users(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="요청 본문 형식"),
+    user_service: UserService = Depends(Provide[Container.user_service])
+) -> UserImportResponse:
+    """사용자 대량 생성"""
+    try:
+        result = await user_service.import_users(
+            request.stream(),
+            fmt=format,
+            batch_size=settings.USER_IMPORT_BATCH_SIZE,
+            max_errors=settings.USER_IMPORT_MAX_ERRORS,
+        )
+        return UserImportResponse.model_validate(result.model_dump())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -96,17 +143,31 @@ async def create_user_controller_transaction(
     "/search",
     response_model=UserListResponse,
     summary="사용자 목록 조회",
-    description="모든 사용자 목록을 조회합니다. (페이징)"
+    description=(
+        "모든 사용자 목록을 조회합니다. (페이징)\n\n"
+        "- offset 페이징: `skip`, `limit` (기본값, 기존 호환)\n"
+        "- 커서 페이징: `pagination=cursor` 로 첫 페이지를 조회한 뒤 응답의 `next_cursor` 를 `cursor` 로 전달\n"
+        "- 전체 수: `count=exact` (기본값, 캐시된 정확한 수) / `estimated` (통계 기반 근사치) / `none` (생략)"
+    )
 )
 @inject
 async def get_users(
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수 (offset 페이징)"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 레코드 수"),
+    pagination: Literal["offset", "cursor"] = Query("offset", description="페이징 방식"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 커서 페이징)"),
+    count: CountMode = Query(CountMode.EXACT, description="전체 수 계산 방식"),
     user_service: UserService = Depends(Provide[Container.user_service])
 ) -> UserListResponse:
     """사용자 목록 조회"""
     try:
-        users, total = await user_service.get_all_users(skip=skip, limit=limit)
+        next_cursor = None
+        if cursor or pagination == "cursor":
+            users, total, next_cursor = await user_service.get_users_by_cursor(
+                cursor=cursor, limit=limit, count_mode=count
+            )
+        else:
+            users, total = await user_service.get_all_users(skip=skip, limit=limit, count_mode=count)
         user_responses = [
             UserResponse(
                 email=user.email,
@@ -114,7 +175,12 @@ async def get_users(
                 created_at=user.created_at
             ) for user in users
         ]
-        return UserListResponse(users=user_responses, total=total)
+        return UserListResponse(users=user_responses, total=total, next_cursor=next_cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -122,6 +188,35 @@ async def get_users(
         )
 
 
+@router.get(
+    "/export",
+    summary="사용자 전체 내보내기",
+    description=(
+        "전체 사용자를 NDJSON 또는 CSV 로 스트리밍합니다. (서버 사이드 커서, 메모리 사용량 일정)\n\n"
+        "`Accept-Encoding: gzip` 요청 시 gzip 으로 압축하며 전송합니다."
+    ),
+    response_class=StreamingResponse,
+)
+@inject
+async def export_users(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="응답 형식"),
+    user_service: UserService = Depends(Provide[Container.user_service])
+) -> StreamingResponse:
+    """사용자 전체 내보내기"""
+    gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    headers = {"Content-Disposition": f'attachment; filename="users.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    
+    return StreamingResponse(
+        user_service.export_users(fmt=format, gzip=gzip, batch_size=settings.USER_EXPORT_BATCH_SIZE),
+        media_type=RECORD_MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
 @router.get(
     "/{email}",
     response_model=UserResponse,
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -22,9 +22,71 @@ class Settings(BaseSettings):
     LOG_RETENTION: str = Field("30 days", description="로그 파일 롤테이션 기준")
     LOG_COMPRESSION: str = Field("gz", description="로그 롤테이션 파일 압축")
     
+    # API 호출 로그 (MongoDB) 버퍼 설정
+    API_LOG_QUEUE_SIZE: int = Field(10000, description="API 로그 버퍼 큐 최대 크기")
+    API_LOG_BATCH_SIZE: int = Field(500, description="insert_many 1회당 최대 로그 수")
+    API_LOG_FLUSH_INTERVAL: float = Field(1.0, description="버퍼 flush 주기 (초)")
+    API_LOG_OVERFLOW_POLICY: str = Field("drop", description="큐 포화 시 정책 (drop/sample/block)")
+    API_LOG_SAMPLE_RATE: float = Field(0.1, description="sample 정책에서 큐 절반 이상 적재 시 저장 비율")
+    
+    # 사용자 조회 캐시 (L1 메모리 + L2 Redis)
+    USER_CACHE_ENABLED: bool = Field(True, description="사용자 조회 캐시 사용 여부")
+    USER_CACHE_L1_MAX_SIZE: int = Field(1024, description="워커별 L1 캐시 최대 항목 수")
+    USER_CACHE_L1_TTL: float = Field(30.0, description="L1 캐시 TTL (초)")
+    
+    # 사용자 대량 생성/내보내기 (import/export)
+    USER_IMPORT_BATCH_SIZE: int = Field(5000, description="COPY/병합 1회(트랜잭션 1개)당 행 수")
+    USER_IMPORT_MAX_ERRORS: int = Field(1000, description="응답에 포함할 실패 행 최대 개수")
+    USER_EXPORT_BATCH_SIZE: int = Field(5000, description="export 서버 사이드 커서 1회 fetch 행 수")
+    
+    # 메트릭 (Prometheus)
+    METRICS_ENABLED: bool = Field(True, description="/metrics 엔드포인트 및 요청 메트릭 수집 여부")
+    PROMETHEUS_MULTIPROC_DIR: Optional[str] = Field(None, description="멀티 워커 메트릭 공유 디렉토리 (지정 시 multiprocess 모드)")
+    
     # LLM KEY
     OPENAI_API_KEY: str = Field("sk-", description="OpenAI API KEY")
     
+    # 에이전트 대화 히스토리
+    AGENT_HISTORY_MAX_TOKENS: int = Field(2000, description="그래프 상태에 유지하는 대화 히스토리 최대 토큰 수")
+    AGENT_HISTORY_SUMMARY_ENABLED: bool = Field(False, description="한도를 넘은 오래된 대화를 요약으로 압축할지 여부 (false 면 삭제)")
+    
+    # 에이전트 체크포인트
+    GRAPH_CHECKPOINT_BACKEND: Literal["sqlite", "postgres", "redis"] = Field("sqlite", description="체크포인트 저장소 (sqlite: 로컬 파일, postgres/redis: 워커 간 공유)")
+    GRAPH_CHECKPOINT_KEEP_LAST: int = Field(5, description="스레드별 유지할 최근 체크포인트 수 (0 이면 정리 안 함)")
+    GRAPH_CHECKPOINT_THREAD_TTL: int = Field(2592000, description="마지막 실행 후 스레드 삭제까지 시간 (초, 0 이면 만료 안 함)")
+    GRAPH_CHECKPOINT_MAINTENANCE_INTERVAL: int = Field(600, description="체크포인트 정리 주기 (초)")
+    GRAPH_CHECKPOINT_VACUUM_PAGES: int = Field(2000, description="정리 1회당 반환할 최대 빈 페이지 수 (sqlite, 0 이면 전체)")
+    GRAPH_CHECKPOINT_MMAP_SIZE: int = Field(268435456, description="SQLite mmap 크기 (sqlite, 바이트, 0 이면 사용 안 함)")
+    
+    # 에이전트 시맨틱 응답 캐시
+    RESPONSE_CACHE_ENABLED: bool = Field(False, description="유사 질문의 이전 답변 재사용 여부")
+    RESPONSE_CACHE_SCOPE: Literal["session", "global"] = Field("session", description="응답 캐시 범위 (session: 세션별, global: 전체 세션 공유)")
+    RESPONSE_CACHE_THRESHOLD: float = Field(0.95, description="캐시 hit 로 판단할 최소 질문 cosine 유사도")
+    RESPONSE_CACHE_TTL: int = Field(86400, description="응답 캐시 항목 유효 시간 (초)")
+    RESPONSE_CACHE_PURGE_INTERVAL: int = Field(3600, description="만료 항목 삭제 주기 (초)")
+    
+    # 임베딩 캐시 (ChromaDB)
+    EMBEDDING_CACHE_ENABLED: bool = Field(True, description="임베딩 캐시 사용 여부")
+    EMBEDDING_CACHE_PATH: str = Field("./data/embedding-cache/embeddings.sqlite3", description="임베딩 캐시 SQLite 파일 경로")
+    EMBEDDING_CACHE_L1_MAX_SIZE: int = Field(2048, description="워커별 메모리 캐시 최대 벡터 수")
+    EMBEDDING_CACHE_DTYPE: str = Field("float16", description="디스크 저장 정밀도 (float16/float32)")
+    EMBEDDING_CACHE_MAX_ENTRIES: int = Field(500000, description="디스크 캐시 최대 벡터 수 (0: 제한 없음)")
+    EMBEDDING_CACHE_MAX_AGE: int = Field(30 * 86400, description="마지막 사용 후 디스크 캐시 보관 기간(초) (0: 제한 없음)")
+    EMBEDDING_CACHE_PRUNE_INTERVAL: int = Field(3600, description="디스크 캐시 정리 주기(초)")
+    
+    # ChromaDB 대량 적재
+    CHROMA_INGEST_WRITE_BATCH_SIZE: int = Field(1000, description="컬렉션 1회 기록 문서 수")
+    CHROMA_INGEST_EMBED_BATCH_TOKENS: int = Field(100000, description="임베딩 요청 1회 최대 추정 토큰 수")
+    CHROMA_INGEST_EMBED_BATCH_SIZE: int = Field(512, description="임베딩 요청 1회 최대 문서 수")
+    CHROMA_INGEST_CONCURRENCY: int = Field(4, description="동시 임베딩 요청 수")
+    
+    # ChromaDB 검색 결과 캐시
+    SEARCH_CACHE_ENABLED: bool = Field(True, description="검색 결과 캐시 사용 여부")
+    SEARCH_CACHE_L1_MAX_SIZE: int = Field(1024, description="워커별 L1 캐시 최대 항목 수")
+    SEARCH_CACHE_L1_TTL: float = Field(60.0, description="L1 캐시 TTL (초)")
+    SEARCH_CACHE_L2_TTL: int = Field(600, description="Redis 캐시 TTL (초)")
+    SEARCH_CACHE_VERSION_TTL: float = Field(1.0, description="워커별 컬렉션 버전 로컬 보관 시간 (초)")
+    
     # POSTGRES 정보
     POSTGRES_HOST: str = Field("hyeonsang-postgres", description="POSTGRES HOST")
     POSTGRES_PORT: int = Field(5432, description="POSTGRES PORT")
@@ -32,6 +94,26 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = Field("hyeonsang", description="POSTGRES PASSWORD")
     POSTGRES_NAME: str = Field("chohyeonsang", description="POSTGRES NAME")
     
+    # POSTGRES 커넥션 풀
+    POSTGRES_POOL_SIZE: int = Field(5, description="커넥션 풀 기본 크기")
+    POSTGRES_POOL_MAX_OVERFLOW: int = Field(10, description="풀 크기를 넘어 추가로 열 수 있는 커넥션 수")
+    POSTGRES_POOL_TIMEOUT: float = Field(30.0, description="커넥션 체크아웃 대기 한도 (초)")
+    POSTGRES_POOL_RECYCLE: int = Field(1800, description="커넥션 재생성 주기 (초, -1 이면 비활성화)")
+    POSTGRES_POOL_PRE_PING: bool = Field(True, description="체크아웃 시 커넥션 유효성 확인 여부")
+    POSTGRES_STATEMENT_CACHE_SIZE: int = Field(100, description="asyncpg prepared statement 캐시 크기 (PgBouncer transaction 모드면 0)")
+    
+    # POSTGRES 읽기 replica (HOST 미지정 시 비활성화, 계정/DB 이름은 primary 와 동일)
+    POSTGRES_REPLICA_HOST: Optional[str] = Field(None, description="replica HOST")
+    POSTGRES_REPLICA_PORT: int = Field(5432, description="replica PORT")
+    POSTGRES_READ_YOUR_WRITES_SECONDS: float = Field(2.0, description="같은 요청에서 쓰기 이후 primary 로 읽는 시간 (초, 0 이면 비활성화)")
+    POSTGRES_REPLICA_RETRY_SECONDS: float = Field(30.0, description="replica 연결 실패 후 primary 로만 읽는 시간 (초)")
+    
+    # SQL 프로파일링
+    SQL_PROFILING_ENABLED: bool = Field(True, description="SQL 실행 시간 측정/느린 쿼리 로그 여부")
+    SQL_SLOW_QUERY_MS: float = Field(200.0, description="느린 쿼리 로그 임계값 (ms)")
+    SQL_N_PLUS_ONE_THRESHOLD: int = Field(10, description="한 요청에서 같은 쿼리가 이 횟수를 넘으면 N+1 의심 로그 (0 이면 비활성화)")
+    SQL_PROFILE_MAX_FINGERPRINTS: int = Field(1000, description="집계하는 최대 쿼리 fingerprint 수")
+    
     # MongoDB 정보
     MONGODB_HOST: str = Field("hyeonsang-mongodb", description="MONGODB HOST")
     MONGODB_PORT: int = Field(27017, description="MONGODB PORT")
@@ -57,6 +139,12 @@ class Settings(BaseSettings):
     def POSTGRES_URL(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_NAME}"
     
+    @property
+    def POSTGRES_REPLICA_URL(self) -> Optional[str]:
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{self.POSTGRES_REPLICA_PORT}/{self.POSTGRES_NAME}"
+    
     @property
     def SYNC_POSTGRES_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_NAME}"
@@ -2,32 +2,58 @@ from dependency_injector import containers, providers
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from app.database.session import UnitOfWork
+from app.database.pool import InstrumentedAsyncQueuePool
 from app.config.setting import settings
+from app.core.cache import get_user_cache
+from app.core.counter import get_user_counter
 from app.service.user import UserService
 
+# primary / replica 공통 엔진 옵션
+ENGINE_OPTIONS = dict(
+    echo=False,
+    future=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_POOL_MAX_OVERFLOW,
+    pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+    pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+    connect_args={"statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE},
+)
+
+SESSION_OPTIONS = dict(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+
 class Container(containers.DeclarativeContainer):
     """DI Container — 의존성 선언"""
 
-    engine = providers.Singleton(
-        create_async_engine,
-        settings.POSTGRES_URL,
-        echo=False,
-        future=True,
-    )
+    engine = providers.Singleton(create_async_engine, settings.POSTGRES_URL, **ENGINE_OPTIONS)
+
+    session_factory = providers.Singleton(async_sessionmaker, bind=engine, **SESSION_OPTIONS)
+
+    # 읽기 replica (미설정 시 None → 모든 조회가 primary)
+    if settings.POSTGRES_REPLICA_URL:
+        replica_engine = providers.Singleton(create_async_engine, settings.POSTGRES_REPLICA_URL, **ENGINE_OPTIONS)
+        replica_session_factory = providers.Singleton(async_sessionmaker, bind=replica_engine, **SESSION_OPTIONS)
+    else:
+        replica_engine = providers.Object(None)
+        replica_session_factory = providers.Object(None)
+
+    uow = providers.Factory(UnitOfWork, session=session_factory, replica=replica_session_factory)
 
-    session_factory = providers.Singleton(
-        async_sessionmaker,
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-    )
+    # 사용자 조회 캐시 (비활성화 시 None)
+    user_cache = providers.Callable(get_user_cache) if settings.USER_CACHE_ENABLED else providers.Object(None)
 
-    uow = providers.Factory(UnitOfWork, session=session_factory)
+    # 사용자 수 카운터 (Redis 캐시)
+    user_counter = providers.Callable(get_user_counter)
 
     # 서비스 계층 주입
-    user_service = providers.Factory(UserService, uow=uow)
+    user_service = providers.Factory(UserService, uow=uow, cache=user_cache, counter=user_counter)
     
     # 컨트롤러 계층 주입
-    user_service_session = providers.Factory(UserService, uow=None)
+    user_service_session = providers.Factory(UserService, uow=None, cache=user_cache, counter=user_counter)
@@ -0,0 +1,318 @@
+import asyncio
+import uuid
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.config.setting import settings
+from app.core.local_cache import MISSING, LocalTTLCache
+from app.core.lock import get_redis_lock
+from app.core.logger import get_logger
+from app.core.redis import RedisClient, get_redis_client
+from app.dto.user import UserDTO
+
+logger = get_logger("redis.cache")
+
+T = TypeVar("T", bound=BaseModel)
+
+# L2 에 "없음"을 저장할 때 사용하는 값 (존재하지 않는 키 반복 조회 방지)
+_NULL_MARKER = "__null__"
+# 무효화한 키에 잠시 남기는 값 (진행 중인 채우기가 무효화 이전 값을 다시 쓰지 못하게 함)
+_TOMBSTONE = "__invalidated__"
+
+
+class TwoTierCache(Generic[T]):
+    """L1(프로세스 메모리) + L2(Redis) 2단 캐시
+
+    - 조회: L1 → L2 → loader(DB) 순으로 read-through, 채운 값은 L2/L1 에 저장
+    - 쓰기: set() 으로 L2/L1 을 갱신(write-through)하고, invalidate() 로 삭제 (L2 에는 tombstone_ttl 동안 tombstone)
+    - 채우기는 L2 에 값이 없을 때만 저장(SET NX)하므로, 로드 중에 반영된 set()/invalidate() 를 이전 값으로 덮어쓰지 않음
+    - 변경 시 pub/sub 으로 다른 워커에 알려 L1 을 비움
+    - 같은 키의 동시 miss 는 프로세스 내에서 1회로 합치고(single-flight),
+      워커 간에는 분산 락으로 DB 로드를 1회로 제한
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        model: Type[T],
+        l1_max_size: int = 1024,
+        l1_ttl: float = 30.0,
+        l2_ttl: int = RedisClient.SHORT_CACHE_TTL,
+        fill_lock_timeout: float = 5.0,
+        tombstone_ttl: int = 10,
+    ):
+        self.namespace = namespace
+        self.model = model
+        self.l2_ttl = l2_ttl
+        self.fill_lock_timeout = fill_lock_timeout
+        # 채우기 락 TTL(10초) 이상이어야 무효화 전에 시작한 채우기가 끝날 때까지 tombstone 이 남음
+        self.tombstone_ttl = tombstone_ttl
+        self._l1 = LocalTTLCache(max_size=l1_max_size, ttl=l1_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._instance_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+
+        # 카운터
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    # ---------- 키 ----------
+
+    def _get_key(self, key: str) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    @property
+    def channel(self) -> str:
+        return f"cache:invalidate:{self.namespace}"
+
+    # ---------- 생명주기 ----------
+
+    def is_running(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    async def start(self) -> None:
+        """무효화 구독 태스크 시작 (앱 시작 시 호출)"""
+        if self.is_running():
+            return
+        self._listener = asyncio.create_task(self._listen_loop(), name=f"cache-invalidator-{self.namespace}")
+        logger.bind(namespace=self.namespace).info("캐시 무효화 구독 시작")
+
+    async def stop(self) -> None:
+        """무효화 구독 태스크 종료 (앱 종료 시 호출)"""
+        if not self.is_running():
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+        self._l1.clear()
+        logger.bind(namespace=self.namespace, **self.get_stats()).info("캐시 무효화 구독 종료")
+
+    async def _listen_loop(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await get_redis_client()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                # 구독이 끊긴 동안 놓친 변경이 있을 수 있으므로 L1 을 비우고 시작
+                self._l1.clear()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message["type"] == "message":
+                        self._on_invalidate(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.bind(namespace=self.namespace, error=str(e)).warning("캐시 무효화 구독 오류, 재연결")
+                self._l1.clear()
+                await asyncio.sleep(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def _on_invalidate(self, data: str) -> None:
+        # "{instance_id}:{key}\n{key}..." 형식, 자신이 보낸 메시지는 무시
+        instance_id, _, keys = data.partition(":")
+        if instance_id != self._instance_id:
+            for key in keys.split("\n"):
+                self._l1.delete(key)
+
+    # ---------- 조회 ----------
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Optional[T]]]) -> Optional[T]:
+        """
+        캐시 조회 후 없으면 loader 로 로드 (None 결과도 캐시)
+
+        Args:
+            key: 캐시 키 (예: 이메일)
+            loader: 캐시 miss 시 원본을 조회하는 코루틴 함수
+        """
+        value = self._l1.get(key)
+        if value is not MISSING:
+            self.l1_hits += 1
+            return value
+
+        future = self._inflight.get(key)
+        if future is not None:
+            # 같은 키를 로드 중인 코루틴이 있으면 그 결과를 공유
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 로드하던 코루틴이 취소된 경우에만 다시 시도
+                if not future.cancelled():
+                    raise
+                return await self.get_or_load(key, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._fill(key, loader)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fill(self, key: str, loader: Callable[[], Awaitable[Optional[T]]]) -> Optional[T]:
+        value = await self._get_l2(key)
+        if value is not MISSING:
+            self.l2_hits += 1
+            self._l1.set(key, value)
+            return value
+
+        self.misses += 1
+        lock = get_redis_lock()
+        lock_name = self._get_key(key)
+        try:
+            acquired = await lock.acquire(lock_name, ttl=10, timeout=self.fill_lock_timeout)
+        except Exception as e:
+            # 락 오류 시에는 워커 간 중복 로드를 감수하고 원본 조회
+            self.errors += 1
+            logger.bind(key=key, error=str(e)).warning("캐시 채우기 락 획득 실패")
+            acquired = False
+
+        try:
+            if acquired:
+                # 락을 기다리는 동안 다른 워커가 채웠는지 재확인
+                value = await self._get_l2(key)
+                if value is not MISSING:
+                    self._l1.set(key, value)
+                    return value
+            self.loads += 1
+            value = await loader()
+            # 로드 중에 set()/invalidate() 가 먼저 반영됐으면(L2 에 새 값 또는 tombstone) 캐시하지 않음
+            if await self._set_l2(key, value, only_if_absent=True):
+                self._l1.set(key, value)
+            return value
+        finally:
+            if acquired:
+                await lock.release(lock_name)
+
+    # ---------- 쓰기 / 무효화 ----------
+
+    async def set(self, key: str, value: Optional[T]) -> None:
+        """L2/L1 갱신 후 다른 워커 L1 무효화 (write-through, L2 갱신 실패 시 무효화)"""
+        if not await self._set_l2(key, value):
+            # 이전 값이 L2 에 남아 다른 워커가 읽지 않도록 삭제 시도
+            await self.invalidate(key)
+            return
+        self._l1.set(key, value)
+        await self._publish(key)
+
+    async def invalidate(self, key: str) -> None:
+        """L2/L1 삭제 후 다른 워커 L1 무효화"""
+        self.invalidations += 1
+        self._l1.delete(key)
+        await self._delete_l2([key])
+        await self._publish(key)
+
+    async def invalidate_many(self, keys: List[str]) -> None:
+        """여러 키를 한 번에 무효화 (L2 삭제 1회, 알림 1회)"""
+        if not keys:
+            return
+        self.invalidations += len(keys)
+        for key in keys:
+            self._l1.delete(key)
+        await self._delete_l2(keys)
+        await self._publish(*keys)
+
+    async def _publish(self, *keys: str) -> None:
+        try:
+            client = await get_redis_client()
+            await client.publish(self.channel, f"{self._instance_id}:" + "\n".join(keys))
+        except Exception as e:
+            self.errors += 1
+            logger.bind(keys=len(keys), error=str(e)).warning("캐시 무효화 알림 실패")
+
+    # ---------- L2 ----------
+
+    async def _get_l2(self, key: str) -> Any:
+        try:
+            client = await get_redis_client()
+            raw = await client.get(self._get_key(key))
+        except Exception as e:
+            self.errors += 1
+            logger.bind(key=key, error=str(e)).warning("캐시 L2 조회 실패")
+            return MISSING
+        if raw is None or raw == _TOMBSTONE:
+            return MISSING
+        if raw == _NULL_MARKER:
+            return None
+        return self.model.model_validate_json(raw)
+
+    async def _set_l2(self, key: str, value: Optional[T], only_if_absent: bool = False) -> bool:
+        """L2 저장 후 성공 여부 반환 (only_if_absent 면 키가 없을 때만 저장)"""
+        raw = _NULL_MARKER if value is None else value.model_dump_json()
+        try:
+            client = await get_redis_client()
+            stored = await client.set(self._get_key(key), raw, ex=self.l2_ttl, nx=only_if_absent)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(key=key, error=str(e)).warning("캐시 L2 저장 실패")
+            return False
+        return bool(stored)
+
+    async def _delete_l2(self, keys: List[str]) -> None:
+        """L2 값을 tombstone 으로 교체 (저장 실패 시 삭제 시도, maxmemory 로 쓰기가 거부돼도 DEL 은 가능)"""
+        redis_keys = [self._get_key(key) for key in keys]
+        try:
+            client = await get_redis_client()
+            pipe = client.pipeline(transaction=False)
+            for redis_key in redis_keys:
+                pipe.set(redis_key, _TOMBSTONE, ex=self.tombstone_ttl)
+            await pipe.execute()
+            return
+        except Exception as e:
+            self.errors += 1
+            logger.bind(keys=len(keys), error=str(e)).warning("캐시 L2 tombstone 저장 실패, 삭제 시도")
+        try:
+            client = await get_redis_client()
+            await client.delete(*redis_keys)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(keys=len(keys), error=str(e)).warning("캐시 L2 삭제 실패")
+
+    # ---------- 통계 ----------
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 카운터 반환"""
+        return {
+            "l1_size": len(self._l1),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "evictions": self._l1.evictions,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_user_cache() -> TwoTierCache[UserDTO]:
+    """사용자 조회 캐시 싱글톤 인스턴스를 반환합니다."""
+    return TwoTierCache(
+        namespace="user",
+        model=UserDTO,
+        l1_max_size=settings.USER_CACHE_L1_MAX_SIZE,
+        l1_ttl=settings.USER_CACHE_L1_TTL,
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, AsyncIterable, AsyncIterator, Callable, Union
+from dataclasses import dataclass
 from pathlib import Path
 import traceback
 import asyncio
@@ -8,25 +9,97 @@ import chromadb
 from langchain_chroma import Chroma
 from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 
 from app.config.setting import settings
 from app.core.logger import get_logger
 from app.core.lock import get_redis_lock
+from app.core.embedding_cache import EmbeddingCache
+from app.core.search_cache import SearchResultCache, get_search_cache
 
 logger = get_logger("chromaDB.manager")
 
+EMBEDDING_MODEL = "text-embedding-3-large"
+
+
+class CachedEmbeddings(Embeddings):
+    """EmbeddingCache 를 거쳐 캐시에 없는 텍스트만 임베딩하는 래퍼
+
+    OpenAI 임베딩은 문서/질의 구분이 없으므로 같은 캐시 키를 공유합니다.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache):
+        self.embeddings = embeddings
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.cache.get_or_embed(texts, self.embeddings.embed_documents)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.cache.get_or_embed([text], lambda texts: [self.embeddings.embed_query(texts[0])])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.cache.aget_or_embed(texts, self.embeddings.aembed_documents)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        async def _embed(texts: List[str]) -> List[List[float]]:
+            return [await self.embeddings.aembed_query(texts[0])]
+        return (await self.cache.aget_or_embed([text], _embed))[0]
+
+
+@dataclass
+class IngestProgress:
+    """대량 적재 진행 상황 (last_id 까지 처리됨 → 재시작 시 이어서 적재 가능)"""
+    received: int = 0
+    written: int = 0
+    skipped: int = 0
+    failed: int = 0
+    last_id: Optional[str] = None
+
+
+def estimate_tokens(text: str) -> int:
+    """임베딩 배치 크기 계산용 토큰 수 추정 (UTF-8 3바이트당 1토큰, 영문/한글 모두 실제보다 크게 추정)"""
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+async def _iter_batches(
+    documents: Union[Iterable[Document], AsyncIterable[Document]],
+    size: int,
+) -> AsyncIterator[List[Document]]:
+    batch: List[Document] = []
+    if hasattr(documents, "__aiter__"):
+        async for document in documents:
+            batch.append(document)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    else:
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
 
 class ChromaManager:
     """ChromaDB 벡터 스토어 관리자"""
 
     def __init__(self, persist_directory: str = "./data/chromadb-data"):
-        self.embeddings: Optional[OpenAIEmbeddings] = None
+        self.embeddings: Optional[Embeddings] = None
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        self.search_cache: Optional[SearchResultCache] = get_search_cache() if settings.SEARCH_CACHE_ENABLED else None
         self.collections: Dict[str, Chroma] = {}
         self.persist_directory = persist_directory
         self.client: Optional[chromadb.PersistentClient] = None
         self._initialized = False
         self._lock = get_redis_lock()
 
+        # 카운터
+        self.upsert_embedded = 0
+        self.upsert_metadata_only = 0
+
     # ---------- 내부 유틸 ----------
 
     @staticmethod
@@ -34,6 +107,11 @@ class ChromaManager:
         """동기 I/O를 안전하게 오프로딩"""
         return await asyncio.to_thread(fn, *args, **kwargs)
 
+    async def _invalidate_search(self, collection_name: str) -> None:
+        """컬렉션 변경 후 검색 결과 캐시 무효화 (버전 증가)"""
+        if self.search_cache:
+            await self.search_cache.bump(collection_name)
+
 
     def is_initialized(self) -> bool:
         return self._initialized and self.client is not None
@@ -50,10 +128,25 @@ class ChromaManager:
 
             logger.info("임베딩 설정 중...")
             
-            self.embeddings = OpenAIEmbeddings(
+            embeddings = OpenAIEmbeddings(
                 openai_api_key=openai_api_key,
-                model="text-embedding-3-large",
+                model=EMBEDDING_MODEL,
             )
+            
+            # 모든 컬렉션이 공유하는 임베딩 캐시 (재인덱싱/반복 질의 시 API 호출 생략)
+            if settings.EMBEDDING_CACHE_ENABLED:
+                self.embedding_cache = await self._to_thread(
+                    EmbeddingCache,
+                    settings.EMBEDDING_CACHE_PATH,
+                    EMBEDDING_MODEL,
+                    l1_max_size=settings.EMBEDDING_CACHE_L1_MAX_SIZE,
+                    dtype=settings.EMBEDDING_CACHE_DTYPE,
+                    max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                    max_age=settings.EMBEDDING_CACHE_MAX_AGE,
+                )
+                embeddings = CachedEmbeddings(embeddings, self.embedding_cache)
+                logger.info(f"임베딩 캐시 사용: {settings.EMBEDDING_CACHE_PATH}")
+            self.embeddings = embeddings
 
             Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
             logger.info(f"ChromaDB 디렉토리 생성/확인 완료: {self.persist_directory}")
@@ -93,7 +186,7 @@ class ChromaManager:
             logger.warning("ChromaDB not initialized")
             return False
 
-        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=60) as acquired:
+        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=15, watchdog=True) as acquired:
             if not acquired:
                 logger.warning(f"Failed to acquire lock for deleting collection '{collection_name}'")
                 return False
@@ -101,6 +194,7 @@ class ChromaManager:
             try:
                 self.collections.pop(collection_name, None)
                 await self._to_thread(self.client.delete_collection, collection_name)
+                await self._invalidate_search(collection_name)
                 logger.info(f"Collection '{collection_name}' 삭제 완료")
                 return True
             except Exception as e:
@@ -108,8 +202,12 @@ class ChromaManager:
                 return False
 
 
-    async def get_or_create_collection(self, collection_name: str) -> Optional[Chroma]:
-        """컬렉션 로드 또는 생성"""
+    async def get_or_create_collection(
+        self,
+        collection_name: str,
+        collection_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Chroma]:
+        """컬렉션 로드 또는 생성 (collection_metadata 는 생성 시에만 적용, 예: {"hnsw:space": "cosine"})"""
         if not self.is_initialized():
             logger.warning("ChromaDB not initialized")
             return None
@@ -117,7 +215,7 @@ class ChromaManager:
         if collection_name in self.collections:
             return self.collections[collection_name]
 
-        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=60, timeout=10) as acquired:
+        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=15, timeout=10, watchdog=True) as acquired:
             if not acquired:
                 logger.warning(f"Failed to acquire lock for collection '{collection_name}'")
                 return None
@@ -132,6 +230,7 @@ class ChromaManager:
                         persist_directory=self.persist_directory,
                         collection_name=collection_name,
                         client=self.client,
+                        collection_metadata=collection_metadata,
                     )
 
                 vector_store = await self._to_thread(_build)
@@ -168,6 +267,7 @@ class ChromaManager:
         try:
             document = Document(page_content=content, metadata=metadata)
             await vector_store.aadd_documents(documents=[document], ids=[document_id])
+            await self._invalidate_search(collection_name)
             logger.info(f"Added document {document_id} to collection '{collection_name}'")
             return True
         except Exception as e:
@@ -175,6 +275,158 @@ class ChromaManager:
             return False
 
 
+    async def add_documents(
+        self,
+        documents: Union[Iterable[Document], AsyncIterable[Document]],
+        collection_name: str,
+        skip_existing: bool = True,
+        progress: Optional[Callable[[IngestProgress], Any]] = None,
+    ) -> IngestProgress:
+        """
+        문서 대량 추가
+
+        문서(Document.id 필수, 없으면 failed 로 집계) 스트림을 쓰기 배치로 나눠 배치마다 토큰 예산 기준으로 임베딩 요청을 묶고,
+        최대 CHROMA_INGEST_CONCURRENCY 개 요청을 동시에 실행한 뒤 컬렉션에 한 번에 기록합니다.
+        기록은 다음 배치의 임베딩과 겹쳐서 진행됩니다.
+
+        Args:
+            documents: 문서 iterable 또는 async iterable
+            collection_name: 컬렉션 이름
+            skip_existing: 이미 컬렉션에 있는 id 는 건너뜀 (중단 후 같은 입력으로 재실행하면 이어서 적재)
+            progress: 쓰기 배치마다 호출되는 진행 상황 콜백
+        """
+        return await self._ingest(documents, collection_name, upsert=False, skip_existing=skip_existing, progress=progress)
+
+    async def upsert_documents(
+        self,
+        documents: Union[Iterable[Document], AsyncIterable[Document]],
+        collection_name: str,
+        progress: Optional[Callable[[IngestProgress], Any]] = None,
+    ) -> IngestProgress:
+        """문서 대량 추가/갱신 (같은 id 는 덮어씀, 나머지 동작은 add_documents 와 동일)"""
+        return await self._ingest(documents, collection_name, upsert=True, skip_existing=False, progress=progress)
+
+    async def _ingest(
+        self,
+        documents: Union[Iterable[Document], AsyncIterable[Document]],
+        collection_name: str,
+        upsert: bool,
+        skip_existing: bool,
+        progress: Optional[Callable[[IngestProgress], Any]],
+    ) -> IngestProgress:
+        result = IngestProgress()
+        vector_store = await self.get_or_create_collection(collection_name)
+        if not vector_store:
+            logger.warning(f"Collection '{collection_name}' not found")
+            return result
+
+        collection = vector_store._collection
+        semaphore = asyncio.Semaphore(settings.CHROMA_INGEST_CONCURRENCY)
+        pending_write: Optional[asyncio.Task] = None
+        last_id: Optional[str] = None
+
+        async def embed(texts: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(texts)
+
+        async def write(batch: List[Document], vectors: List[List[float]], last_id: Optional[str]) -> None:
+            try:
+                await self._to_thread(self._write_batch, collection, batch, vectors, upsert)
+                result.written += len(batch)
+                if batch:
+                    await self._invalidate_search(collection_name)
+            except Exception as e:
+                result.failed += len(batch)
+                logger.bind(collection=collection_name, size=len(batch), error=str(e)).error("문서 배치 기록 실패")
+            result.last_id = last_id
+            if progress:
+                progress(result)
+
+        try:
+            async for batch in _iter_batches(documents, settings.CHROMA_INGEST_WRITE_BATCH_SIZE):
+                result.received += len(batch)
+                # 이전 배치는 이미 기록되었으므로 중단하지 않고 id 없는 문서만 실패로 집계
+                valid = [document for document in batch if document.id is not None]
+                if len(valid) < len(batch):
+                    result.failed += len(batch) - len(valid)
+                    logger.bind(collection=collection_name, size=len(batch) - len(valid)).error("id 없는 문서 제외")
+                    batch = valid
+                if batch:
+                    last_id = batch[-1].id
+
+                if skip_existing and batch:
+                    existing = set((await self._to_thread(collection.get, ids=[d.id for d in batch], include=[]))["ids"])
+                    result.skipped += len(existing)
+                    batch = [document for document in batch if document.id not in existing]
+
+                # 토큰 예산/요청당 문서 수 기준으로 임베딩 요청 분할 후 동시 실행
+                chunks = self._split_for_embedding(batch)
+                embedded = await asyncio.gather(
+                    *(embed([d.page_content for d in chunk]) for chunk in chunks),
+                    return_exceptions=True,
+                )
+
+                ready: List[Document] = []
+                vectors: List[List[float]] = []
+                for chunk, chunk_vectors in zip(chunks, embedded):
+                    if isinstance(chunk_vectors, BaseException):
+                        result.failed += len(chunk)
+                        logger.bind(collection=collection_name, size=len(chunk), error=str(chunk_vectors)).error("문서 임베딩 실패")
+                        continue
+                    ready += chunk
+                    vectors += chunk_vectors
+
+                # 이전 배치 기록이 끝난 뒤 이번 배치 기록 시작 (기록 중에 다음 배치 임베딩 진행)
+                if pending_write:
+                    await pending_write
+                pending_write = asyncio.create_task(write(ready, vectors, last_id))
+        finally:
+            if pending_write:
+                await pending_write
+
+        logger.bind(collection=collection_name, **result.__dict__).info("문서 대량 적재 완료")
+        return result
+
+    @staticmethod
+    def _split_for_embedding(batch: List[Document]) -> List[List[Document]]:
+        chunks: List[List[Document]] = []
+        current: List[Document] = []
+        tokens = 0
+        for document in batch:
+            document_tokens = estimate_tokens(document.page_content)
+            if current and (
+                tokens + document_tokens > settings.CHROMA_INGEST_EMBED_BATCH_TOKENS
+                or len(current) >= settings.CHROMA_INGEST_EMBED_BATCH_SIZE
+            ):
+                chunks.append(current)
+                current, tokens = [], 0
+            current.append(document)
+            tokens += document_tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _write_batch(collection, batch: List[Document], vectors: List[List[float]], upsert: bool) -> None:
+        """미리 계산한 임베딩으로 컬렉션에 기록 (Chroma 는 빈 metadata 를 허용하지 않아 따로 기록)"""
+        write = collection.upsert if upsert else collection.add
+        with_metadata = [i for i, document in enumerate(batch) if document.metadata]
+        without_metadata = [i for i, document in enumerate(batch) if not document.metadata]
+
+        if with_metadata:
+            write(
+                ids=[batch[i].id for i in with_metadata],
+                embeddings=[vectors[i] for i in with_metadata],
+                documents=[batch[i].page_content for i in with_metadata],
+                metadatas=[batch[i].metadata for i in with_metadata],
+            )
+        if without_metadata:
+            write(
+                ids=[batch[i].id for i in without_metadata],
+                embeddings=[vectors[i] for i in without_metadata],
+                documents=[batch[i].page_content for i in without_metadata],
+            )
+
     async def delete_document(self, document_id: str, collection_name: str) -> bool:
         """문서 삭제"""
         vector_store = await self.get_or_create_collection(collection_name)
@@ -184,6 +436,7 @@ class ChromaManager:
 
         try:
             await vector_store.adelete(ids=[document_id])
+            await self._invalidate_search(collection_name)
             logger.info(f"Deleted document {document_id} from collection '{collection_name}'")
             return True
         except Exception as e:
@@ -198,13 +451,87 @@ class ChromaManager:
         metadata: Dict[str, Any],
         collection_name: str,
     ) -> bool:
-        """문서 업데이트"""
+        """문서 업데이트 (upsert, 내용이 같으면 metadata 만 갱신)"""
+        document = Document(id=document_id, page_content=content, metadata=metadata)
+        return await self.update_documents([document], collection_name) is not None
+
+    async def update_documents(
+        self,
+        documents: List[Document],
+        collection_name: str,
+    ) -> Optional[Dict[str, int]]:
+        """
+        문서 일괄 업데이트 (없으면 추가)
+
+        삭제 후 추가하지 않고 컬렉션 upsert 로 한 번에 기록하므로 갱신 중에도 검색에서 문서가 빠지지 않습니다.
+        저장된 본문과 내용이 같은 문서는 임베딩 없이 metadata 만 갱신합니다.
+
+        Returns:
+            {"embedded": 본문 변경/신규 문서 수, "metadata_only": metadata 만 갱신한 문서 수}, 실패 시 None
+        """
+        vector_store = await self.get_or_create_collection(collection_name)
+        if not vector_store:
+            logger.warning(f"Collection '{collection_name}' not found")
+            return None
+
+        collection = vector_store._collection
+        result = {"embedded": 0, "metadata_only": 0}
+        size = settings.CHROMA_INGEST_WRITE_BATCH_SIZE
         try:
-            await self.delete_document(document_id, collection_name)
-            return await self.add_document(document_id, content, metadata, collection_name)
+            # 일부 배치만 기록되지 않도록 기록 전에 전체 검사
+            if any(document.id is None for document in documents):
+                raise ValueError("Every document must have an id")
+
+            for start in range(0, len(documents), size):
+                batch = documents[start:start + size]
+                stored = await self._to_thread(
+                    collection.get, ids=[d.id for d in batch], include=["documents", "metadatas"]
+                )
+                stored_by_id = {
+                    id_: (content, metadata or {})
+                    for id_, content, metadata in zip(stored["ids"], stored["documents"], stored["metadatas"])
+                }
+
+                changed: List[Document] = []
+                unchanged: List[Document] = []
+                for document in batch:
+                    previous = stored_by_id.get(document.id)
+                    # Chroma upsert/update 는 metadata 를 병합하므로 빠진 키는 None 으로 지정해 삭제
+                    metadata = dict(document.metadata)
+                    if previous:
+                        metadata.update({key: None for key in previous[1] if key not in metadata})
+                    document = Document(id=document.id, page_content=document.page_content, metadata=metadata)
+                    if previous and previous[0] == document.page_content:
+                        unchanged.append(document)
+                    else:
+                        changed.append(document)
+
+                if changed:
+                    vectors: List[List[float]] = []
+                    for chunk in self._split_for_embedding(changed):
+                        vectors += await self.embeddings.aembed_documents([d.page_content for d in chunk])
+                    await self._to_thread(self._write_batch, collection, changed, vectors, True)
+                    result["embedded"] += len(changed)
+
+                # metadata 가 비어 있으면(이전/이후 모두) 갱신할 내용 없음
+                unchanged = [document for document in unchanged if document.metadata]
+                if unchanged:
+                    await self._to_thread(
+                        collection.update,
+                        ids=[d.id for d in unchanged],
+                        metadatas=[d.metadata for d in unchanged],
+                    )
+                    result["metadata_only"] += len(unchanged)
+
+            if result["embedded"] or result["metadata_only"]:
+                await self._invalidate_search(collection_name)
+            self.upsert_embedded += result["embedded"]
+            self.upsert_metadata_only += result["metadata_only"]
+            logger.bind(collection=collection_name, **result).info("문서 업데이트 완료")
+            return result
         except Exception as e:
             logger.error(f"Failed to update document in ChromaDB: {e}")
-            return False
+            return None
 
     # ---------- 검색 ----------
 
@@ -234,7 +561,13 @@ class ChromaManager:
         collection_name: str,
         filter: Optional[Dict[str, Any]] = None,
     ) -> List[Document]:
-        """유사도 검색"""
+        """유사도 검색 (검색 결과 캐시 사용 시 같은 질의는 캐시에서 응답)"""
+        cache_key = None
+        if self.search_cache:
+            cache_key, cached = await self.search_cache.get(collection_name, query, k, filter)
+            if cached is not None:
+                return [Document(**item) for item in cached]
+
         vector_store = await self.get_or_create_collection(collection_name)
         if not vector_store:
             logger.warning(f"Collection '{collection_name}' not found")
@@ -245,6 +578,11 @@ class ChromaManager:
                 results = await vector_store.asimilarity_search(query=query, k=k, filter=filter)
             else:
                 results = await vector_store.asimilarity_search(query=query, k=k)
+            if cache_key:
+                await self.search_cache.set(
+                    cache_key,
+                    [{"id": d.id, "page_content": d.page_content, "metadata": d.metadata} for d in results],
+                )
             return results
         except Exception as e:
             logger.error(f"Failed to search in ChromaDB: {e}")
@@ -262,6 +600,23 @@ class ChromaManager:
         except Exception:
             return 0
 
+    def get_stats(self) -> Dict[str, int]:
+        """매니저 상태 (메트릭용, I/O 없음)"""
+        return {
+            "initialized": int(self.is_initialized()),
+            "loaded_collections": len(self.collections),
+            "upsert_embedded": self.upsert_embedded,
+            "upsert_metadata_only": self.upsert_metadata_only,
+        }
+
+    def get_embedding_cache_stats(self) -> Dict[str, int]:
+        """임베딩 캐시 통계 (캐시 미사용 시 빈 dict)"""
+        return self.embedding_cache.get_stats() if self.embedding_cache else {}
+
+    def get_search_cache_stats(self) -> Dict[str, int]:
+        """검색 결과 캐시 통계 (캐시 미사용 시 빈 dict)"""
+        return self.search_cache.get_stats() if self.search_cache else {}
+
     async def get_all_document_counts(self) -> Dict[str, int]:
         """모든 컬렉션의 문서 수"""
         counts: Dict[str, int] = {}
@@ -0,0 +1,101 @@
+from enum import Enum
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict
+
+from app.core.logger import get_logger
+from app.core.redis import RedisClient, get_redis_client
+
+logger = get_logger("redis.counter")
+
+
+class CountMode(str, Enum):
+    """목록 조회 시 전체 수 계산 방식"""
+    EXACT = "exact"          # 정확한 수 (Redis 캐시, miss 시 COUNT)
+    ESTIMATED = "estimated"  # 통계 기반 근사치 (PostgreSQL pg_class.reltuples)
+    NONE = "none"            # 계산하지 않음
+
+
+class CachedCounter:
+    """Redis 에 캐시하는 정확한 행 수
+
+    - 캐시가 없으면 loader(COUNT 쿼리)로 채우고 TTL 동안 재사용
+    - 생성/삭제 시 incr()로 캐시된 값만 증감 (캐시가 없으면 다음 조회 때 다시 COUNT)
+    - loader 실행 중 발생한 증감은 반영되지 않을 수 있으며, 오차는 TTL 만료 시 해소
+    """
+
+    # 키가 있을 때만 증감 (INCRBY 는 TTL 을 유지)
+    INCR_SCRIPT = """
+    if redis.call('exists', KEYS[1]) == 1 then
+        return redis.call('incrby', KEYS[1], ARGV[1])
+    end
+    return nil
+    """
+
+    def __init__(self, name: str, ttl: int = RedisClient.SHORT_CACHE_TTL):
+        self.name = name
+        self.ttl = ttl
+
+        # 카운터
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _get_key(self) -> str:
+        return f"count:{self.name}"
+
+    async def get(self, loader: Callable[[], Awaitable[int]]) -> int:
+        """캐시된 수 반환, 없으면 loader 결과를 캐시"""
+        try:
+            client = await get_redis_client()
+            cached = await client.get(self._get_key())
+        except Exception as e:
+            self.errors += 1
+            logger.bind(counter=self.name, error=str(e)).warning("카운트 캐시 조회 실패")
+            return await loader()
+
+        if cached is not None:
+            self.hits += 1
+            return int(cached)
+
+        self.misses += 1
+        value = await loader()
+        try:
+            # 그 사이 다른 요청이 채운 값(증감 반영분)을 덮어쓰지 않음
+            await client.set(self._get_key(), value, ex=self.ttl, nx=True)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(counter=self.name, error=str(e)).warning("카운트 캐시 저장 실패")
+        return value
+
+    async def incr(self, delta: int = 1) -> None:
+        """캐시된 수 증감 (실패 시 캐시를 지워 다음 조회 때 다시 계산)"""
+        try:
+            client = await get_redis_client()
+            await client.eval(self.INCR_SCRIPT, 1, self._get_key(), delta)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(counter=self.name, delta=delta, error=str(e)).warning("카운트 캐시 증감 실패")
+            await self.invalidate()
+
+    async def invalidate(self) -> None:
+        """캐시된 수 삭제"""
+        try:
+            client = await get_redis_client()
+            await client.delete(self._get_key())
+        except Exception as e:
+            self.errors += 1
+            logger.bind(counter=self.name, error=str(e)).warning("카운트 캐시 삭제 실패")
+
+    def get_stats(self) -> Dict[str, int]:
+        """카운터 캐시 통계 반환"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_user_counter() -> CachedCounter:
+    """사용자 수 카운터 싱글톤 인스턴스를 반환합니다."""
+    return CachedCounter("user")
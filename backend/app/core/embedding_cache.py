@@ -0,0 +1,273 @@
+"""
+임베딩 캐시 (content-addressed)
+
+키는 sha256(모델 이름 + 정규화한 텍스트) 이므로 같은 내용을 다시 인덱싱하거나 같은 질의를 반복해도
+임베딩 API 를 다시 호출하지 않습니다.
+- L1: 프로세스 메모리 LRU (float32 array 로 보관)
+- L2: 로컬 SQLite 파일 (float16/float32 바이트로 압축 저장, 워커 간 공유, 재시작 후에도 유지)
+- L2 크기 제한: prune() 이 마지막 사용 후 max_age 초가 지난 항목과 max_entries 를 넘는 오래된 항목을 삭제
+  (마지막 사용 시각은 L2 저장/조회 시 갱신되며, L1 hit 은 갱신하지 않음)
+
+벡터 스토어는 동기 경로(스레드)와 비동기 경로에서 모두 임베딩을 호출하므로 L2 는 동기 I/O 로 구현하고,
+비동기 경로에서는 스레드로 오프로딩합니다.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import struct
+import threading
+import time
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Sequence
+
+from app.core.local_cache import MISSING, LocalTTLCache
+from app.core.logger import get_logger
+
+logger = get_logger("embedding.cache")
+
+# struct 포맷 문자 (float16 은 3072차원 기준 벡터당 6KB)
+VECTOR_DTYPES = {"float16": "e", "float32": "f"}
+
+# SQLite 바인드 파라미터 수 제한 아래로 나눠 조회
+_LOOKUP_CHUNK = 500
+
+# PRAGMA auto_vacuum 값
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 공백 정리)"""
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+class EmbeddingCache:
+    """L1(메모리 LRU) + L2(SQLite) 임베딩 캐시
+
+    - max_entries 가 0 이면 개수 기준 정리 비활성화
+    - max_age 가 0 이면 기간 기준 정리 비활성화
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: str,
+        l1_max_size: int = 2048,
+        dtype: str = "float16",
+        max_entries: int = 0,
+        max_age: int = 0,
+    ):
+        if dtype not in VECTOR_DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        self.path = path
+        self.model = model
+        self.dtype = dtype
+        self.max_entries = max_entries
+        self.max_age = max_age
+        # 정리 기준이 없으면 조회 시 마지막 사용 시각을 기록하지 않음
+        self._track_usage = bool(max_entries or max_age)
+        self._l1 = LocalTTLCache(max_size=l1_max_size, ttl=float("inf"))
+        self._l1_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        with self._db_lock:
+            # 새 파일이면 journal_mode 변경/테이블 생성 전에 설정해야 적용됨
+            self._db.execute(f"PRAGMA auto_vacuum={_AUTO_VACUUM_INCREMENTAL}")
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embedding ("
+                "key TEXT PRIMARY KEY, dtype TEXT NOT NULL, vector BLOB NOT NULL, "
+                "last_used REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(embedding)")}
+            if "last_used" not in columns:
+                # 이전 버전 파일: 기존 항목은 지금부터 기간 제한 적용
+                self._db.execute("ALTER TABLE embedding ADD COLUMN last_used REAL NOT NULL DEFAULT 0")
+                self._db.execute("UPDATE embedding SET last_used = ?", (time.time(),))
+            self._db.execute("CREATE INDEX IF NOT EXISTS embedding_last_used ON embedding (last_used)")
+            self._db.commit()
+
+            # 기존 파일은 VACUUM 1회로 auto_vacuum 모드 변경
+            (auto_vacuum,) = self._db.execute("PRAGMA auto_vacuum").fetchone()
+            if auto_vacuum != _AUTO_VACUUM_INCREMENTAL:
+                logger.bind(path=path).info("임베딩 캐시 auto_vacuum 변경 (VACUUM 1회 실행)")
+                self._db.execute("VACUUM")
+
+        # 카운터
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.embed_calls = 0
+        self.pruned = 0
+        self.errors = 0
+
+    # ---------- 키/직렬화 ----------
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\0{normalize_text(text)}".encode()).hexdigest()
+
+    @staticmethod
+    def _pack(vector: Sequence[float], dtype: str) -> bytes:
+        return struct.pack(f"<{len(vector)}{VECTOR_DTYPES[dtype]}", *vector)
+
+    @staticmethod
+    def _unpack(blob: bytes, dtype: str) -> array:
+        code = VECTOR_DTYPES[dtype]
+        return array("f", struct.unpack(f"<{len(blob) // struct.calcsize(code)}{code}", blob))
+
+    # ---------- 조회/저장 ----------
+
+    def _lookup(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._l1_lock:
+            for key in keys:
+                value = self._l1.get(key)
+                if value is not MISSING:
+                    found[key] = value.tolist()
+                    self.l1_hits += 1
+
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if not missing:
+            return found
+
+        try:
+            rows = []
+            with self._db_lock:
+                for start in range(0, len(missing), _LOOKUP_CHUNK):
+                    chunk = missing[start:start + _LOOKUP_CHUNK]
+                    rows += self._db.execute(
+                        f"SELECT key, dtype, vector FROM embedding WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                if rows and self._track_usage:
+                    now = time.time()
+                    self._db.executemany(
+                        "UPDATE embedding SET last_used = ? WHERE key = ?",
+                        [(now, row[0]) for row in rows],
+                    )
+                    self._db.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.bind(path=self.path, error=str(e)).warning("임베딩 캐시 조회 실패")
+            return found
+
+        with self._l1_lock:
+            for key, dtype, blob in rows:
+                vector = self._unpack(blob, dtype)
+                self._l1.set(key, vector)
+                found[key] = vector.tolist()
+                self.l2_hits += 1
+        return found
+
+    def _store(self, vectors: Dict[str, List[float]]) -> None:
+        with self._l1_lock:
+            for key, vector in vectors.items():
+                self._l1.set(key, array("f", vector))
+        try:
+            with self._db_lock:
+                now = time.time()
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embedding (key, dtype, vector, last_used) VALUES (?, ?, ?, ?)",
+                    [(key, self.dtype, self._pack(vector, self.dtype), now) for key, vector in vectors.items()],
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.bind(path=self.path, error=str(e)).warning("임베딩 캐시 저장 실패")
+
+    def _pending(self, keys: Sequence[str], texts: Sequence[str], found: Dict[str, List[float]]) -> Dict[str, str]:
+        # 캐시에 없는 키 → 텍스트 (같은 배치 안의 중복 제거)
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in pending:
+                pending[key] = text
+        self.misses += len(pending)
+        return pending
+
+    def get_or_embed(
+        self,
+        texts: Sequence[str],
+        embed: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """캐시된 벡터를 반환하고, 없는 텍스트만 embed 로 한 번에 계산해 저장"""
+        keys = [self.key(text) for text in texts]
+        found = self._lookup(keys)
+        pending = self._pending(keys, texts, found)
+        if pending:
+            self.embed_calls += 1
+            computed = dict(zip(pending, embed(list(pending.values()))))
+            self._store(computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    async def aget_or_embed(
+        self,
+        texts: Sequence[str],
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
+        """get_or_embed 의 비동기 버전 (SQLite I/O 는 스레드로 오프로딩)"""
+        keys = [self.key(text) for text in texts]
+        found = await asyncio.to_thread(self._lookup, keys)
+        pending = self._pending(keys, texts, found)
+        if pending:
+            self.embed_calls += 1
+            computed = dict(zip(pending, await embed(list(pending.values()))))
+            await asyncio.to_thread(self._store, computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    # ---------- 정리 ----------
+
+    def prune(self) -> int:
+        """오래된 L2 항목 삭제 후 빈 페이지 반환, 삭제 수 반환"""
+        if not self._track_usage:
+            return 0
+        deleted = 0
+        try:
+            with self._db_lock:
+                if self.max_age > 0:
+                    deleted += self._db.execute(
+                        "DELETE FROM embedding WHERE last_used < ?",
+                        (time.time() - self.max_age,),
+                    ).rowcount
+                if self.max_entries > 0:
+                    deleted += self._db.execute(
+                        "DELETE FROM embedding WHERE key IN ("
+                        "SELECT key FROM embedding ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,),
+                    ).rowcount
+                self._db.commit()
+                # execute() 는 빈 페이지를 1개만 반환하므로 executescript 로 끝까지 실행
+                self._db.executescript("PRAGMA incremental_vacuum; PRAGMA wal_checkpoint(TRUNCATE);")
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.bind(path=self.path, error=str(e)).warning("임베딩 캐시 정리 실패")
+            return deleted
+        self.pruned += deleted
+        logger.bind(path=self.path, pruned=deleted).info("임베딩 캐시 정리 완료")
+        return deleted
+
+    async def aprune(self) -> int:
+        """prune 의 비동기 버전 (스케줄러 작업)"""
+        return await asyncio.to_thread(self.prune)
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._db.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """임베딩 캐시 통계 반환"""
+        return {
+            "l1_size": len(self._l1),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "embed_calls": self.embed_calls,
+            "evictions": self._l1.evictions,
+            "pruned": self.pruned,
+            "errors": self.errors,
+        }
@@ -0,0 +1,212 @@
+"""
+LangGraph SQLite 체크포인트 유지보수
+
+AsyncSqliteSaver 는 노드 실행마다 전체 상태를 checkpoints 테이블에 새 행으로 기록하고 지우지 않으므로
+파일이 계속 커지고 조회가 느려집니다. CheckpointMaintainer 는 saver 의 연결을 공유해 다음을 수행합니다.
+- 연결 설정: WAL, synchronous=NORMAL, mmap, incremental auto_vacuum
+- 스레드(세션)별 최근 keep_last 개 체크포인트만 유지하고 나머지와 해당 writes 삭제
+- 마지막 실행 후 thread_ttl 초가 지난 스레드 전체 삭제 (활동 시각은 checkpoint_thread_activity 테이블에 기록)
+- 삭제로 생긴 빈 페이지를 incremental_vacuum 으로 반환
+
+saver 의 쓰기와 섞이지 않도록 모든 쓰기는 saver.lock 안에서 실행합니다.
+"""
+import time
+from typing import Any, Dict
+
+from app.core.lock import get_redis_lock
+from app.core.logger import get_logger
+
+logger = get_logger("graph.checkpoint")
+
+# PRAGMA auto_vacuum 값
+_AUTO_VACUUM_INCREMENTAL = 2
+
+_PRUNE_CHECKPOINTS_SQL = """
+DELETE FROM checkpoints WHERE rowid IN (
+    SELECT rowid FROM (
+        SELECT rowid, ROW_NUMBER() OVER (
+            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS rn
+        FROM checkpoints
+    ) WHERE rn > ?
+)
+"""
+
+# 체크포인트가 삭제된 writes 정리
+_PRUNE_WRITES_SQL = """
+DELETE FROM writes WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = writes.thread_id
+      AND c.checkpoint_ns = writes.checkpoint_ns
+      AND c.checkpoint_id = writes.checkpoint_id
+)
+"""
+
+
+class CheckpointMaintainer:
+    """AsyncSqliteSaver 체크포인트 보존/정리
+
+    - keep_last 가 0 이면 개수 기준 정리 비활성화
+    - thread_ttl 이 0 이면 만료 삭제 비활성화
+    - vacuum_pages 가 0 이면 incremental_vacuum 시 빈 페이지 전체 반환
+    """
+
+    def __init__(
+        self,
+        saver: Any,
+        name: str,
+        keep_last: int = 5,
+        thread_ttl: int = 0,
+        vacuum_pages: int = 0,
+        mmap_size: int = 0,
+    ):
+        self.saver = saver
+        self.name = name
+        self.keep_last = keep_last
+        self.thread_ttl = thread_ttl
+        self.vacuum_pages = vacuum_pages
+        self.mmap_size = mmap_size
+
+        # 카운터
+        self.runs = 0
+        self.pruned_checkpoints = 0
+        self.pruned_writes = 0
+        self.expired_threads = 0
+        self.deleted_threads = 0
+        self.errors = 0
+
+    @property
+    def conn(self):
+        return self.saver.conn
+
+    # ---------- 설정 ----------
+
+    async def configure(self) -> None:
+        """연결 PRAGMA 설정 후 체크포인트/활동 테이블 생성 (saver 사용 전 1회 호출)"""
+        # 새 파일이면 journal_mode 변경/테이블 생성 전에 설정해야 적용됨
+        await self.conn.execute(f"PRAGMA auto_vacuum={_AUTO_VACUUM_INCREMENTAL}")
+        await self.conn.execute("PRAGMA journal_mode=WAL")
+        await self.conn.execute("PRAGMA synchronous=NORMAL")
+        await self.conn.execute("PRAGMA busy_timeout=5000")
+        if self.mmap_size:
+            await self.conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+
+        await self.saver.setup()
+        await self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoint_thread_activity ("
+            "thread_id TEXT PRIMARY KEY, updated_at REAL NOT NULL)"
+        )
+        await self.conn.commit()
+
+        # 기존 파일은 VACUUM 1회로 auto_vacuum 모드 변경
+        async with self.conn.execute("PRAGMA auto_vacuum") as cursor:
+            (auto_vacuum,) = await cursor.fetchone()
+        if auto_vacuum != _AUTO_VACUUM_INCREMENTAL:
+            logger.bind(name=self.name).info("체크포인트 DB auto_vacuum 변경 (VACUUM 1회 실행)")
+            async with self.saver.lock:
+                await self.conn.execute("VACUUM")
+
+    # ---------- 스레드 ----------
+
+    async def touch(self, thread_id: str) -> None:
+        """스레드 마지막 실행 시각 기록 (그래프 실행마다 호출)"""
+        async with self.saver.lock:
+            await self.conn.execute(
+                "INSERT INTO checkpoint_thread_activity (thread_id, updated_at) VALUES (?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET updated_at = excluded.updated_at",
+                (thread_id, time.time()),
+            )
+            await self.conn.commit()
+
+    async def delete_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트/writes/활동 기록 전체 삭제"""
+        async with self.saver.lock:
+            for table in ("checkpoints", "writes", "checkpoint_thread_activity"):
+                await self.conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            await self.conn.commit()
+        self.deleted_threads += 1
+
+    # ---------- 정리 ----------
+
+    async def prune(self) -> int:
+        """스레드별 최근 keep_last 개를 제외한 체크포인트 삭제 후 삭제 수 반환"""
+        if self.keep_last <= 0:
+            return 0
+        async with self.saver.lock:
+            cursor = await self.conn.execute(_PRUNE_CHECKPOINTS_SQL, (self.keep_last,))
+            deleted = cursor.rowcount
+            cursor = await self.conn.execute(_PRUNE_WRITES_SQL)
+            self.pruned_writes += cursor.rowcount
+            await self.conn.commit()
+        self.pruned_checkpoints += deleted
+        return deleted
+
+    async def expire(self) -> int:
+        """thread_ttl 동안 실행되지 않은 스레드 삭제 후 삭제 수 반환"""
+        if self.thread_ttl <= 0:
+            return 0
+        now = time.time()
+        async with self.saver.lock:
+            # 활동 기록이 없는 기존 스레드는 지금부터 TTL 적용
+            await self.conn.execute(
+                "INSERT OR IGNORE INTO checkpoint_thread_activity (thread_id, updated_at) "
+                "SELECT DISTINCT thread_id, ? FROM checkpoints",
+                (now,),
+            )
+            async with self.conn.execute(
+                "SELECT thread_id FROM checkpoint_thread_activity WHERE updated_at < ?",
+                (now - self.thread_ttl,),
+            ) as cursor:
+                expired = [row[0] for row in await cursor.fetchall()]
+            for table in ("checkpoints", "writes", "checkpoint_thread_activity"):
+                await self.conn.executemany(
+                    f"DELETE FROM {table} WHERE thread_id = ?",
+                    [(thread_id,) for thread_id in expired],
+                )
+            await self.conn.commit()
+        self.expired_threads += len(expired)
+        return len(expired)
+
+    async def vacuum(self) -> None:
+        """빈 페이지 반환 및 WAL 파일 정리"""
+        async with self.saver.lock:
+            await self.conn.commit()
+            # execute() 는 incremental_vacuum 결과 행을 1개만 읽어 페이지를 1개만 반환하므로 executescript 로 끝까지 실행
+            await self.conn.executescript(
+                f"PRAGMA incremental_vacuum({int(self.vacuum_pages)}); PRAGMA wal_checkpoint(TRUNCATE);"
+            )
+
+    async def run(self) -> None:
+        """정리 작업 1회 실행 (스케줄러 작업, 워커 간에는 분산 락으로 1곳에서만 실행)"""
+        async with get_redis_lock().lock(f"graph:checkpoint:{self.name}", ttl=60, watchdog=True) as acquired:
+            if not acquired:
+                return
+            start = time.perf_counter()
+            try:
+                expired = await self.expire()
+                pruned = await self.prune()
+                await self.vacuum()
+            except Exception as e:
+                self.errors += 1
+                logger.bind(name=self.name, error=str(e)).error("체크포인트 정리 실패")
+                return
+            self.runs += 1
+            logger.bind(
+                name=self.name,
+                expired_threads=expired,
+                pruned_checkpoints=pruned,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+            ).info("체크포인트 정리 완료")
+
+    # ---------- 통계 ----------
+
+    def get_stats(self) -> Dict[str, int]:
+        """정리 카운터 반환"""
+        return {
+            "runs": self.runs,
+            "pruned_checkpoints": self.pruned_checkpoints,
+            "pruned_writes": self.pruned_writes,
+            "expired_threads": self.expired_threads,
+            "deleted_threads": self.deleted_threads,
+            "errors": self.errors,
+        }
@@ -28,9 +28,23 @@ class ChainManager:
         return self._chains['example_response']
     
     
+    def build_history_summary_chain(self) -> Any:
+        """히스토리 요약 체인을 생성합니다."""
+        if 'history_summary' not in self._chains:
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", self._prompt_manager.get_prompt('history_summary')),
+                ("human", "[대화]\n{history}\n"),
+            ])
+            model = self._llm_manager.get_model(ModelName.GPT_4O_MINI)
+            self._chains['history_summary'] = prompt | model | StrOutputParser()
+        
+        return self._chains['history_summary']
+    
+    
     def build_all_chains(self) -> None:
         """모든 체인을 생성합니다."""
         self.build_example_response_chain()
+        self.build_history_summary_chain()
     
     
     def get_chain(self, chain_name: str) -> Optional[Any]:
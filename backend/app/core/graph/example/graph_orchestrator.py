@@ -1,7 +1,10 @@
-from typing import Optional, Any, Dict, Tuple
-from langchain_core.messages import AIMessage, HumanMessage
+from typing import Optional, Any, AsyncIterator, Dict, List, Tuple
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage, RemoveMessage, trim_messages
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from sqlalchemy.ext.asyncio import AsyncEngine
 from langchain_community.callbacks import get_openai_callback
 import aiosqlite
 import time
@@ -11,7 +14,13 @@ from functools import lru_cache
 from app.core.graph.example.graph_state import GraphState
 from app.core.graph.example.prompt_manager import PromptManager
 from app.core.graph.example.chain_builder import ChainManager
+from app.config.setting import settings
 from app.core.chroma_manager import get_chroma_manager
+from app.core.graph.checkpoint import CheckpointMaintainer
+from app.core.graph.response_cache import SemanticResponseCache
+from app.core.graph.savers import PostgresCheckpointSaver, RedisCheckpointSaver
+from app.core.llm_manager import ModelName, get_llm_manager
+from app.core.metrics import LLM_TIME_TO_FIRST_TOKEN_SECONDS
 from app.util.agent_assistant import format_docs, format_retriever
 
 
@@ -28,18 +37,54 @@ class GraphOrchestrator:
         self._chain_manager = chain_manager
         self.chromadb_manager = get_chroma_manager()
         self._db_path = db_path
-        self._memory_saver: Optional[AsyncSqliteSaver] = None
+        self._memory_saver: Optional[BaseCheckpointSaver] = None
+        # 체크포인트 유지보수 (configure/touch/delete_thread/run/get_stats)
+        self.checkpoint_maintainer: Optional[Any] = None
+        self.response_cache: Optional[SemanticResponseCache] = None
+        if settings.RESPONSE_CACHE_ENABLED:
+            self.response_cache = SemanticResponseCache(
+                self.chromadb_manager,
+                collection_name="example_response_cache",
+                source_collection="example_collection",
+                threshold=settings.RESPONSE_CACHE_THRESHOLD,
+                ttl=settings.RESPONSE_CACHE_TTL,
+                scope=settings.RESPONSE_CACHE_SCOPE,
+            )
         self._graph: Optional[Any] = None
         
         
-    async def initialize(self) -> None:
-        """그래프와 관련 컴포넌트를 초기화합니다."""
+    async def initialize(self, engine: Optional[AsyncEngine] = None) -> None:
+        """그래프와 관련 컴포넌트를 초기화합니다.
+        
+        Args:
+            engine: postgres 체크포인트 저장소가 공유할 SQLAlchemy 엔진
+        """
         
         # 모든 체인 빌드
         self._chain_manager.build_all_chains()
         
-        # SQLite 메모리 세이버 초기화
-        await self._init_sqlite_db()
+        # 체크포인트 저장소 초기화
+        backend = settings.GRAPH_CHECKPOINT_BACKEND
+        if backend == "sqlite":
+            await self._init_sqlite_db()
+        elif backend == "postgres":
+            if engine is None:
+                raise ValueError("postgres checkpoint backend requires an engine")
+            self._memory_saver = PostgresCheckpointSaver(
+                engine,
+                keep_last=settings.GRAPH_CHECKPOINT_KEEP_LAST,
+                thread_ttl=settings.GRAPH_CHECKPOINT_THREAD_TTL,
+            )
+            self.checkpoint_maintainer = self._memory_saver
+        elif backend == "redis":
+            self._memory_saver = RedisCheckpointSaver(
+                keep_last=settings.GRAPH_CHECKPOINT_KEEP_LAST,
+                thread_ttl=settings.GRAPH_CHECKPOINT_THREAD_TTL,
+            )
+            self.checkpoint_maintainer = self._memory_saver
+        else:
+            raise ValueError(f"Unknown checkpoint backend: {backend}")
+        await self.checkpoint_maintainer.configure()
         
         # 그래프 생성
         await self._build_graph()
@@ -54,6 +99,41 @@ class GraphOrchestrator:
         conn.row_factory = aiosqlite.Row 
         self._memory_saver = AsyncSqliteSaver(conn)
         self._sqlite_conn = conn
+        
+        self.checkpoint_maintainer = CheckpointMaintainer(
+            self._memory_saver,
+            name="example",
+            keep_last=settings.GRAPH_CHECKPOINT_KEEP_LAST,
+            thread_ttl=settings.GRAPH_CHECKPOINT_THREAD_TTL,
+            vacuum_pages=settings.GRAPH_CHECKPOINT_VACUUM_PAGES,
+            mmap_size=settings.GRAPH_CHECKPOINT_MMAP_SIZE,
+        )
+    
+    
+    async def _lookup_response_cache(self, state: GraphState, config: RunnableConfig) -> Dict[str, Any]:
+        """유사 질문의 이전 답변을 조회합니다. hit 이면 검색/응답 생성을 건너뜁니다."""
+        cached = await self.response_cache.lookup(
+            state["question"].content,
+            config["configurable"]["thread_id"]
+        )
+        if cached is None:
+            return {"cache_hit": False}
+        return {
+            "cache_hit": True,
+            "documents": [],
+            "answer": AIMessage(cached["answer"])
+        }
+    
+    
+    def _route_response_cache(self, state: GraphState) -> str:
+        """응답 캐시 조회 결과에 따라 다음 노드를 선택합니다."""
+        return "AddHistoryMessage" if state["cache_hit"] else "RetrieveDocument"
+    
+    
+    async def _store_response_cache(self, question: str, session_id: str, answer: str, total_tokens: int) -> None:
+        """새로 생성한 답변을 응답 캐시에 저장합니다."""
+        if self.response_cache and answer:
+            await self.response_cache.store(question, session_id, answer, total_tokens)
     
     
     async def _retrieve_documents(self, state: GraphState) -> Dict[str, Any]:
@@ -68,10 +148,13 @@ class GraphOrchestrator:
     async def _example_response(self, state: GraphState) -> Dict[str, Any]:
         """응답을 생성합니다."""
         chain = self._chain_manager.get_chain('example_response')
+        history = format_docs(state["messages"])
+        if state.get("summary"):
+            history = f"이전 대화 요약 - {state['summary']}\n\n{history}"
         answer = await chain.ainvoke({
             "context": format_retriever(state["documents"]),
             "question": state["question"].content,
-            "history": format_docs(state["messages"])
+            "history": history
         })
         
         return {
@@ -85,20 +168,76 @@ class GraphOrchestrator:
         return {"messages": [state['question'] , state['answer']]}
     
     
+    def _split_history(self, messages: List[BaseMessage]) -> Tuple[List[BaseMessage], List[BaseMessage]]:
+        """히스토리를 토큰 한도 안의 최근 대화와 밀려난 오래된 메시지로 나눕니다.
+        
+        Returns:
+            tuple: (유지할 메시지, 밀려난 메시지)
+        """
+        kept = trim_messages(
+            messages,
+            max_tokens=settings.AGENT_HISTORY_MAX_TOKENS,
+            token_counter=get_llm_manager().get_model(ModelName.GPT_4O_MINI),
+            strategy="last",
+            start_on="human",
+        )
+        kept_ids = {message.id for message in kept}
+        return kept, [message for message in messages if message.id not in kept_ids]
+    
+    
+    def _trim_history(self, state: GraphState) -> Dict[str, Any]:
+        """토큰 한도를 넘은 오래된 메시지를 상태에서 삭제합니다 (체크포인트 크기 제한)."""
+        _, removed = self._split_history(state["messages"])
+        if not removed:
+            return {}
+        return {"messages": [RemoveMessage(id=message.id) for message in removed]}
+    
+    
+    async def _summarize_history(self, state: GraphState) -> Dict[str, Any]:
+        """토큰 한도를 넘은 오래된 메시지를 요약에 합친 뒤 상태에서 삭제합니다."""
+        _, removed = self._split_history(state["messages"])
+        if not removed:
+            return {}
+        chain = self._chain_manager.get_chain('history_summary')
+        summary = await chain.ainvoke({
+            "summary": state.get("summary") or "없음",
+            "history": format_docs(removed)
+        })
+        return {
+            "summary": summary,
+            "messages": [RemoveMessage(id=message.id) for message in removed]
+        }
+    
+    
     async def _build_graph(self) -> None:
         """LangGraph를 구성합니다."""
         graph_builder = StateGraph(GraphState)
         
         # 노드 추가
+        if self.response_cache:
+            graph_builder.add_node("ResponseCache", self._lookup_response_cache)
         graph_builder.add_node("RetrieveDocument", self._retrieve_documents)
         graph_builder.add_node("ExampleResponse", self._example_response)
         graph_builder.add_node("AddHistoryMessage", self._add_history_message)
+        if settings.AGENT_HISTORY_SUMMARY_ENABLED:
+            graph_builder.add_node("TrimHistory", self._summarize_history)
+        else:
+            graph_builder.add_node("TrimHistory", self._trim_history)
         
         # 엣지 추가
-        graph_builder.add_edge(START, "RetrieveDocument")
+        if self.response_cache:
+            graph_builder.add_edge(START, "ResponseCache")
+            graph_builder.add_conditional_edges(
+                "ResponseCache",
+                self._route_response_cache,
+                ["RetrieveDocument", "AddHistoryMessage"]
+            )
+        else:
+            graph_builder.add_edge(START, "RetrieveDocument")
         graph_builder.add_edge("RetrieveDocument", "ExampleResponse")
         graph_builder.add_edge("ExampleResponse", "AddHistoryMessage")
-        graph_builder.add_edge("AddHistoryMessage", END)
+        graph_builder.add_edge("AddHistoryMessage", "TrimHistory")
+        graph_builder.add_edge("TrimHistory", END)
         
         # 그래프 컴파일
         self._graph = graph_builder.compile(checkpointer=self._memory_saver)
@@ -124,12 +263,15 @@ class GraphOrchestrator:
             
         start_time = time.perf_counter()
         
+        await self.checkpoint_maintainer.touch(session_id)
         with get_openai_callback() as cb:
             response = await self._graph.ainvoke(input_data, config)
         
         end_time = time.perf_counter()
     
         answer_content = response['answer'].content
+        if not response.get('cache_hit'):
+            await self._store_response_cache(question, session_id, answer_content, cb.total_tokens)
         
         return (
             answer_content,
@@ -139,17 +281,76 @@ class GraphOrchestrator:
         )
     
     
+    async def astream(
+        self,
+        question: str,
+        session_id: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """그래프를 실행하며 진행 이벤트를 스트리밍합니다.
+        
+        Yields:
+            dict: {"event": 이벤트 이름, "data": 데이터}
+                - cache_hit: 응답 캐시에서 답변 (이후 전체 답변이 token 이벤트 1개로 전달됨)
+                - retrieval: 문서 검색 완료 ({"documents": 검색 문서 수})
+                - token: 응답 토큰 ({"content": 토큰 문자열})
+                - done: 실행 완료 ({"answer", "execution_time", "time_to_first_token", "total_tokens", "total_cost", "cache_hit"})
+        """
+        input_data = {"question": HumanMessage(content=question)}
+        config = {"configurable": {"thread_id": session_id}}
+        
+        start_time = time.perf_counter()
+        first_token_time: Optional[float] = None
+        answer_content = ""
+        cache_hit = False
+        
+        await self.checkpoint_maintainer.touch(session_id)
+        with get_openai_callback() as cb:
+            # messages: 노드 안에서 호출한 LLM 의 토큰 단위 출력, updates: 노드 실행 결과
+            async for mode, chunk in self._graph.astream(input_data, config, stream_mode=["updates", "messages"]):
+                if mode == "messages":
+                    message, metadata = chunk
+                    if (
+                        metadata.get("langgraph_node") == "ExampleResponse"
+                        and isinstance(message, AIMessageChunk)
+                        and message.content
+                    ):
+                        if first_token_time is None:
+                            first_token_time = time.perf_counter() - start_time
+                            LLM_TIME_TO_FIRST_TOKEN_SECONDS.observe(first_token_time)
+                        yield {"event": "token", "data": {"content": message.content}}
+                elif "ResponseCache" in chunk:
+                    cache_hit = chunk["ResponseCache"]["cache_hit"]
+                    if cache_hit:
+                        answer_content = chunk["ResponseCache"]["answer"].content
+                        first_token_time = time.perf_counter() - start_time
+                        yield {"event": "cache_hit", "data": {}}
+                        yield {"event": "token", "data": {"content": answer_content}}
+                elif "RetrieveDocument" in chunk:
+                    documents = chunk["RetrieveDocument"]["documents"]
+                    yield {"event": "retrieval", "data": {"documents": len(documents)}}
+                elif "ExampleResponse" in chunk:
+                    answer_content = chunk["ExampleResponse"]["answer"].content
+        
+        yield {
+            "event": "done",
+            "data": {
+                "answer": answer_content,
+                "execution_time": time.perf_counter() - start_time,
+                "time_to_first_token": first_token_time,
+                "total_tokens": cb.total_tokens,
+                "total_cost": cb.total_cost,
+                "cache_hit": cache_hit,
+            },
+        }
+        if not cache_hit:
+            await self._store_response_cache(question, session_id, answer_content, cb.total_tokens)
+    
+    
     async def delete_memory(self, thread_id: str) -> None:
-        """특정 스레드의 메모리를 삭제합니다."""
-        
-        try:
-            async with self._graph.checkpointer.conn.execute(
-                "DELETE FROM checkpoints WHERE thread_id = ?", 
-                (thread_id,)
-            ) as cursor:
-                await self._graph.checkpointer.conn.commit()
-        except Exception as e:
-            raise
+        """특정 스레드의 메모리(체크포인트, writes, 세션 응답 캐시)를 삭제합니다."""
+        await self.checkpoint_maintainer.delete_thread(thread_id)
+        if self.response_cache:
+            await self.response_cache.delete_session(thread_id)
     
     async def cleanup(self) -> None:
         """리소스 정리"""
@@ -9,4 +9,6 @@ class GraphState(TypedDict):
     messages: Annotated[List, add_messages]     # 메시지 관리
     question: HumanMessage                      # 최신 질문
     documents: List[Document]                   # Retriever 문서 
-    answer: str                                 # 최종 결과
\ No newline at end of file
+    answer: str                                 # 최종 결과
+    summary: str                                # 히스토리에서 밀려난 이전 대화 요약
+    cache_hit: bool                             # 응답 캐시에서 답변했는지 여부
@@ -6,7 +6,8 @@ class PromptManager:
     
     def __init__(self):
         self._prompts: Dict[str, str] = {
-            'example_response': self._get_example_response_prompt()
+            'example_response': self._get_example_response_prompt(),
+            'history_summary': self._get_history_summary_prompt()
         }
     
     def _get_example_response_prompt(self) -> str:
@@ -17,6 +18,14 @@ class PromptManager:
 
 [히스토리]
 {history}
+"""
+
+    def _get_history_summary_prompt(self) -> str:
+        return """당신은 대화 기록을 요약하는 도우미입니다. 이전 요약과 새로 추가된 대화를 합쳐 하나의 요약으로 작성하세요.
+유저가 알려준 정보, 질문의 주제, 답변의 핵심 결론만 간결하게 남기고 인사말과 중복 내용은 제외하세요.
+
+[이전 요약]
+{summary}
 """
 
     def get_prompt(self, prompt_key: str) -> str:
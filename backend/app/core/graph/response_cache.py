@@ -0,0 +1,210 @@
+"""
+그래프 시맨틱 응답 캐시
+
+같은(또는 거의 같은) 질문이 반복되면 문서 검색과 LLM 응답 생성을 건너뛰고 이전 답변을 재사용합니다.
+- 질문 임베딩으로 전용 Chroma 컬렉션(cosine)의 과거 질문/답변을 조회해 유사도가 threshold 이상이면 hit
+- 저장 후 ttl 초가 지난 항목은 조회에서 제외되고 purge() 에서 삭제
+- scope: global(모든 세션 공유) / session(세션별, 히스토리에 따라 답변이 달라지는 경우)
+- 검색 결과 캐시가 켜져 있으면 원본 문서 컬렉션 버전을 함께 저장해 문서가 바뀐 뒤에는 이전 답변을 쓰지 않음
+
+질문 임베딩은 ChromaManager 의 임베딩을 사용하므로 임베딩 캐시가 켜져 있으면 저장 시 다시 계산하지 않습니다.
+"""
+import asyncio
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+from app.core.embedding_cache import normalize_text
+from app.core.logger import get_logger
+
+logger = get_logger("graph.response_cache")
+
+SCOPE_GLOBAL = "global"
+SCOPE_SESSION = "session"
+
+# Chroma cosine distance = 1 - cosine similarity
+_COLLECTION_METADATA = {"hnsw:space": "cosine"}
+
+
+class SemanticResponseCache:
+    """Chroma 컬렉션 기반 질문 유사도 응답 캐시 (chroma_manager: ChromaManager)"""
+
+    def __init__(
+        self,
+        chroma_manager: Any,
+        collection_name: str,
+        source_collection: str,
+        threshold: float = 0.95,
+        ttl: int = 86400,
+        scope: str = SCOPE_SESSION,
+    ):
+        if scope not in (SCOPE_GLOBAL, SCOPE_SESSION):
+            raise ValueError(f"Unknown response cache scope: {scope}")
+        self.chroma_manager = chroma_manager
+        self.collection_name = collection_name
+        self.source_collection = source_collection
+        self.threshold = threshold
+        self.ttl = ttl
+        self.scope = scope
+
+        # 카운터
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.saved_tokens = 0
+        self.purged = 0
+        self.bypassed = 0
+        self.errors = 0
+
+    # ---------- 키 ----------
+
+    def _scope_key(self, session_id: str) -> str:
+        return session_id if self.scope == SCOPE_SESSION else SCOPE_GLOBAL
+
+    def _entry_id(self, scope_key: str, question: str) -> str:
+        raw = f"{scope_key}\x00{normalize_text(question)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def _source_version(self) -> Optional[int]:
+        """원본 문서 컬렉션 버전 (검색 결과 캐시 미사용 시 0, Redis 오류 시 None)"""
+        search_cache = self.chroma_manager.search_cache
+        if not search_cache:
+            return 0
+        return await search_cache.get_version(self.source_collection)
+
+    async def _collection(self) -> Any:
+        vector_store = await self.chroma_manager.get_or_create_collection(
+            self.collection_name,
+            collection_metadata=_COLLECTION_METADATA,
+        )
+        return vector_store._collection if vector_store else None
+
+    # ---------- 조회/저장 ----------
+
+    async def lookup(self, question: str, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        유사 질문의 캐시된 답변 조회
+
+        Returns:
+            hit 이면 {"answer", "question", "similarity", "tokens"}, miss 이거나 캐시를 사용할 수 없으면 None
+        """
+        version = await self._source_version()
+        collection = await self._collection()
+        if version is None or collection is None:
+            self.bypassed += 1
+            return None
+
+        try:
+            vector = await self.chroma_manager.embeddings.aembed_query(question)
+            where = {"$and": [
+                {"scope": self._scope_key(session_id)},
+                {"source_version": version},
+                {"created_at": {"$gte": time.time() - self.ttl}},
+            ]}
+            result = await asyncio.to_thread(
+                collection.query,
+                query_embeddings=[vector],
+                n_results=1,
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.bind(error=str(e)).warning("응답 캐시 조회 실패")
+            return None
+
+        if not result["ids"][0]:
+            self.misses += 1
+            return None
+        similarity = 1.0 - result["distances"][0][0]
+        if similarity < self.threshold:
+            self.misses += 1
+            return None
+
+        metadata = result["metadatas"][0][0]
+        self.hits += 1
+        self.saved_tokens += int(metadata.get("tokens", 0))
+        return {
+            "answer": metadata["answer"],
+            "question": result["documents"][0][0],
+            "similarity": similarity,
+            "tokens": int(metadata.get("tokens", 0)),
+        }
+
+    async def store(self, question: str, session_id: str, answer: str, tokens: int = 0) -> None:
+        """질문/답변 저장 (같은 scope 의 같은 질문은 덮어씀)
+
+        Args:
+            tokens: 답변 생성에 사용한 토큰 수 (hit 시 절약 토큰으로 집계)
+        """
+        version = await self._source_version()
+        collection = await self._collection()
+        if version is None or collection is None:
+            self.bypassed += 1
+            return
+
+        scope_key = self._scope_key(session_id)
+        try:
+            vector = await self.chroma_manager.embeddings.aembed_query(question)
+            await asyncio.to_thread(
+                collection.upsert,
+                ids=[self._entry_id(scope_key, question)],
+                embeddings=[vector],
+                documents=[question],
+                metadatas=[{
+                    "scope": scope_key,
+                    "answer": answer,
+                    "tokens": int(tokens),
+                    "source_version": version,
+                    "created_at": time.time(),
+                }],
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.bind(error=str(e)).warning("응답 캐시 저장 실패")
+            return
+        self.stores += 1
+
+    async def delete_session(self, session_id: str) -> None:
+        """세션 scope 항목 삭제 (global scope 에서는 다른 세션과 공유하므로 유지)"""
+        if self.scope != SCOPE_SESSION:
+            return
+        collection = await self._collection()
+        if collection is None:
+            return
+        try:
+            await asyncio.to_thread(collection.delete, where={"scope": session_id})
+        except Exception as e:
+            self.errors += 1
+            logger.bind(error=str(e)).warning("응답 캐시 세션 삭제 실패")
+
+    async def purge(self) -> None:
+        """TTL 이 지난 항목 삭제 (스케줄러 작업)"""
+        collection = await self._collection()
+        if collection is None:
+            return
+        where = {"created_at": {"$lt": time.time() - self.ttl}}
+        try:
+            expired = await asyncio.to_thread(collection.get, where=where, include=[])
+            if expired["ids"]:
+                await asyncio.to_thread(collection.delete, ids=expired["ids"])
+        except Exception as e:
+            self.errors += 1
+            logger.bind(error=str(e)).warning("응답 캐시 만료 항목 삭제 실패")
+            return
+        self.purged += len(expired["ids"])
+        logger.bind(purged=len(expired["ids"])).info("응답 캐시 만료 항목 삭제 완료")
+
+    # ---------- 통계 ----------
+
+    def get_stats(self) -> Dict[str, int]:
+        """응답 캐시 카운터 반환"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "saved_tokens": self.saved_tokens,
+            "purged": self.purged,
+            "bypassed": self.bypassed,
+            "errors": self.errors,
+        }
@@ -0,0 +1,597 @@
+"""
+LangGraph 체크포인트 저장소 (SQLite / PostgreSQL / Redis)
+
+SQLite 는 로컬 파일 하나를 연결 하나로 쓰므로 워커/컨테이너 간에 세션 상태를 공유할 수 없습니다.
+GRAPH_CHECKPOINT_BACKEND 로 PostgreSQL(애플리케이션 asyncpg 풀 재사용) 또는 Redis 를 선택하면
+어느 워커에서든 같은 세션을 이어서 실행할 수 있습니다.
+
+저장 방식은 AsyncSqliteSaver 와 같이 체크포인트마다 전체 상태를 직렬화해 한 행(키)에 저장하고,
+pending writes 는 체크포인트별로 따로 저장합니다.
+- PostgreSQL: graph_checkpoints / graph_checkpoint_writes 테이블(alembic 마이그레이션), 주기 작업에서 스레드별 최근 keep_last 개만 유지
+- Redis: 체크포인트 hash + 스레드별 sorted set 인덱스, 기록 시 keep_last 유지 및 namespace 키 TTL 갱신
+
+각 저장소는 CheckpointMaintainer 와 같은 유지보수 인터페이스(configure/touch/delete_thread/run/get_stats)를 제공합니다.
+"""
+import asyncio
+import base64
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from sqlalchemy import Table, and_, delete, exists, func, inspect, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.lock import get_redis_lock
+from app.core.logger import get_logger
+from app.core.redis import get_redis_client
+from app.database.model.graph_checkpoint import GraphCheckpoint, GraphCheckpointWrite
+
+logger = get_logger("graph.saver")
+
+_CHECKPOINTS: Table = GraphCheckpoint.__table__
+_WRITES: Table = GraphCheckpointWrite.__table__
+
+
+class _AsyncSaver(BaseCheckpointSaver):
+    """비동기로 구현한 saver 공통 부분
+
+    동기 API(get_tuple/list/put/put_writes)는 AsyncSqliteSaver 와 같이 configure 한 이벤트 루프에서
+    비동기 구현을 실행해 결과를 기다립니다. 루프를 막지 않도록 다른 스레드에서만 호출할 수 있습니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _check_sync_call(self) -> None:
+        if self.loop is None:
+            raise RuntimeError(f"{type(self).__name__}.configure() must be awaited before using the sync API")
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if running is self.loop:
+            raise asyncio.InvalidStateError(
+                f"Synchronous calls to {type(self).__name__} are only allowed from a different thread. "
+                "From the event loop, use the async interface (e.g. `await graph.ainvoke(...)`)."
+            )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        self._check_sync_call()
+        return asyncio.run_coroutine_threadsafe(self.aget_tuple(config), self.loop).result()
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        self._check_sync_call()
+        iterator = self.alist(config, filter=filter, before=before, limit=limit)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(anext(iterator), self.loop).result()
+            except StopAsyncIteration:
+                break
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        self._check_sync_call()
+        return asyncio.run_coroutine_threadsafe(self.aput(config, checkpoint, metadata, new_versions), self.loop).result()
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        self._check_sync_call()
+        asyncio.run_coroutine_threadsafe(self.aput_writes(config, writes, task_id, task_path), self.loop).result()
+
+    @staticmethod
+    def _thread(config: RunnableConfig) -> Tuple[str, str]:
+        configurable = config["configurable"]
+        return str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")
+
+    @staticmethod
+    def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint_id}}
+
+    @staticmethod
+    def _matches(metadata: CheckpointMetadata, filter: Optional[Dict[str, Any]]) -> bool:
+        return not filter or all(metadata.get(key) == value for key, value in filter.items())
+
+    # ---------- 유지보수 인터페이스 (CheckpointMaintainer 와 동일) ----------
+
+    async def configure(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        await self.setup()
+
+    async def setup(self) -> None:
+        pass
+
+    async def touch(self, thread_id: str) -> None:
+        """실행 시각은 기록 시점에 함께 저장되므로 별도 기록 없음"""
+
+    async def delete_thread(self, thread_id: str) -> None:
+        await self.adelete_thread(thread_id)
+
+    async def run(self) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, int]:
+        return {}
+
+
+class PostgresCheckpointSaver(_AsyncSaver):
+    """PostgreSQL 체크포인트 저장소 (애플리케이션 SQLAlchemy 엔진/풀 공유)
+
+    테이블은 GraphCheckpoint / GraphCheckpointWrite 모델로 정의되어 alembic 마이그레이션으로 생성합니다.
+    SQLAlchemy Core 로 작성해 SQLite(aiosqlite) 엔진에서도 동작합니다.
+    기록은 INSERT 1회만 하고, keep_last 정리와 thread_ttl 만료 삭제는 CheckpointMaintainer 처럼 주기 작업(run)에서 합니다.
+    """
+
+    def __init__(self, engine: AsyncEngine, keep_last: int = 5, thread_ttl: int = 0):
+        super().__init__()
+        self.engine = engine
+        self.keep_last = keep_last
+        self.thread_ttl = thread_ttl
+
+        # 카운터
+        self.runs = 0
+        self.pruned_checkpoints = 0
+        self.pruned_writes = 0
+        self.expired_threads = 0
+        self.deleted_threads = 0
+        self.errors = 0
+
+    async def setup(self) -> None:
+        """테이블 존재 확인 (생성은 `alembic upgrade head`)"""
+        async with self.engine.connect() as conn:
+            exists = await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(_CHECKPOINTS.name))
+        if not exists:
+            raise RuntimeError(f"{_CHECKPOINTS.name} table does not exist: run `alembic upgrade head`")
+
+    def _insert(self, table: Table):
+        """방언별 INSERT (ON CONFLICT 지원)"""
+        if self.engine.dialect.name == "sqlite":
+            return sqlite_insert(table)
+        return pg_insert(table)
+
+    @staticmethod
+    def _in_thread(table: Table, thread_id: str, checkpoint_ns: str):
+        return and_(table.c.thread_id == thread_id, table.c.checkpoint_ns == checkpoint_ns)
+
+    # ---------- 조회 ----------
+
+    def _to_tuple(self, row: Any, writes: List[Any]) -> CheckpointTuple:
+        return CheckpointTuple(
+            config=self._config(row.thread_id, row.checkpoint_ns, row.checkpoint_id),
+            checkpoint=self.serde.loads_typed((row.type, row.checkpoint)),
+            metadata=self.serde.loads_typed((row.metadata_type, row._mapping["metadata"])),
+            parent_config=(
+                self._config(row.thread_id, row.checkpoint_ns, row.parent_checkpoint_id)
+                if row.parent_checkpoint_id else None
+            ),
+            pending_writes=[(w.task_id, w.channel, self.serde.loads_typed((w.type, w.value))) for w in writes],
+        )
+
+    async def _writes(self, conn: Any, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List[Any]:
+        result = await conn.execute(
+            select(_WRITES.c.task_id, _WRITES.c.channel, _WRITES.c.type, _WRITES.c.value)
+            .where(self._in_thread(_WRITES, thread_id, checkpoint_ns), _WRITES.c.checkpoint_id == checkpoint_id)
+            .order_by(_WRITES.c.task_id, _WRITES.c.idx)
+        )
+        return result.all()
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id, checkpoint_ns = self._thread(config)
+        query = select(_CHECKPOINTS).where(self._in_thread(_CHECKPOINTS, thread_id, checkpoint_ns))
+        if checkpoint_id := get_checkpoint_id(config):
+            query = query.where(_CHECKPOINTS.c.checkpoint_id == checkpoint_id)
+
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(query.order_by(_CHECKPOINTS.c.checkpoint_id.desc()).limit(1))).first()
+            if row is None:
+                return None
+            writes = await self._writes(conn, row.thread_id, row.checkpoint_ns, row.checkpoint_id)
+        return self._to_tuple(row, writes)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        query = select(_CHECKPOINTS).order_by(_CHECKPOINTS.c.checkpoint_id.desc())
+        if config:
+            thread_id, checkpoint_ns = self._thread(config)
+            query = query.where(self._in_thread(_CHECKPOINTS, thread_id, checkpoint_ns))
+            if get_checkpoint_id(config):
+                query = query.where(_CHECKPOINTS.c.checkpoint_id == get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            query = query.where(_CHECKPOINTS.c.checkpoint_id < get_checkpoint_id(before))
+        if limit is not None and not filter:
+            # metadata 필터는 역직렬화 후 적용하므로 필터가 없을 때만 DB 에서 제한
+            query = query.limit(limit)
+
+        returned = 0
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(query)).all()
+            for row in rows:
+                if limit is not None and returned >= limit:
+                    return
+                checkpoint_tuple = self._to_tuple(row, await self._writes(conn, row.thread_id, row.checkpoint_ns, row.checkpoint_id))
+                if self._matches(checkpoint_tuple.metadata, filter):
+                    returned += 1
+                    yield checkpoint_tuple
+
+    # ---------- 기록 ----------
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id, checkpoint_ns = self._thread(config)
+        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        metadata_type, serialized_metadata = self.serde.dumps_typed(metadata)
+
+        stmt = self._insert(_CHECKPOINTS).values(
+            thread_id=thread_id,
+            checkpoint_ns=checkpoint_ns,
+            checkpoint_id=checkpoint["id"],
+            parent_checkpoint_id=get_checkpoint_id(config),
+            type=type_,
+            checkpoint=serialized_checkpoint,
+            metadata_type=metadata_type,
+            metadata=serialized_metadata,
+            created_at=datetime.now(timezone.utc),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_CHECKPOINTS.c.thread_id, _CHECKPOINTS.c.checkpoint_ns, _CHECKPOINTS.c.checkpoint_id],
+            set_={column: stmt.excluded[column] for column in ("type", "checkpoint", "metadata_type", "metadata", "created_at")},
+        )
+
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt)
+        return self._config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id, checkpoint_ns = self._thread(config)
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized = self.serde.dumps_typed(value)
+            rows.append({
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": config["configurable"]["checkpoint_id"],
+                "task_id": task_id,
+                "idx": WRITES_IDX_MAP.get(channel, idx),
+                "channel": channel,
+                "type": type_,
+                "value": serialized,
+            })
+
+        # 특수 채널(에러, 인터럽트 등)은 덮어쓰고 일반 채널은 최초 기록 유지
+        stmt = self._insert(_WRITES)
+        if all(channel in WRITES_IDX_MAP for channel, _ in writes):
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[column for column in _WRITES.primary_key.columns],
+                set_={column: stmt.excluded[column] for column in ("channel", "type", "value")},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt, rows)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        async with self.engine.begin() as conn:
+            for table in (_WRITES, _CHECKPOINTS):
+                await conn.execute(delete(table).where(table.c.thread_id == str(thread_id)))
+        self.deleted_threads += 1
+
+    # ---------- 유지보수 ----------
+
+    async def _expire(self, conn: Any) -> int:
+        """마지막 기록 후 thread_ttl 이 지난 스레드 삭제 후 삭제 수 반환"""
+        if self.thread_ttl <= 0:
+            return 0
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.thread_ttl)
+        expired_query = (
+            select(_CHECKPOINTS.c.thread_id)
+            .group_by(_CHECKPOINTS.c.thread_id)
+            .having(func.max(_CHECKPOINTS.c.created_at) < cutoff)
+        )
+        expired = len((await conn.execute(expired_query)).all())
+        for table in (_WRITES, _CHECKPOINTS):
+            await conn.execute(delete(table).where(table.c.thread_id.in_(expired_query)))
+        return expired
+
+    async def _prune(self, conn: Any) -> Tuple[int, int]:
+        """스레드별 최근 keep_last 개를 제외한 체크포인트와 남은 체크포인트에 속하지 않는 writes 삭제 후 (체크포인트, writes) 삭제 수 반환"""
+        if self.keep_last <= 0:
+            return 0, 0
+        ranked = select(
+            _CHECKPOINTS.c.thread_id,
+            _CHECKPOINTS.c.checkpoint_ns,
+            _CHECKPOINTS.c.checkpoint_id,
+            func.row_number().over(
+                partition_by=[_CHECKPOINTS.c.thread_id, _CHECKPOINTS.c.checkpoint_ns],
+                order_by=_CHECKPOINTS.c.checkpoint_id.desc(),
+            ).label("rn"),
+        ).subquery()
+        stale = select(ranked.c.thread_id, ranked.c.checkpoint_ns, ranked.c.checkpoint_id).where(ranked.c.rn > self.keep_last)
+        result = await conn.execute(
+            delete(_CHECKPOINTS).where(
+                tuple_(_CHECKPOINTS.c.thread_id, _CHECKPOINTS.c.checkpoint_ns, _CHECKPOINTS.c.checkpoint_id).in_(stale)
+            )
+        )
+        deleted = result.rowcount
+        result = await conn.execute(
+            delete(_WRITES).where(~exists().where(
+                _CHECKPOINTS.c.thread_id == _WRITES.c.thread_id,
+                _CHECKPOINTS.c.checkpoint_ns == _WRITES.c.checkpoint_ns,
+                _CHECKPOINTS.c.checkpoint_id == _WRITES.c.checkpoint_id,
+            ))
+        )
+        return deleted, result.rowcount
+
+    async def run(self) -> None:
+        """정리 작업 1회 실행 (스케줄러 작업, 워커 간에는 분산 락으로 1곳에서만 실행)"""
+        if self.thread_ttl <= 0 and self.keep_last <= 0:
+            return
+        async with get_redis_lock().lock("graph:checkpoint:postgres", ttl=60, watchdog=True) as acquired:
+            if not acquired:
+                return
+            start = time.perf_counter()
+            try:
+                async with self.engine.begin() as conn:
+                    expired = await self._expire(conn)
+                    pruned, pruned_writes = await self._prune(conn)
+            except Exception as e:
+                self.errors += 1
+                logger.bind(error=str(e)).error("체크포인트 정리 실패")
+                return
+            self.runs += 1
+            self.expired_threads += expired
+            self.pruned_checkpoints += pruned
+            self.pruned_writes += pruned_writes
+            logger.bind(
+                backend="postgres",
+                expired_threads=expired,
+                pruned_checkpoints=pruned,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+            ).info("체크포인트 정리 완료")
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "runs": self.runs,
+            "pruned_checkpoints": self.pruned_checkpoints,
+            "pruned_writes": self.pruned_writes,
+            "expired_threads": self.expired_threads,
+            "deleted_threads": self.deleted_threads,
+            "errors": self.errors,
+        }
+
+
+class RedisCheckpointSaver(_AsyncSaver):
+    """Redis 체크포인트 저장소
+
+    - graph:checkpoint:{thread}:{ns}:{id}   체크포인트 hash
+    - graph:checkpoint:writes:{thread}:{ns}:{id}  pending writes hash ({task_id}:{idx} → JSON)
+    - graph:checkpoint:index:{thread}:{ns}   체크포인트 id sorted set (score 0, id 사전순 = 생성순)
+    - graph:checkpoint:thread:{thread}       스레드의 namespace set
+    공유 클라이언트가 decode_responses=True 이므로 직렬화 바이트는 base64 로 저장합니다.
+    thread_ttl 이 있으면 기록마다 namespace set 과 해당 namespace 의 인덱스/체크포인트/writes 키 TTL 을 갱신해
+    유휴 스레드는 Redis 가 만료시킵니다.
+    """
+
+    def __init__(self, keep_last: int = 5, thread_ttl: int = 0):
+        super().__init__()
+        self.keep_last = keep_last
+        self.thread_ttl = thread_ttl
+        self.deleted_threads = 0
+
+    # ---------- 키 ----------
+
+    @staticmethod
+    def _checkpoint_key(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"graph:checkpoint:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
+    @staticmethod
+    def _writes_key(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"graph:checkpoint:writes:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
+    @staticmethod
+    def _index_key(thread_id: str, checkpoint_ns: str) -> str:
+        return f"graph:checkpoint:index:{thread_id}:{checkpoint_ns}"
+
+    @staticmethod
+    def _namespaces_key(thread_id: str) -> str:
+        return f"graph:checkpoint:thread:{thread_id}"
+
+    def _dumps(self, value: Any) -> Tuple[str, str]:
+        type_, serialized = self.serde.dumps_typed(value)
+        return type_, base64.b64encode(serialized).decode()
+
+    def _loads(self, type_: str, value: str) -> Any:
+        return self.serde.loads_typed((type_, base64.b64decode(value)))
+
+    # ---------- 조회 ----------
+
+    async def _load(self, client: Any, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> Optional[CheckpointTuple]:
+        pipe = client.pipeline(transaction=False)
+        pipe.hgetall(self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id))
+        pipe.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+        data, writes = await pipe.execute()
+        if not data:
+            return None
+        pending_writes = []
+        for field in sorted(writes, key=lambda f: (f.rsplit(":", 1)[0], int(f.rsplit(":", 1)[1]))):
+            task_id, channel, type_, value = json.loads(writes[field])
+            pending_writes.append((task_id, channel, self._loads(type_, value)))
+        parent_id = data.get("parent_checkpoint_id")
+        return CheckpointTuple(
+            config=self._config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint=self._loads(data["type"], data["checkpoint"]),
+            metadata=self._loads(data["metadata_type"], data["metadata"]),
+            parent_config=self._config(thread_id, checkpoint_ns, parent_id) if parent_id else None,
+            pending_writes=pending_writes,
+        )
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id, checkpoint_ns = self._thread(config)
+        client = await get_redis_client()
+        checkpoint_id = get_checkpoint_id(config)
+        if not checkpoint_id:
+            latest = await client.zrevrangebylex(self._index_key(thread_id, checkpoint_ns), "+", "-", start=0, num=1)
+            if not latest:
+                return None
+            checkpoint_id = latest[0]
+        return await self._load(client, thread_id, checkpoint_ns, checkpoint_id)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        if not config:
+            raise ValueError("RedisCheckpointSaver.alist requires a thread_id")
+        thread_id, checkpoint_ns = self._thread(config)
+        client = await get_redis_client()
+        if get_checkpoint_id(config):
+            ids = [get_checkpoint_id(config)]
+        else:
+            upper = f"({get_checkpoint_id(before)}" if before and get_checkpoint_id(before) else "+"
+            ids = await client.zrevrangebylex(self._index_key(thread_id, checkpoint_ns), upper, "-")
+
+        returned = 0
+        for checkpoint_id in ids:
+            if limit is not None and returned >= limit:
+                return
+            checkpoint_tuple = await self._load(client, thread_id, checkpoint_ns, checkpoint_id)
+            if checkpoint_tuple and self._matches(checkpoint_tuple.metadata, filter):
+                returned += 1
+                yield checkpoint_tuple
+
+    # ---------- 기록 ----------
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id, checkpoint_ns = self._thread(config)
+        checkpoint_id = checkpoint["id"]
+        type_, serialized_checkpoint = self._dumps(checkpoint)
+        metadata_type, serialized_metadata = self._dumps(metadata)
+        mapping = {
+            "type": type_,
+            "checkpoint": serialized_checkpoint,
+            "metadata_type": metadata_type,
+            "metadata": serialized_metadata,
+            "created_at": str(time.time()),
+        }
+        if get_checkpoint_id(config):
+            mapping["parent_checkpoint_id"] = get_checkpoint_id(config)
+
+        index_key = self._index_key(thread_id, checkpoint_ns)
+        namespaces_key = self._namespaces_key(thread_id)
+        client = await get_redis_client()
+
+        # 추가와 초과분 조회/제거를 MULTI/EXEC 로 함께 실행
+        # (동시 기록이나 같은 id 재기록에도 인덱스에는 정확히 최근 keep_last 개만 남음)
+        pipe = client.pipeline(transaction=True)
+        pipe.hset(self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id), mapping=mapping)
+        pipe.zadd(index_key, {checkpoint_id: 0})
+        pipe.sadd(namespaces_key, checkpoint_ns)
+        if self.keep_last > 0:
+            pipe.zrange(index_key, 0, -self.keep_last - 1)
+            pipe.zremrangebyrank(index_key, 0, -self.keep_last - 1)
+        if self.thread_ttl > 0:
+            pipe.zrange(index_key, 0, -1)
+        results = await pipe.execute()
+
+        # 인덱스에서 빠진 체크포인트 키 삭제, 남은 키 TTL 갱신
+        stale = results[3] if self.keep_last > 0 else []
+        pipe = client.pipeline(transaction=False)
+        for stale_id in stale:
+            pipe.delete(
+                self._checkpoint_key(thread_id, checkpoint_ns, stale_id),
+                self._writes_key(thread_id, checkpoint_ns, stale_id),
+            )
+        if self.thread_ttl > 0:
+            pipe.expire(namespaces_key, self.thread_ttl)
+            pipe.expire(index_key, self.thread_ttl)
+            for kept_id in results[-1]:
+                pipe.expire(self._checkpoint_key(thread_id, checkpoint_ns, kept_id), self.thread_ttl)
+                pipe.expire(self._writes_key(thread_id, checkpoint_ns, kept_id), self.thread_ttl)
+        if stale or self.thread_ttl > 0:
+            await pipe.execute()
+        return self._config(thread_id, checkpoint_ns, checkpoint_id)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id, checkpoint_ns = self._thread(config)
+        writes_key = self._writes_key(thread_id, checkpoint_ns, config["configurable"]["checkpoint_id"])
+        overwrite = all(channel in WRITES_IDX_MAP for channel, _ in writes)
+        client = await get_redis_client()
+
+        pipe = client.pipeline(transaction=True)
+        for idx, (channel, value) in enumerate(writes):
+            field = f"{task_id}:{WRITES_IDX_MAP.get(channel, idx)}"
+            payload = json.dumps([task_id, channel, *self._dumps(value)])
+            if overwrite:
+                pipe.hset(writes_key, field, payload)
+            else:
+                pipe.hsetnx(writes_key, field, payload)
+        if self.thread_ttl > 0:
+            pipe.expire(writes_key, self.thread_ttl)
+        await pipe.execute()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        thread_id = str(thread_id)
+        client = await get_redis_client()
+        namespaces_key = self._namespaces_key(thread_id)
+        keys = [namespaces_key]
+        for checkpoint_ns in await client.smembers(namespaces_key):
+            index_key = self._index_key(thread_id, checkpoint_ns)
+            keys.append(index_key)
+            for checkpoint_id in await client.zrange(index_key, 0, -1):
+                keys.append(self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id))
+                keys.append(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+        await client.delete(*keys)
+        self.deleted_threads += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"deleted_threads": self.deleted_threads}
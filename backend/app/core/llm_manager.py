@@ -1,9 +1,18 @@
-from typing import Dict, List
+import time
+from typing import Any, Dict, List
+from uuid import UUID
 from langchain_openai import ChatOpenAI
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
 from enum import Enum
 from functools import lru_cache
 
 from app.config.setting import settings
+from app.core.metrics import (
+    LLM_REQUESTS_TOTAL,
+    LLM_REQUEST_DURATION_SECONDS,
+    LLM_TOKENS_TOTAL,
+)
 
 
 class ModelName(str, Enum):
@@ -18,6 +27,49 @@ class ModelName(str, Enum):
         return [model.value for model in cls]
 
 
+class LLMMetricsCallbackHandler(BaseCallbackHandler):
+    """LLM 호출 수, 지연, 토큰 사용량을 Prometheus 메트릭으로 기록하는 콜백"""
+    
+    run_inline = True  # 비동기 호출에서도 executor 없이 바로 실행
+    
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._start_times: Dict[UUID, float] = {}
+    
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start_times[run_id] = time.perf_counter()
+    
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._start_times[run_id] = time.perf_counter()
+    
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        start_time = self._start_times.pop(run_id, None)
+        if start_time is not None:
+            LLM_REQUEST_DURATION_SECONDS.labels(self.model_name).observe(time.perf_counter() - start_time)
+        LLM_REQUESTS_TOTAL.labels(self.model_name, "success").inc()
+        
+        token_usage = (response.llm_output or {}).get("token_usage") or self._stream_token_usage(response)
+        for token_type in ("prompt_tokens", "completion_tokens"):
+            if token_usage.get(token_type):
+                LLM_TOKENS_TOTAL.labels(self.model_name, token_type).inc(token_usage[token_type])
+    
+    @staticmethod
+    def _stream_token_usage(response: LLMResult) -> Dict[str, int]:
+        """스트리밍 호출은 llm_output 대신 메시지의 usage_metadata 로 사용량이 전달됨"""
+        try:
+            usage = response.generations[0][0].message.usage_metadata or {}
+        except (IndexError, AttributeError):
+            return {}
+        return {
+            "prompt_tokens": usage.get("input_tokens", 0),
+            "completion_tokens": usage.get("output_tokens", 0),
+        }
+    
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start_times.pop(run_id, None)
+        LLM_REQUESTS_TOTAL.labels(self.model_name, "error").inc()
+
+
 class LLMManager:
     """LLM 모델을 관리하는 클래스"""
     
@@ -29,9 +81,12 @@ class LLMManager:
         """모든 LLM 모델을 초기화합니다."""
         if not self._initialized:
             for model in ModelName:
+                callbacks = [LLMMetricsCallbackHandler(model.value)] if settings.METRICS_ENABLED else None
                 self._models[model.value] = ChatOpenAI(
                     api_key=settings.OPENAI_API_KEY,
-                    model=model.value
+                    model=model.value,
+                    stream_usage=True,  # 스트리밍 응답에도 토큰 사용량 포함
+                    callbacks=callbacks
                 )
             self._initialized = True
         
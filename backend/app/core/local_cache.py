@@ -0,0 +1,50 @@
+"""
+프로세스 내 L1 캐시
+
+사용자 조회 캐시, 검색 결과 캐시, 임베딩 캐시가 공통으로 사용하는 TTL + 크기 제한 LRU 입니다.
+None 도 캐시할 수 있도록 조회 실패는 MISSING 으로 구분합니다.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+
+# 캐시에 값이 없음을 나타내는 값 (None 과 구분)
+MISSING = object()
+
+
+class LocalTTLCache:
+    """프로세스 내 L1 캐시 (TTL + 크기 제한 LRU)"""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        """값 반환 (없거나 만료되면 MISSING)"""
+        item = self._data.get(key)
+        if item is None:
+            return MISSING
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,6 +1,12 @@
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from typing import Optional, AsyncIterator
-from contextlib import asynccontextmanager
+from typing import Any, Callable, Optional, AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from app.core.logger import get_logger
+
+logger = get_logger("lock")
 
 
 class DistributedLock(ABC):
@@ -62,7 +68,15 @@ class DistributedLock(ABC):
         pass
     
     @asynccontextmanager
-    async def lock(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> AsyncIterator[bool]:
+    async def lock(
+        self,
+        name: str,
+        ttl: int = 30,
+        timeout: Optional[float] = None,
+        watchdog: bool = False,
+        renew_interval: Optional[float] = None,
+        on_lease_lost: Optional[Callable[[str], Any]] = None,
+    ) -> AsyncIterator[bool]:
         """
         컨텍스트 매니저로 락을 사용합니다.
         
@@ -70,13 +84,51 @@ class DistributedLock(ABC):
             name: 락의 이름
             ttl: 락의 생존 시간 (초 단위)
             timeout: 락 획득 대기 시간
+            watchdog: True면 본문 실행 동안 백그라운드에서 TTL을 주기적으로 연장
+            renew_interval: 연장 주기 (기본값 ttl / 3)
+            on_lease_lost: 연장 실패(소유권 상실) 시 호출할 콜백 (락 이름 전달, sync/async 모두 가능)
             
         Yields:
             bool: 락 획득 성공 여부
         """
         acquired = await self.acquire(name, ttl, timeout)
+        
+        renewer: Optional[asyncio.Task] = None
+        if acquired and watchdog:
+            renewer = asyncio.create_task(
+                self._renew_lease(name, ttl, renew_interval or ttl / 3, on_lease_lost),
+                name=f"lock-watchdog:{name}",
+            )
+        
         try:
             yield acquired
         finally:
+            if renewer is not None:
+                renewer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await renewer
             if acquired:
-                await self.release(name)
\ No newline at end of file
+                await self.release(name)
+    
+    async def _renew_lease(
+        self,
+        name: str,
+        ttl: int,
+        interval: float,
+        on_lease_lost: Optional[Callable[[str], Any]],
+    ) -> None:
+        """watchdog: interval 마다 TTL 연장, 실패하면 소유권 상실로 보고 후 종료"""
+        while True:
+            await asyncio.sleep(interval)
+            if await self.extend(name, ttl):
+                continue
+            
+            logger.warning(f"Lease lost for lock '{name}' - watchdog stopped")
+            if on_lease_lost is not None:
+                try:
+                    result = on_lease_lost(name)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Error in lease lost callback for lock '{name}': {e}")
+            return
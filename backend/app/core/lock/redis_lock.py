@@ -1,7 +1,9 @@
 import uuid
+import random
 import asyncio
-from typing import Optional, Dict
+from typing import AsyncIterator, Optional, Dict, Set
 from contextvars import ContextVar
+from contextlib import asynccontextmanager
 
 from app.core.lock.base import DistributedLock
 from app.core.redis import get_redis_client
@@ -27,13 +29,114 @@ def _get_token_map() -> Dict[str, str]:
         return m
 
 
+class LockReleaseNotifier:
+    """락 해제 알림 수신기 (프로세스당 pub/sub 연결 1개 공유)
+
+    - 대기자가 생긴 락 채널만 구독하고, 대기자가 없어지면 구독 해제
+    - 해제 메시지를 받으면 해당 채널의 모든 대기자를 깨움
+    - 구독 전파 지연이나 TTL 만료(해제 메시지 없음)는 대기자 쪽 타임아웃 재시도로 보완
+    """
+
+    def __init__(self) -> None:
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+
+    @asynccontextmanager
+    async def listen(self, channel: str) -> AsyncIterator[asyncio.Event]:
+        """채널 해제 알림을 받을 Event 를 반환 (컨텍스트 종료 시 구독 정리)"""
+        event = asyncio.Event()
+        waiters = self._waiters.get(channel)
+        if waiters is None:
+            waiters = self._waiters[channel] = set()
+            await self._subscribe(channel)
+        waiters.add(event)
+        try:
+            yield event
+        finally:
+            waiters.discard(event)
+            if not waiters and self._waiters.get(channel) is waiters:
+                del self._waiters[channel]
+                await self._unsubscribe(channel)
+
+    async def _subscribe(self, channel: str) -> None:
+        try:
+            if self._pubsub is None:
+                client = await get_redis_client()
+                self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(channel)
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen_loop(), name="redis-lock-notifier")
+        except Exception as e:
+            # 알림 없이도 대기자는 타임아웃 재시도로 동작
+            logger.warning(f"Failed to subscribe lock channel '{channel}': {e}")
+
+    async def _unsubscribe(self, channel: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(channel)
+        except Exception as e:
+            logger.warning(f"Failed to unsubscribe lock channel '{channel}': {e}")
+
+    def _notify(self, channel: str) -> None:
+        for event in self._waiters.get(channel, ()):
+            event.set()
+
+    async def _listen_loop(self) -> None:
+        pubsub = self._pubsub
+        try:
+            while self._waiters:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message["type"] == "message":
+                    self._notify(message["channel"])
+        except Exception as e:
+            logger.warning(f"Lock release listener stopped: {e}")
+        finally:
+            # 대기자가 없거나 연결 오류 시 pub/sub 연결 반환, 다음 대기자가 다시 생성
+            if self._pubsub is pubsub:
+                self._pubsub = None
+            if self._listener is asyncio.current_task():
+                self._listener = None
+            # 오류로 종료된 경우 남은 대기자가 즉시 재시도하도록 깨움
+            for channel in list(self._waiters):
+                self._notify(channel)
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+class _LocalLockEntry:
+    """락 이름별 프로세스 내 대기열 (asyncio.Lock 은 FIFO 순서로 깨움)"""
+
+    __slots__ = ("lock", "users", "owner_token")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0                       # 대기 중 + 보유 중인 코루틴 수
+        self.owner_token: Optional[str] = None
+
+
 class RedisLock(DistributedLock):
-    """Redis를 사용한 분산 락 구현체"""
+    """Redis를 사용한 분산 락 구현체
 
-    # 락 소유자만 해제
+    - 같은 프로세스의 같은 락 이름은 로컬 대기열에서 먼저 줄을 서고, 선두 1개 코루틴만 Redis에서 경합
+      (해제 시 로컬 대기자에게 FIFO 순서로 넘겨줌)
+    - 경합이 없으면 SET NX 1회로 획득
+    - 경합 시 해제 채널을 구독하고 해제 알림 또는 지터 지수 백오프 타임아웃 중 먼저 오는 쪽에서 재시도
+    """
+
+    # 재시도 대기 (초) - 알림 누락 시 폴백
+    BACKOFF_BASE = 0.05
+    BACKOFF_MAX = 1.0
+
+    # 락 소유자만 해제, 해제 시 대기자에게 알림
     RELEASE_SCRIPT = """
     if redis.call("get", KEYS[1]) == ARGV[1] then
-        return redis.call("del", KEYS[1])
+        redis.call("del", KEYS[1])
+        redis.call("publish", ARGV[2], "released")
+        return 1
     else
         return 0
     end
@@ -50,51 +153,147 @@ class RedisLock(DistributedLock):
 
     def __init__(self) -> None:
         self._lock_prefix = "lock:"
+        self._channel_prefix = "lock:released:"
+        self._notifier = LockReleaseNotifier()
+        self._local: Dict[str, _LocalLockEntry] = {}
 
     def _get_lock_key(self, name: str) -> str:
         return f"{self._lock_prefix}{name}"
 
+    def _get_channel(self, name: str) -> str:
+        return f"{self._channel_prefix}{name}"
+
+    @classmethod
+    def _backoff(cls, attempt: int) -> float:
+        """지터가 적용된 지수 백오프 (equal jitter)"""
+        delay = min(cls.BACKOFF_MAX, cls.BACKOFF_BASE * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    # ---------- 로컬 대기열 ----------
+
+    def _enter_local(self, name: str) -> _LocalLockEntry:
+        entry = self._local.get(name)
+        if entry is None:
+            entry = self._local[name] = _LocalLockEntry()
+        entry.users += 1
+        return entry
+
+    def _leave_local(self, name: str, entry: _LocalLockEntry) -> None:
+        entry.users -= 1
+        if entry.users == 0 and self._local.get(name) is entry:
+            del self._local[name]
+
+    async def _acquire_local(self, entry: _LocalLockEntry, timeout: Optional[float]) -> bool:
+        """로컬 대기열 획득 (timeout 규칙은 acquire 와 동일)"""
+        if timeout is None:
+            # 해제 직후 넘겨받을 대기자가 아직 실행되지 않았으면 locked() 가 False 이므로 대기자 수도 확인
+            # (users 는 보유자 + 대기자 + 자신)
+            if entry.lock.locked() or entry.users > 1:
+                return False
+            await entry.lock.acquire()
+            return True
+        if timeout == 0:
+            await entry.lock.acquire()
+            return True
+        try:
+            await asyncio.wait_for(entry.lock.acquire(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    # ---------- 락 API ----------
+
     async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
         """
         Redis 락 획득
+        - 프로세스 내 대기열을 먼저 통과한 뒤 Redis 에서 획득
         - 성공 시, 현재 태스크의 토큰 맵에 name->token 저장
         - timeout=None: 즉시 실패 반환
           timeout==0  : 무제한 대기
-          timeout>0   : 해당 시간까지만 polling
+          timeout>0   : 해당 시간까지만 대기
         """
-        client = await get_redis_client()
-        lock_key = self._get_lock_key(name)
-
         loop = asyncio.get_running_loop()
         start_time = loop.time()
+
+        entry = self._enter_local(name)
+        try:
+            if not await self._acquire_local(entry, timeout):
+                self._leave_local(name, entry)
+                return False
+        except BaseException:
+            self._leave_local(name, entry)
+            raise
+
+        remaining = timeout
+        if timeout:
+            # 로컬 대기에 쓴 시간만큼 차감, 남은 시간이 없으면 Redis 는 1회만 시도
+            remaining = timeout - (loop.time() - start_time)
+            if remaining <= 0:
+                remaining = None
+
+        acquired = False
+        try:
+            acquired = await self._acquire_remote(name, ttl, remaining)
+        finally:
+            if acquired:
+                entry.owner_token = _get_token_map()[name]
+            else:
+                entry.lock.release()
+                self._leave_local(name, entry)
+        return acquired
+
+    async def _acquire_remote(self, name: str, ttl: int, timeout: Optional[float]) -> bool:
+        """Redis 에서 락 획득 (SET NX + 해제 알림 대기)"""
+        client = await get_redis_client()
+        lock_key = self._get_lock_key(name)
         token = str(uuid.uuid4())
 
-        while True:
-            try:
-                acquired = await client.set(lock_key, token, nx=True, ex=ttl)
-                if acquired:
-                    token_map = _get_token_map()
-                    if name in token_map:
-                        logger.warning(f"Overwriting existing token for lock '{name}' in current task")
-                    token_map[name] = token
-                    logger.debug(f"Lock '{name}' acquired (ttl={ttl}s)")
-                    return True
-
-                if timeout is None:
-                    return False
-                elif timeout == 0:
-                    await asyncio.sleep(0.1)
-                else:
-                    elapsed = loop.time() - start_time
-                    if elapsed >= timeout:
-                        logger.debug(f"Lock '{name}' acquisition timed out after {elapsed:.2f}s")
-                        return False
-                    await asyncio.sleep(min(0.1, timeout - elapsed))
-
-            except Exception as e:
-                logger.error(f"Error acquiring lock '{name}': {e}")
+        try:
+            if await self._try_acquire(client, name, lock_key, token, ttl):
+                return True
+            if timeout is None:
                 return False
 
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+
+            # 재시도 전에 구독을 먼저 걸어야 그 사이의 해제 알림을 놓치지 않음
+            async with self._notifier.listen(self._get_channel(name)) as released:
+                attempt = 0
+                while True:
+                    released.clear()
+                    if await self._try_acquire(client, name, lock_key, token, ttl):
+                        return True
+
+                    wait = self._backoff(attempt)
+                    if timeout > 0:
+                        elapsed = loop.time() - start_time
+                        if elapsed >= timeout:
+                            logger.debug(f"Lock '{name}' acquisition timed out after {elapsed:.2f}s")
+                            return False
+                        wait = min(wait, timeout - elapsed)
+
+                    try:
+                        await asyncio.wait_for(released.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        attempt += 1
+
+        except Exception as e:
+            logger.error(f"Error acquiring lock '{name}': {e}")
+            return False
+
+    async def _try_acquire(self, client, name: str, lock_key: str, token: str, ttl: int) -> bool:
+        """SET NX 1회 시도"""
+        acquired = await client.set(lock_key, token, nx=True, ex=ttl)
+        if not acquired:
+            return False
+        token_map = _get_token_map()
+        if name in token_map:
+            logger.warning(f"Overwriting existing token for lock '{name}' in current task")
+        token_map[name] = token
+        logger.debug(f"Lock '{name}' acquired (ttl={ttl}s)")
+        return True
+
     async def release(self, name: str) -> bool:
         """
         Redis 락 해제
@@ -106,10 +305,15 @@ class RedisLock(DistributedLock):
         token = _get_token_map().get(name)
         if not token:
             logger.warning(f"No token found for lock '{name}' in current task")
+            # 토큰을 잃어도(다른 태스크에서 해제 등) 로컬 대기열은 넘겨야 같은 이름의 로컬 대기자가 멈추지 않음
+            # (상호 배제는 Redis 키가 보장하므로 다음 대기자는 키가 해제/만료될 때까지 Redis 에서 대기)
+            entry = self._local.get(name)
+            if entry is not None and entry.owner_token is not None:
+                self._release_local(name, entry.owner_token)
             return False
 
         try:
-            result = await client.eval(self.RELEASE_SCRIPT, 1, lock_key, token)
+            result = await client.eval(self.RELEASE_SCRIPT, 1, lock_key, token, self._get_channel(name))
             if result:
                 _get_token_map().pop(name, None)
                 logger.debug(f"Lock '{name}' released")
@@ -120,6 +324,17 @@ class RedisLock(DistributedLock):
         except Exception as e:
             logger.error(f"Error releasing lock '{name}': {e}")
             return False
+        finally:
+            self._release_local(name, token)
+
+    def _release_local(self, name: str, token: str) -> None:
+        """보유 중인 로컬 대기열을 다음 대기자에게 넘김 (Redis 해제 성공 여부와 무관)"""
+        entry = self._local.get(name)
+        if entry is None or entry.owner_token != token:
+            return
+        entry.owner_token = None
+        entry.lock.release()
+        self._leave_local(name, entry)
 
     async def extend(self, name: str, ttl: int) -> bool:
         """
@@ -0,0 +1,201 @@
+import asyncio
+import random
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.config.setting import settings
+from app.core.logger import get_logger
+from app.database.model.log import Log
+from app.repository.log import LogRepository
+
+logger = get_logger("mongodb.log_writer")
+
+
+class OverflowPolicy(str, Enum):
+    """큐 포화 시 처리 정책"""
+    DROP = "drop"        # 큐가 가득 차면 버림
+    SAMPLE = "sample"    # 큐가 절반 이상 차면 sample_rate 비율만 적재, 가득 차면 버림
+    BLOCK = "block"      # 큐에 자리가 날 때까지 요청이 대기
+
+
+class ApiLogWriter:
+    """API 호출 로그를 모아서 MongoDB에 일괄 저장하는 백그라운드 writer
+
+    - 요청 경로에서는 큐에 적재만 하고 즉시 반환
+    - flusher 태스크가 batch_size 만큼 모이거나 flush_interval 이 지나면 insert_many
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow_policy: str = OverflowPolicy.DROP,
+        sample_rate: float = 0.1,
+    ):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.sample_rate = sample_rate
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._idle = False
+
+        # 카운터
+        self.enqueued_count = 0
+        self.dropped_count = 0
+        self.flushed_count = 0
+        self.failed_count = 0
+
+    # ---------- 생명주기 ----------
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """flusher 태스크 시작 (앱 시작 시 호출)"""
+        if self.is_running():
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="api-log-writer")
+        logger.bind(
+            queue_size=self.queue_size,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            overflow_policy=self.overflow_policy.value,
+        ).info("API 로그 writer 시작")
+
+    async def stop(self) -> None:
+        """남은 로그를 모두 flush 한 뒤 태스크 종료 (앱 종료 시 호출)"""
+        if not self.is_running():
+            return
+        self._closing = True
+        if self._idle:
+            self._task.cancel()
+        await self._task
+        self._task = None
+        logger.bind(**self.get_stats()).info("API 로그 writer 종료")
+
+    # ---------- 적재 ----------
+
+    async def write(self, **fields: Any) -> bool:
+        """
+        로그 레코드를 큐에 적재합니다.
+
+        Args:
+            fields: Log Document 필드 (called_api, method, status_code, ...)
+
+        Returns:
+            bool: 적재 여부 (정책에 의해 버려지면 False)
+        """
+        if self._queue is None or self._closing:
+            self.dropped_count += 1
+            return False
+
+        fields.setdefault("created_at", datetime.now(timezone.utc))
+
+        if self.overflow_policy == OverflowPolicy.BLOCK:
+            await self._queue.put(fields)
+            self.enqueued_count += 1
+            return True
+
+        if (
+            self.overflow_policy == OverflowPolicy.SAMPLE
+            and self._queue.qsize() >= self.queue_size // 2
+            and random.random() >= self.sample_rate
+        ):
+            self.dropped_count += 1
+            return False
+
+        try:
+            self._queue.put_nowait(fields)
+        except asyncio.QueueFull:
+            self.dropped_count += 1
+            return False
+
+        self.enqueued_count += 1
+        return True
+
+    # ---------- flush ----------
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+            if self._closing and self._queue.empty():
+                return
+
+    async def _collect_batch(self) -> List[Dict[str, Any]]:
+        """batch_size 만큼 모이거나 flush_interval 이 지날 때까지 큐에서 꺼냄"""
+        loop = asyncio.get_running_loop()
+        batch: List[Dict[str, Any]] = []
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            if self._closing:
+                # 종료 중에는 대기 없이 남은 레코드만 꺼냄
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            self._idle = True
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+            except asyncio.CancelledError:
+                # stop()이 대기 중인 flusher를 깨운 경우만 처리, 그 외 취소는 전파
+                if not self._closing:
+                    raise
+                asyncio.current_task().uncancel()
+            finally:
+                self._idle = False
+
+        return batch
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            logs = [Log(**fields) for fields in batch]
+            await LogRepository.create_many(logs)
+            self.flushed_count += len(batch)
+        except Exception as e:
+            self.failed_count += len(batch)
+            logger.bind(
+                error=str(e),
+                batch_size=len(batch)
+            ).error("MongoDB 로그 일괄 저장 실패")
+
+    # ---------- 통계 ----------
+
+    def get_stats(self) -> Dict[str, int]:
+        """writer 카운터 반환"""
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "enqueued": self.enqueued_count,
+            "dropped": self.dropped_count,
+            "flushed": self.flushed_count,
+            "failed": self.failed_count,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_api_log_writer() -> ApiLogWriter:
+    """ApiLogWriter 싱글톤 인스턴스를 반환합니다."""
+    return ApiLogWriter(
+        queue_size=settings.API_LOG_QUEUE_SIZE,
+        batch_size=settings.API_LOG_BATCH_SIZE,
+        flush_interval=settings.API_LOG_FLUSH_INTERVAL,
+        overflow_policy=settings.API_LOG_OVERFLOW_POLICY,
+        sample_rate=settings.API_LOG_SAMPLE_RATE,
+    )
@@ -0,0 +1,197 @@
+"""
+Prometheus 메트릭
+
+- 요청 메트릭: 라우트 템플릿(/api/v1/user/test/{email}) 기준 지연 히스토그램, 상태 코드 카운터, in-flight 게이지
+- LLM 메트릭: 모델별 호출 수, 지연, 토큰 사용량
+- DB 메트릭: 커넥션 체크아웃 대기 시간 히스토그램, 체크아웃 타임아웃 카운터, SQL 실행 시간 히스토그램
+- 풀 메트릭: DB 풀, Redis 풀, ChromaDB 등은 scrape 시점에 값을 읽는 콜백 collector 로 등록
+
+멀티 워커 (uvicorn --workers N):
+  PROMETHEUS_MULTIPROC_DIR 를 지정하면 prometheus_client multiprocess 모드로 동작하며,
+  각 워커가 공유 디렉토리의 mmap 파일에 기록하고 /metrics 에서 합산해 노출합니다.
+  콜백 collector 는 scrape 요청을 처리한 워커의 값만 노출됩니다.
+"""
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.config.setting import settings
+from app.core.logger import get_logger
+
+# prometheus_client 는 import 시점에 multiprocess 여부를 결정하므로 먼저 환경 변수를 설정
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    Path(settings.PROMETHEUS_MULTIPROC_DIR).mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.PROMETHEUS_MULTIPROC_DIR)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily  # noqa: E402
+from prometheus_client.registry import Collector  # noqa: E402
+
+logger = get_logger("metrics")
+
+
+# ---------- 요청 메트릭 ----------
+
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "route", "status"],
+)
+
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (초)",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# ---------- LLM 메트릭 ----------
+
+LLM_REQUESTS_TOTAL = Counter(
+    "llm_requests_total",
+    "LLM 호출 수",
+    ["model", "status"],
+)
+
+LLM_REQUEST_DURATION_SECONDS = Histogram(
+    "llm_request_duration_seconds",
+    "LLM 호출 시간 (초)",
+    ["model"],
+    buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0),
+)
+
+LLM_TOKENS_TOTAL = Counter(
+    "llm_tokens_total",
+    "LLM 토큰 사용량",
+    ["model", "type"],
+)
+
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "llm_time_to_first_token_seconds",
+    "스트리밍 그래프 실행 시작부터 첫 응답 토큰까지 시간 (초)",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0),
+)
+
+
+# ---------- DB 메트릭 ----------
+
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "DB 커넥션 풀 체크아웃 대기 시간 (초)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+DB_POOL_CHECKOUT_TIMEOUTS_TOTAL = Counter(
+    "db_pool_checkout_timeouts_total",
+    "DB 커넥션 풀 체크아웃 타임아웃 수",
+)
+
+DB_QUERY_DURATION_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement 실행 시간 (초)",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+# ---------- 콜백 collector ----------
+
+class CallbackCollector(Collector):
+    """scrape 시점에 콜백을 호출해 게이지 값을 노출하는 collector
+
+    callback 은 {라벨 값 튜플: 값} 딕셔너리를 반환해야 합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Dict[Tuple[str, ...], float]],
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.labelnames = list(labelnames)
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        try:
+            values = self.callback()
+        except Exception as e:
+            logger.bind(metric=self.name, error=str(e)).debug("메트릭 콜백 실패")
+            return
+
+        family = GaugeMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for labels, value in values.items():
+            family.add_metric(list(labels), value)
+        yield family
+
+
+_collectors: List[Collector] = []
+
+
+def is_multiprocess() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def register_collector(collector: Collector) -> None:
+    """콜백 collector 등록 (풀 상태, 캐시 통계 등)"""
+    _collectors.append(collector)
+    if not is_multiprocess():
+        REGISTRY.register(collector)
+
+
+def unregister_collectors() -> None:
+    """등록된 콜백 collector 모두 해제"""
+    while _collectors:
+        collector = _collectors.pop()
+        if not is_multiprocess():
+            REGISTRY.unregister(collector)
+
+
+def register_stats_collector(
+    name: str,
+    documentation: str,
+    stats_fn: Callable[[], Dict[str, float]],
+    label: str = "state",
+) -> None:
+    """{상태: 값} 딕셔너리를 반환하는 통계 함수를 단일 라벨 게이지로 등록"""
+    register_collector(CallbackCollector(
+        name,
+        documentation,
+        lambda: {(key,): value for key, value in stats_fn().items()},
+        labelnames=[label],
+    ))
+
+
+def generate_metrics() -> Tuple[bytes, str]:
+    """/metrics 응답 본문과 Content-Type 반환"""
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        for collector in _collectors:
+            registry.register(collector)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """워커 종료 시 livesum 게이지 파일 정리"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -24,6 +24,18 @@ class RedisClient:
             )
         return cls._client
     
+    @classmethod
+    def get_pool_stats(cls) -> dict:
+        """커넥션 풀 상태 (메트릭용)"""
+        if cls._client is None:
+            return {}
+        pool = cls._client.connection_pool
+        return {
+            "max": pool.max_connections,
+            "available": len(pool._available_connections),
+            "in_use": len(pool._in_use_connections),
+        }
+    
     @classmethod
     async def close(cls):
         """Redis 연결 종료"""
@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+
+@lru_cache(maxsize=1)
+def get_scheduler() -> AsyncIOScheduler:
+    """주기 작업 스케줄러 싱글톤 인스턴스를 반환합니다. (앱 lifespan 에서 start/shutdown)"""
+    return AsyncIOScheduler(job_defaults={"coalesce": True, "max_instances": 1})
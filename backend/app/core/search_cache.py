@@ -0,0 +1,177 @@
+"""
+벡터 검색 결과 캐시
+
+키는 (컬렉션, 컬렉션 버전, 정규화한 질의, k, filter) 이므로 같은 질문의 반복 검색은 임베딩/HNSW 조회 없이 응답합니다.
+- 컬렉션 버전은 Redis 카운터로, 문서 추가/수정/삭제 시 bump() 로 올리면 이전 버전의 결과는 더 이상 조회되지 않고 TTL 로 만료됩니다
+- L1: 프로세스 메모리 LRU, L2: Redis (워커 간 공유)
+- 버전은 워커마다 version_ttl 초 동안 로컬에 보관하므로 다른 워커의 변경은 최대 version_ttl 초 늦게 반영됩니다
+- Redis 장애로 버전을 알 수 없으면 캐시를 건너뛰고 원본을 검색합니다
+
+결과는 JSON 으로 직렬화 가능한 dict 목록(문서 id/본문/metadata)으로 저장합니다.
+"""
+import hashlib
+import json
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.setting import settings
+from app.core.embedding_cache import normalize_text
+from app.core.local_cache import MISSING, LocalTTLCache
+from app.core.logger import get_logger
+from app.core.redis import get_redis_client
+
+logger = get_logger("search.cache")
+
+
+class SearchResultCache:
+    """컬렉션 버전 기반 L1(메모리) + L2(Redis) 검색 결과 캐시"""
+
+    def __init__(
+        self,
+        l1_max_size: int = 1024,
+        l1_ttl: float = 60.0,
+        l2_ttl: int = 600,
+        version_ttl: float = 1.0,
+    ):
+        self.l2_ttl = l2_ttl
+        self.version_ttl = version_ttl
+        self._l1 = LocalTTLCache(max_size=l1_max_size, ttl=l1_ttl)
+        self._versions: Dict[str, Tuple[float, int]] = {}
+
+        # 카운터
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.bumps = 0
+        self.bypassed = 0
+        self.errors = 0
+
+    # ---------- 키 ----------
+
+    @staticmethod
+    def _version_key(collection_name: str) -> str:
+        return f"search:version:{collection_name}"
+
+    @staticmethod
+    def _result_key(key: str) -> str:
+        return f"search:result:{key}"
+
+    @staticmethod
+    def key(collection_name: str, version: int, query: str, k: int, filter: Optional[Dict[str, Any]] = None) -> str:
+        raw = json.dumps(
+            [collection_name, version, normalize_text(query), k, filter or {}],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    # ---------- 버전 ----------
+
+    async def get_version(self, collection_name: str) -> Optional[int]:
+        """컬렉션 버전 (Redis 오류 시 None)"""
+        cached = self._versions.get(collection_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        try:
+            client = await get_redis_client()
+            raw = await client.get(self._version_key(collection_name))
+        except Exception as e:
+            self.errors += 1
+            logger.bind(collection=collection_name, error=str(e)).warning("검색 캐시 버전 조회 실패")
+            return None
+        version = int(raw or 0)
+        self._versions[collection_name] = (time.monotonic() + self.version_ttl, version)
+        return version
+
+    async def bump(self, collection_name: str) -> None:
+        """컬렉션 버전 증가 (문서 추가/수정/삭제 후 호출)"""
+        self.bumps += 1
+        # Redis 오류 시에도 이 워커의 이전 버전 결과는 다시 조회하지 않도록 로컬 버전 제거
+        self._versions.pop(collection_name, None)
+        try:
+            client = await get_redis_client()
+            version = await client.incr(self._version_key(collection_name))
+        except Exception as e:
+            self.errors += 1
+            logger.bind(collection=collection_name, error=str(e)).warning("검색 캐시 버전 증가 실패")
+            return
+        self._versions[collection_name] = (time.monotonic() + self.version_ttl, int(version))
+
+    # ---------- 조회/저장 ----------
+
+    async def get(
+        self,
+        collection_name: str,
+        query: str,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """
+        캐시 조회
+
+        Returns:
+            (캐시 키, 결과). 키가 None 이면 캐시를 사용할 수 없는 상태, 결과가 None 이면 miss
+        """
+        version = await self.get_version(collection_name)
+        if version is None:
+            self.bypassed += 1
+            return None, None
+
+        key = self.key(collection_name, version, query, k, filter)
+        value = self._l1.get(key)
+        if value is not MISSING:
+            self.l1_hits += 1
+            return key, value
+
+        try:
+            client = await get_redis_client()
+            raw = await client.get(self._result_key(key))
+        except Exception as e:
+            self.errors += 1
+            logger.bind(collection=collection_name, error=str(e)).warning("검색 캐시 L2 조회 실패")
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return key, None
+
+        self.l2_hits += 1
+        value = json.loads(raw)
+        self._l1.set(key, value)
+        return key, value
+
+    async def set(self, key: str, results: List[Dict[str, Any]]) -> None:
+        """get() 이 반환한 키로 결과 저장"""
+        self._l1.set(key, results)
+        try:
+            client = await get_redis_client()
+            await client.set(self._result_key(key), json.dumps(results, ensure_ascii=False), ex=self.l2_ttl)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(error=str(e)).warning("검색 캐시 L2 저장 실패")
+
+    # ---------- 통계 ----------
+
+    def get_stats(self) -> Dict[str, int]:
+        """검색 캐시 카운터 반환"""
+        return {
+            "l1_size": len(self._l1),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "bumps": self.bumps,
+            "bypassed": self.bypassed,
+            "evictions": self._l1.evictions,
+            "errors": self.errors,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_search_cache() -> SearchResultCache:
+    """검색 결과 캐시 싱글톤 인스턴스를 반환합니다."""
+    return SearchResultCache(
+        l1_max_size=settings.SEARCH_CACHE_L1_MAX_SIZE,
+        l1_ttl=settings.SEARCH_CACHE_L1_TTL,
+        l2_ttl=settings.SEARCH_CACHE_L2_TTL,
+        version_ttl=settings.SEARCH_CACHE_VERSION_TTL,
+    )
@@ -1,7 +1,10 @@
 from app.database.session import Base
 from app.database.model.user import User
+from app.database.model.graph_checkpoint import GraphCheckpoint, GraphCheckpointWrite
 
 __all__ = [
     "Base",
-    "User"
+    "User",
+    "GraphCheckpoint",
+    "GraphCheckpointWrite"
 ]
\ No newline at end of file
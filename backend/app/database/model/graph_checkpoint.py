@@ -0,0 +1,38 @@
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, Text
+from sqlalchemy.sql import func
+from app.database.session import Base
+
+
+class GraphCheckpoint(Base):
+    """LangGraph 체크포인트 (PostgresCheckpointSaver, 체크포인트마다 전체 상태 직렬화)"""
+    __tablename__ = "graph_checkpoints"
+
+    thread_id = Column(Text, primary_key=True)
+    checkpoint_ns = Column(Text, primary_key=True, server_default="")
+    checkpoint_id = Column(Text, primary_key=True)
+    parent_checkpoint_id = Column(Text, nullable=True)
+    type = Column(Text, nullable=False)
+    checkpoint = Column(LargeBinary, nullable=False)
+    metadata_type = Column(Text, nullable=False)
+    # 선언형 모델의 metadata 속성과 겹치지 않도록 속성 이름만 변경
+    metadata_ = Column("metadata", LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # 유휴 스레드 만료 삭제용
+        Index("ix_graph_checkpoints_created_at", created_at),
+    )
+
+
+class GraphCheckpointWrite(Base):
+    """LangGraph 체크포인트 pending writes"""
+    __tablename__ = "graph_checkpoint_writes"
+
+    thread_id = Column(Text, primary_key=True)
+    checkpoint_ns = Column(Text, primary_key=True, server_default="")
+    checkpoint_id = Column(Text, primary_key=True)
+    task_id = Column(Text, primary_key=True)
+    idx = Column(Integer, primary_key=True, autoincrement=False)
+    channel = Column(Text, nullable=False)
+    type = Column(Text, nullable=False)
+    value = Column(LargeBinary, nullable=False)
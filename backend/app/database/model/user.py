@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.sql import func
 from app.database.session import Base
 
@@ -8,4 +8,9 @@ class User(Base):
     
     email = Column(String(255), index=True, primary_key=True)
     name = Column(String(255), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        # 목록 조회 정렬 (created_at DESC, email DESC) 및 keyset 페이지네이션용
+        Index("ix_user_created_at_email", created_at.desc(), email.desc()),
+    )
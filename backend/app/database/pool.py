@@ -0,0 +1,58 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.core.logger import get_logger
+from app.core.metrics import DB_POOL_CHECKOUT_TIMEOUTS_TOTAL, DB_POOL_CHECKOUT_WAIT_SECONDS
+
+logger = get_logger("database.pool")
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간/타임아웃을 기록하는 커넥션 풀
+
+    create_async_engine(..., poolclass=InstrumentedAsyncQueuePool) 로 사용합니다.
+    대기 시간은 풀에서 커넥션을 얻기까지의 시간이며, 새 커넥션 생성과 pre-ping 시간을 포함합니다.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+
+        # 카운터
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            DB_POOL_CHECKOUT_TIMEOUTS_TOTAL.inc()
+            logger.bind(
+                size=self.size(),
+                overflow=self.overflow(),
+                checked_out=self.checkedout(),
+                timeout=self.timeout(),
+            ).warning("DB 커넥션 풀 체크아웃 타임아웃")
+            raise
+
+        elapsed = time.perf_counter() - start
+        self.checkouts += 1
+        self.wait_seconds_total += elapsed
+        self.wait_seconds_max = max(self.wait_seconds_max, elapsed)
+        DB_POOL_CHECKOUT_WAIT_SECONDS.observe(elapsed)
+        return connection
+
+    def get_stats(self) -> Dict[str, float]:
+        """체크아웃 카운터 반환"""
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
@@ -0,0 +1,201 @@
+"""
+SQL 프로파일링
+
+SQLAlchemy 엔진의 before/after_cursor_execute 이벤트로 모든 statement 실행 시간을 측정합니다.
+- 정규화한 statement fingerprint(리터럴/바인드 파라미터 → ?) 별로 실행 수, 누적/최대 시간 집계
+- 임계값(SQL_SLOW_QUERY_MS) 이상 걸린 statement 는 요청 ID 와 함께 warning 로그
+- 요청 단위 집계(쿼리 수, DB 시간)는 ContextVar 로 추적해 접근 로그에 포함
+- 한 요청에서 같은 fingerprint 가 SQL_N_PLUS_ONE_THRESHOLD 회를 넘으면 N+1 의심으로 warning 로그
+
+이벤트 훅은 greenlet 안에서 동기로 실행되지만, SQLAlchemy 가 호출한 태스크의 컨텍스트를 그대로 사용하므로
+요청 ContextVar 를 읽을 수 있습니다.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.setting import settings
+from app.core.logger import get_logger
+from app.core.metrics import DB_QUERY_DURATION_SECONDS
+
+logger = get_logger("database.profiling")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_PARAM_LISTS = re.compile(r"\(\?\+\)(?:\s*,\s*\(\?\+\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+MAX_STATEMENT_LOG_LENGTH = 1000
+OTHER_FINGERPRINT = "<other>"
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """
+    statement 를 정규화한 fingerprint 반환
+
+    리터럴/바인드 파라미터는 ?, IN 목록과 다중 VALUES 는 (?+) 로 묶어 파라미터 개수와 무관하게 같은 값이 됩니다.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _PARAM_LIST.sub("(?+)", normalized)
+    return _REPEATED_PARAM_LISTS.sub("(?+)", normalized)
+
+
+@dataclass
+class StatementStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+@dataclass
+class RequestProfile:
+    """요청 단위 SQL 집계"""
+    request_id: Optional[str] = None
+    query_count: int = 0
+    db_seconds: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.db_seconds * 1000, 3)
+
+
+# 현재 요청의 SQL 집계 (요청 밖에서는 None)
+_request_profile: ContextVar[Optional[RequestProfile]] = ContextVar("sql_request_profile", default=None)
+
+
+class SQLProfiler:
+    """엔진 이벤트 기반 SQL 프로파일러
+
+    - 전역 집계는 fingerprint 최대 max_fingerprints 개까지 유지하고, 초과분은 <other> 로 합침
+    - n_plus_one_threshold 가 0 이면 N+1 감지 비활성화
+    """
+
+    def __init__(
+        self,
+        slow_query_ms: float = settings.SQL_SLOW_QUERY_MS,
+        n_plus_one_threshold: int = settings.SQL_N_PLUS_ONE_THRESHOLD,
+        max_fingerprints: int = settings.SQL_PROFILE_MAX_FINGERPRINTS,
+    ):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_fingerprints = max_fingerprints
+        self.statements: Dict[str, StatementStats] = {}
+
+        # 카운터
+        self.queries = 0
+        self.slow_queries = 0
+        self.n_plus_one = 0
+
+    def install(self, engine: AsyncEngine) -> None:
+        """엔진에 실행 시간 측정 이벤트 등록"""
+        sync_engine = engine.sync_engine
+        if event.contains(sync_engine, "after_cursor_execute", self._after_cursor_execute):
+            return
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._profile_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = getattr(context, "_profile_start", None)
+        if start is None:
+            return
+        self.record(statement, time.perf_counter() - start)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """statement 1회 실행 시간 기록"""
+        key = fingerprint(statement)
+        stats = self.statements.get(key)
+        if stats is None:
+            if len(self.statements) >= self.max_fingerprints:
+                key = OTHER_FINGERPRINT
+            stats = self.statements.setdefault(key, StatementStats())
+        stats.count += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        self.queries += 1
+        DB_QUERY_DURATION_SECONDS.observe(elapsed)
+
+        profile = _request_profile.get()
+        if profile is not None:
+            profile.query_count += 1
+            profile.db_seconds += elapsed
+            profile.fingerprints[key] += 1
+
+        if elapsed >= self.slow_query_seconds:
+            self.slow_queries += 1
+            logger.bind(
+                request_id=profile.request_id if profile else None,
+                duration_ms=round(elapsed * 1000, 3),
+                fingerprint=key,
+                statement=statement[:MAX_STATEMENT_LOG_LENGTH],
+            ).warning("느린 쿼리")
+
+    @contextmanager
+    def track_request(self, request_id: Optional[str] = None) -> Iterator[RequestProfile]:
+        """with 블록 동안 실행된 SQL 을 요청 단위로 집계 (종료 시 N+1 의심 패턴 로그)"""
+        profile = RequestProfile(request_id=request_id)
+        token = _request_profile.set(profile)
+        try:
+            yield profile
+        finally:
+            _request_profile.reset(token)
+            self._check_n_plus_one(profile)
+
+    def _check_n_plus_one(self, profile: RequestProfile) -> None:
+        if self.n_plus_one_threshold <= 0:
+            return
+        for key, count in profile.fingerprints.items():
+            if count > self.n_plus_one_threshold:
+                self.n_plus_one += 1
+                logger.bind(
+                    request_id=profile.request_id,
+                    fingerprint=key,
+                    count=count,
+                    threshold=self.n_plus_one_threshold,
+                ).warning("N+1 의심 쿼리 패턴")
+
+    def get_top(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """누적 실행 시간 상위 fingerprint 목록"""
+        top = sorted(self.statements.items(), key=lambda item: item[1].total_seconds, reverse=True)[:limit]
+        return [
+            {
+                "fingerprint": key,
+                "count": stats.count,
+                "total_ms": round(stats.total_seconds * 1000, 3),
+                "avg_ms": round(stats.total_seconds * 1000 / stats.count, 3),
+                "max_ms": round(stats.max_seconds * 1000, 3),
+            }
+            for key, stats in top
+        ]
+
+    def get_stats(self) -> Dict[str, int]:
+        """프로파일러 카운터 반환"""
+        return {
+            "queries": self.queries,
+            "slow_queries": self.slow_queries,
+            "n_plus_one": self.n_plus_one,
+            "fingerprints": len(self.statements),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_sql_profiler() -> SQLProfiler:
+    """SQL 프로파일러 싱글톤 인스턴스를 반환합니다."""
+    return SQLProfiler()
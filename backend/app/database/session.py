@@ -1,36 +1,224 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from enum import Enum
+from sqlalchemy import exc as sa_exc
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, AsyncSession, AsyncSessionTransaction
 from functools import wraps
 
+from app.config.setting import settings
+from app.core.logger import get_logger
+
 """
 RDB
 """
 
+logger = get_logger("database.session")
+
+class Propagation(str, Enum):
+    """트랜잭션 전파 방식"""
+    REQUIRED = "required"          # 진행 중인 트랜잭션에 참여, 없으면 새로 시작
+    REQUIRES_NEW = "requires_new"  # 항상 새 세션/커넥션으로 독립 트랜잭션 시작
+    NESTED = "nested"              # 진행 중인 트랜잭션 안에서 SAVEPOINT, 없으면 새로 시작
+
+
+@dataclass
+class _TransactionFrame:
+    session: AsyncSession
+    owner: bool                                        # 세션을 연 쪽 (커밋/롤백/종료 담당)
+    savepoint: Optional[AsyncSessionTransaction] = None
+    parent: Optional["_TransactionFrame"] = None
+    token: Any = None
+    read_only: bool = False
+    replica: bool = False                              # replica 세션 여부
+
+
+# 현재 태스크(요청)의 진행 중인 트랜잭션
+_current_frame: ContextVar[Optional[_TransactionFrame]] = ContextVar("current_transaction", default=None)
+
+# 현재 태스크(요청)에서 마지막으로 쓰기 트랜잭션을 커밋한 시각 (read-your-writes)
+_last_write_at: ContextVar[Optional[float]] = ContextVar("last_write_at", default=None)
+
+# replica 연결 실패 후 다시 시도할 시각 (replica 세션 팩토리별)
+_replica_retry_at: Dict[async_sessionmaker, float] = {}
+
+_read_routing_stats = {"replica": 0, "primary": 0, "sticky": 0, "fallback": 0}
+
+
+def get_read_routing_stats() -> Dict[str, int]:
+    """읽기 전용 트랜잭션 라우팅 카운터 (메트릭/헬스체크용)"""
+    return dict(_read_routing_stats)
+
+
+def get_current_session() -> Optional[AsyncSession]:
+    """진행 중인 트랜잭션의 세션 (없으면 None)"""
+    frame = _current_frame.get()
+    return frame.session if frame else None
+
+
 class UnitOfWork:
-    def __init__(self, session: async_sessionmaker):
+    """
+    트랜잭션 경계
+
+    진행 중인 세션은 ContextVar 로 전파되므로 같은 요청(태스크) 안에서 중첩된 UnitOfWork/@transactional 은
+    propagation 에 따라 같은 세션에 참여하거나(REQUIRED), SAVEPOINT 를 만들거나(NESTED),
+    별도 세션을 엽니다(REQUIRES_NEW). 논리적 트랜잭션 하나당 커넥션은 한 번만 체크아웃됩니다.
+
+    참여한 쪽에서 발생한 예외는 그대로 전파되며, 커밋/롤백은 세션을 연 가장 바깥 쪽에서 한 번만 수행합니다.
+
+    read_only 트랜잭션이 새 세션을 열 때 replica 세션 팩토리가 있으면 replica 로 보냅니다.
+    - 같은 요청에서 쓰기 트랜잭션을 커밋한 뒤 sticky_seconds 동안은 primary 로 읽음 (read-your-writes)
+    - replica 연결 실패 시 primary 로 대체하고 replica_retry_seconds 동안 replica 를 건너뜀
+    - 진행 중인 트랜잭션에 참여하는 경우(REQUIRED/NESTED)는 그 세션을 그대로 사용
+    """
+
+    def __init__(
+        self,
+        session: async_sessionmaker,
+        propagation: Propagation = Propagation.REQUIRED,
+        replica: Optional[async_sessionmaker] = None,
+        read_only: bool = False,
+        sticky_seconds: float = settings.POSTGRES_READ_YOUR_WRITES_SECONDS,
+        replica_retry_seconds: float = settings.POSTGRES_REPLICA_RETRY_SECONDS,
+    ):
         self.session_factory = session
+        self.propagation = propagation
+        self.replica_factory = replica
+        self.read_only = read_only
+        self.sticky_seconds = sticky_seconds
+        self.replica_retry_seconds = replica_retry_seconds
+
+    def propagate(self, propagation: Propagation, read_only: bool = False) -> "UnitOfWork":
+        """같은 세션 팩토리를 쓰는 다른 전파 방식(읽기 전용 여부)의 UnitOfWork"""
+        return UnitOfWork(
+            self.session_factory,
+            propagation,
+            replica=self.replica_factory,
+            read_only=read_only,
+            sticky_seconds=self.sticky_seconds,
+            replica_retry_seconds=self.replica_retry_seconds,
+        )
+
+    @property
+    def session(self) -> AsyncSession:
+        """진행 중인 트랜잭션의 세션 (트랜잭션 밖에서 접근하면 RuntimeError)"""
+        session = get_current_session()
+        if session is None:
+            raise RuntimeError("No active transaction")
+        return session
 
     async def __aenter__(self):
-        self.session = self.session_factory()
-        return self.session
+        parent = _current_frame.get()
+        if parent is None or self.propagation == Propagation.REQUIRES_NEW:
+            frame = await self._open_frame(parent)
+        elif parent.replica and not self.read_only:
+            raise RuntimeError("Cannot write inside a read-only replica transaction")
+        elif self.propagation == Propagation.NESTED:
+            savepoint = await parent.session.begin_nested()
+            frame = _TransactionFrame(session=parent.session, owner=False, savepoint=savepoint, parent=parent)
+        else:
+            frame = _TransactionFrame(session=parent.session, owner=False, parent=parent)
+
+        frame.token = _current_frame.set(frame)
+        return frame.session
+
+    async def _open_frame(self, parent: Optional[_TransactionFrame]) -> _TransactionFrame:
+        if not self.read_only or self.replica_factory is None:
+            return _TransactionFrame(session=self.session_factory(), owner=True, parent=parent, read_only=self.read_only)
+
+        last_write_at = _last_write_at.get()
+        if last_write_at is not None and time.monotonic() - last_write_at < self.sticky_seconds:
+            _read_routing_stats["sticky"] += 1
+            return _TransactionFrame(session=self.session_factory(), owner=True, parent=parent, read_only=True)
+
+        if time.monotonic() < _replica_retry_at.get(self.replica_factory, 0.0):
+            _read_routing_stats["primary"] += 1
+            return _TransactionFrame(session=self.session_factory(), owner=True, parent=parent, read_only=True)
+
+        session = self.replica_factory()
+        try:
+            # 연결 실패를 여기서 확인하기 위해 커넥션을 미리 체크아웃
+            await session.connection()
+        except (sa_exc.DBAPIError, sa_exc.TimeoutError, OSError) as e:
+            await session.close()
+            _replica_retry_at[self.replica_factory] = time.monotonic() + self.replica_retry_seconds
+            _read_routing_stats["fallback"] += 1
+            logger.bind(error=str(e), retry_seconds=self.replica_retry_seconds).warning("replica 연결 실패, primary 로 대체")
+            return _TransactionFrame(session=self.session_factory(), owner=True, parent=parent, read_only=True)
+
+        _read_routing_stats["replica"] += 1
+        return _TransactionFrame(session=session, owner=True, parent=parent, read_only=True, replica=True)
 
     async def __aexit__(self, exc_type, exc, tb):
-        if exc:
-            await self.session.rollback()
-        else:
-            await self.session.commit()
-        await self.session.close()
+        # async with 는 태스크 안에서 엄격히 중첩되므로 현재 frame 이 이 블록에서 연 frame
+        frame = _current_frame.get()
+        try:
+            if frame.savepoint is not None:
+                if exc:
+                    await frame.savepoint.rollback()
+                else:
+                    await frame.savepoint.commit()
+            elif frame.owner:
+                try:
+                    if exc:
+                        await frame.session.rollback()
+                    else:
+                        await frame.session.commit()
+                        if not frame.read_only:
+                            _last_write_at.set(time.monotonic())
+                finally:
+                    await frame.session.close()
+        finally:
+            try:
+                _current_frame.reset(frame.token)
+            except ValueError:
+                # 다른 컨텍스트에서 종료되는 경우 (예: 다른 태스크에서 닫힌 async generator)
+                _current_frame.set(frame.parent)
+
 
+def transactional(fn=None, *, propagation: Propagation = Propagation.REQUIRED, read_only: bool = False):
+    """
+    self.uow 트랜잭션 안에서 메서드 실행 (@transactional 또는 @transactional(propagation=..., read_only=...))
 
-def transactional(fn):
-    @wraps(fn)  
-    async def wrapper(self, *args, **kwargs):
-        async with self.uow as session:
-            return await fn(self, *args, **kwargs)
-    return wrapper
+    메서드 안에서는 self.uow.session 으로 현재 세션을 사용합니다.
+    read_only=True 인 조회 메서드는 replica 가 설정되어 있으면 replica 로 라우팅됩니다.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            if propagation == Propagation.REQUIRED and not read_only:
+                uow = self.uow
+            else:
+                uow = self.uow.propagate(propagation, read_only=read_only)
+            async with uow:
+                return await fn(self, *args, **kwargs)
+        return wrapper
+
+    if fn is not None:
+        return decorator(fn)
+    return decorator
 
 Base = declarative_base()
 
+
+def get_engine_pool_stats(engine: AsyncEngine) -> dict:
+    """커넥션 풀 상태 (메트릭/헬스체크용)"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {}
+    stats = {
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if hasattr(pool, "get_stats"):
+        stats.update(pool.get_stats())
+    return stats
+
 """
 NoSQL
 """
@@ -39,7 +227,6 @@ from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from beanie import init_beanie
 
-from app.config.setting import settings
 from app.database.model.log import Log
 
 class MongoDB:
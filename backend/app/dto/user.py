@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, EmailStr
 
 
@@ -38,4 +38,19 @@ class UserUpdateDTO(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="사용자 이름")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class UserImportErrorDTO(BaseModel):
+    """User Import 실패 행"""
+    line: int = Field(..., description="입력 줄 번호 (1부터)")
+    error: str = Field(..., description="실패 사유")
+
+
+class UserImportResultDTO(BaseModel):
+    """User Import 결과"""
+    total: int = Field(0, description="처리한 행 수")
+    inserted: int = Field(0, description="생성된 사용자 수")
+    failed: int = Field(0, description="실패한 행 수 (검증 실패 + 중복)")
+    errors: List[UserImportErrorDTO] = Field(default_factory=list, description="실패 행 목록 (최대 개수까지만 포함)")
+    errors_truncated: bool = Field(False, description="실패 행 목록이 잘렸는지 여부")
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
@@ -12,13 +12,26 @@ from app.middleware.tracking import (
     SecurityHeadersMiddleware
 )
 from app.middleware.auth import BearerTokenAuthMiddleware
+from app.middleware.metrics import PrometheusMetricsMiddleware
 from app.core.exception.handler import register_exception_handlers
-from app.database.session import init_mongodb, close_mongodb
-from app.core.redis import get_redis_client, close_redis
+from app.database.session import init_mongodb, close_mongodb, get_engine_pool_stats, get_read_routing_stats
+from app.database.profiling import get_sql_profiler
+from app.core.redis import RedisClient, get_redis_client, close_redis
+from app.core.metrics import (
+    generate_metrics,
+    mark_process_dead,
+    register_stats_collector,
+    unregister_collectors,
+)
+from app.core.log_writer import get_api_log_writer
+from app.core.cache import get_user_cache
+from app.core.counter import get_user_counter
 from app.core.llm_manager import get_llm_manager
 from app.core.chroma_manager import get_chroma_manager
 from app.core.graph.example.graph_orchestrator import get_example_graph
+from app.core.scheduler import get_scheduler
 from app.api.v1.router import api_router
+from app.api.v1.agent.realtime import socketio_app
 from app.container import Container
 
 
@@ -33,6 +46,10 @@ async def lifespan(app: FastAPI):
     await init_mongodb()
     logger.info("MongoDB 연결 완료")
     
+    # API 로그 writer 시작
+    api_log_writer = get_api_log_writer()
+    await api_log_writer.start()
+    
     # Redis 초기화
     redis_client = await get_redis_client()
     try:
@@ -42,6 +59,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"Redis 연결 실패: {e}")
         raise
     
+    # 사용자 캐시 무효화 구독 시작
+    if settings.USER_CACHE_ENABLED:
+        await get_user_cache().start()
+    
     # LLM 초기화
     llm_manger = get_llm_manager()
     if llm_manger.initialize():
@@ -59,9 +80,65 @@ async def lifespan(app: FastAPI):
         logger.warning("ChromaDB 초기화 실패 - 기능이 제한될 수 있습니다")
     
     example_graph = get_example_graph()
-    await example_graph.initialize()
+    await example_graph.initialize(engine=app.container.engine())
     logger.info("Agent 초기화 성공")
     
+    # 주기 작업 시작 (체크포인트 정리, 응답 캐시 만료 삭제, 임베딩 캐시 정리)
+    scheduler = get_scheduler()
+    scheduler.add_job(
+        example_graph.checkpoint_maintainer.run,
+        "interval",
+        seconds=settings.GRAPH_CHECKPOINT_MAINTENANCE_INTERVAL,
+        id="example-graph-checkpoint-maintenance",
+        replace_existing=True,
+    )
+    if example_graph.response_cache:
+        scheduler.add_job(
+            example_graph.response_cache.purge,
+            "interval",
+            seconds=settings.RESPONSE_CACHE_PURGE_INTERVAL,
+            id="example-graph-response-cache-purge",
+            replace_existing=True,
+        )
+    if chroma_manager.embedding_cache:
+        scheduler.add_job(
+            chroma_manager.embedding_cache.aprune,
+            "interval",
+            seconds=settings.EMBEDDING_CACHE_PRUNE_INTERVAL,
+            id="embedding-cache-prune",
+            replace_existing=True,
+        )
+    scheduler.start()
+    
+    # SQL 실행 시간 측정 훅 등록
+    if settings.SQL_PROFILING_ENABLED:
+        get_sql_profiler().install(app.container.engine())
+        if settings.POSTGRES_REPLICA_URL:
+            get_sql_profiler().install(app.container.replica_engine())
+    
+    # 메트릭 collector 등록 (scrape 시점에 풀/매니저 상태 조회)
+    if settings.METRICS_ENABLED:
+        engine = app.container.engine()
+        register_stats_collector("db_pool_connections", "PostgreSQL 커넥션 풀 상태", lambda: get_engine_pool_stats(engine))
+        if settings.POSTGRES_REPLICA_URL:
+            replica_engine = app.container.replica_engine()
+            register_stats_collector("db_replica_pool_connections", "PostgreSQL replica 커넥션 풀 상태", lambda: get_engine_pool_stats(replica_engine))
+            register_stats_collector("db_read_routing", "읽기 전용 트랜잭션 라우팅 카운터", get_read_routing_stats, label="target")
+        register_stats_collector("redis_pool_connections", "Redis 커넥션 풀 상태", RedisClient.get_pool_stats)
+        register_stats_collector("chroma_manager_state", "ChromaDB 매니저 상태", chroma_manager.get_stats)
+        register_stats_collector("embedding_cache_events", "임베딩 캐시 카운터", chroma_manager.get_embedding_cache_stats)
+        register_stats_collector("search_cache_events", "벡터 검색 결과 캐시 카운터", chroma_manager.get_search_cache_stats)
+        register_stats_collector("api_log_writer_records", "API 로그 writer 카운터", api_log_writer.get_stats)
+        register_stats_collector("graph_checkpoint_maintenance", "에이전트 체크포인트 정리 카운터", example_graph.checkpoint_maintainer.get_stats)
+        if example_graph.response_cache:
+            register_stats_collector("graph_response_cache_events", "에이전트 시맨틱 응답 캐시 카운터", example_graph.response_cache.get_stats)
+        if settings.USER_CACHE_ENABLED:
+            register_stats_collector("user_cache_events", "사용자 조회 캐시 카운터", get_user_cache().get_stats)
+        register_stats_collector("user_count_cache_events", "사용자 수 카운트 캐시 카운터", get_user_counter().get_stats)
+        if settings.SQL_PROFILING_ENABLED:
+            register_stats_collector("sql_profiler_events", "SQL 프로파일러 카운터", get_sql_profiler().get_stats)
+        logger.info("메트릭 collector 등록 완료")
+    
     logger.bind(
         app_title=app.title,
         app_version=app.version,
@@ -70,10 +147,17 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # 종료 시 정리
+    # 종료 시 정리 (주기 작업 중지, 남은 API 로그 flush 후 MongoDB 종료)
+    scheduler.shutdown(wait=False)
+    
+    await api_log_writer.stop()
+    
     await close_mongodb()
     logger.info("MongoDB 연결 종료")
     
+    if settings.USER_CACHE_ENABLED:
+        await get_user_cache().stop()
+    
     await close_redis()
     logger.info("Redis 연결 종료")
     
@@ -81,6 +165,10 @@ async def lifespan(app: FastAPI):
     await example_graph.cleanup()
     logger.info("Agent 연결 종료")
     
+    if settings.METRICS_ENABLED:
+        unregister_collectors()
+        mark_process_dead()
+    
     logger.info("애플리케이션 종료")
 
 
@@ -114,6 +202,8 @@ def create_app() -> FastAPI:
     app.add_middleware(ErrorTrackingMiddleware)
     app.add_middleware(BearerTokenAuthMiddleware)  # 인증 미들웨어 추가
     app.add_middleware(RequestIDMiddleware)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(PrometheusMetricsMiddleware)
     logger.debug("미들웨어 등록 완료")
     
     app.add_middleware(
@@ -129,6 +219,7 @@ def create_app() -> FastAPI:
     logger.debug("예외 핸들러 등록 완료")
   
     app.include_router(api_router, prefix="/api/v1")
+    app.mount("/socket.io", socketio_app)
     logger.debug("API 라우터 등록 완료")
  
     @app.get("/health", tags=["health"])
@@ -147,10 +238,29 @@ def create_app() -> FastAPI:
         except Exception as e:
             health_status["services"]["redis"] = f"unhealthy: {str(e)}"
             health_status["status"] = "degraded"
+        
+        health_status["api_log"] = get_api_log_writer().get_stats()
+        health_status["db_pool"] = get_engine_pool_stats(app.container.engine())
+        if settings.POSTGRES_REPLICA_URL:
+            health_status["db_replica_pool"] = get_engine_pool_stats(app.container.replica_engine())
+            health_status["db_read_routing"] = get_read_routing_stats()
+        if settings.SQL_PROFILING_ENABLED:
+            health_status["sql_profile"] = {
+                **get_sql_profiler().get_stats(),
+                "top": get_sql_profiler().get_top(5),
+            }
+        if settings.USER_CACHE_ENABLED:
+            health_status["user_cache"] = get_user_cache().get_stats()
             
         logger.bind(**health_status).debug("헬스 체크")
         return health_status
     
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", tags=["metrics"], include_in_schema=False)
+        async def metrics():
+            content, content_type = generate_metrics()
+            return Response(content=content, media_type=content_type)
+    
     logger.bind(
         host=settings.HOST,
         port=settings.PORT,
@@ -0,0 +1,73 @@
+import time
+from typing import Dict, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    HTTP_REQUESTS_TOTAL,
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+
+class PrometheusMetricsMiddleware:
+    """요청 지연/상태 코드/in-flight 메트릭 수집 미들웨어
+
+    - 라우트 라벨은 raw path 가 아닌 라우트 템플릿 (/api/v1/user/test/{email})
+    - 매칭되지 않은 요청은 카디널리티 폭증을 막기 위해 하나의 라벨로 묶음
+    - 라벨별 child 메트릭을 캐시해서 요청당 labels() 조회 비용 제거
+    """
+
+    UNMATCHED_ROUTE = "<unmatched>"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._counters: Dict[Tuple[str, str, int], object] = {}
+        self._histograms: Dict[Tuple[str, str], object] = {}
+        self._gauges: Dict[str, object] = {}
+
+    @classmethod
+    def _get_route(cls, scope: Scope) -> str:
+        # 라우터가 매칭 시 scope["route"] 를 채움 (include_router prefix 포함 전체 경로)
+        route = scope.get("route")
+        return getattr(route, "path", None) or cls.UNMATCHED_ROUTE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        gauge = self._gauges.get(method)
+        if gauge is None:
+            gauge = self._gauges[method] = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        gauge.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            elapsed = time.perf_counter() - start_time
+            gauge.dec()
+
+            route = self._get_route(scope)
+
+            histogram = self._histograms.get((method, route))
+            if histogram is None:
+                histogram = self._histograms[(method, route)] = HTTP_REQUEST_DURATION_SECONDS.labels(method, route)
+            histogram.observe(elapsed)
+
+            counter = self._counters.get((method, route, status_code))
+            if counter is None:
+                counter = self._counters[(method, route, status_code)] = HTTP_REQUESTS_TOTAL.labels(method, route, str(status_code))
+            counter.inc()
@@ -1,155 +1,193 @@
+"""
+요청 추적 미들웨어
+
+BaseHTTPMiddleware는 요청마다 태스크 그룹을 만들고 응답 body 스트림을 다시 감싸기 때문에
+모든 미들웨어를 순수 ASGI로 구현합니다.
+- scope / send 를 직접 다루고, 헤더는 http.response.start 메시지에서 추가
+- 스트리밍 응답도 버퍼링 없이 그대로 전달됨
+"""
 import uuid
 import time
+from contextlib import nullcontext
 from typing import Callable, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders, Headers, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.config.setting import settings
 from app.core.logger import get_logger
-from app.repository.log import LogRepository
+from app.core.log_writer import get_api_log_writer
+from app.database.profiling import get_sql_profiler
+
+
+def get_scope_state(scope: Scope) -> dict:
+    """request.state 가 참조하는 scope 상태 dict 반환"""
+    return scope.setdefault("state", {})
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+def get_client_host(scope: Scope) -> Optional[str]:
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+class RequestIDMiddleware:
     """요청 ID를 생성하고 추적하는 미들웨어"""
-    
+
     def __init__(
         self,
         app: ASGIApp,
         header_name: str = "X-Request-ID",
         generator: Optional[Callable[[], str]] = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.header_name = header_name
         self.generator = generator or self._default_generator
         self.logger = get_logger("middleware.request_tracking")
-    
+
     @staticmethod
     def _default_generator() -> str:
         """기본 요청 ID 생성기"""
         return str(uuid.uuid4())
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = request.headers.get(self.header_name) or self.generator()
-        
-        request.state.request_id = request_id
-        
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.header_name) or self.generator()
+
+        get_scope_state(scope)["request_id"] = request_id
+
         self.logger.bind(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path
+            method=scope["method"],
+            path=scope["path"]
         ).debug("요청 ID 할당됨")
-        
-        response = await call_next(request)
-        
-        response.headers[self.header_name] = request_id
-        
-        return response
 
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.header_name] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ErrorTrackingMiddleware:
+    """에러 추적 및 모니터링 미들웨어
+
+    SQL 프로파일링이 켜져 있으면 요청 처리 완료 로그에 쿼리 수(db_queries)와 DB 시간(db_time_ms)을 포함합니다.
+    """
 
-class ErrorTrackingMiddleware(BaseHTTPMiddleware):
-    """에러 추적 및 모니터링 미들웨어"""
-    
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = get_logger("middleware.error_tracking")
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        request_id = getattr(request.state, "request_id", "unknown")
-        
+        self.sql_profiler = get_sql_profiler() if settings.SQL_PROFILING_ENABLED else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        request_id = get_scope_state(scope).get("request_id", "unknown")
+
         req_logger = self.logger.bind(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_host=request.client.host if request.client else None
+            method=scope["method"],
+            path=scope["path"],
+            client_host=get_client_host(scope)
         )
-        
+
         req_logger.bind(
-            query_params=dict(request.query_params),
-            user_agent=request.headers.get("user-agent")
+            query_params=dict(QueryParams(scope["query_string"])),
+            user_agent=Headers(scope=scope).get("user-agent")
         ).info("요청 처리 시작")
-        
-        try:
-            response = await call_next(request)
-            
-            process_time = time.time() - start_time
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            req_logger.bind(
-                status_code=response.status_code,
-                process_time=process_time
-            ).info("요청 처리 완료")
-            
-            return response
-            
-        except Exception:
-            # 에러 핸들러에서 잡음
-            raise
 
+        status_code = None
+        process_time = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                MutableHeaders(scope=message)["X-Process-Time"] = str(process_time)
+            await send(message)
+
+        tracking = self.sql_profiler.track_request(request_id) if self.sql_profiler else nullcontext()
+
+        # 예외는 에러 핸들러에서 잡음
+        with tracking as sql_profile:
+            await self.app(scope, receive, send_wrapper)
+
+        if sql_profile is not None:
+            req_logger = req_logger.bind(
+                db_queries=sql_profile.query_count,
+                db_time_ms=sql_profile.db_time_ms
+            )
+
+        req_logger.bind(
+            status_code=status_code,
+            process_time=process_time
+        ).info("요청 처리 완료")
+
+
+class MongoDBLoggingMiddleware:
+    """MongoDB에 API 호출 로그를 저장하는 미들웨어
+
+    저장은 ApiLogWriter 큐에 적재만 하고, 실제 insert는 백그라운드에서 일괄 처리됨
+    """
 
-class MongoDBLoggingMiddleware(BaseHTTPMiddleware):
-    """MongoDB에 API 호출 로그를 저장하는 미들웨어"""
-    
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = get_logger("middleware.mongodb_logging")
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
+        self.log_writer = get_api_log_writer()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
-            response_time = (time.time() - start_time) * 1000
-            
-            client_host = request.client.host if request.client else None
-            
-            user_id = getattr(request.state, "user_id", None)
-            
-            try:
-                await LogRepository.create(
-                    called_api=request.url.path,
-                    method=request.method,
-                    status_code=response.status_code,
-                    user_id=user_id,
-                    response_time=response_time,
-                    ip_address=client_host
-                )
-            except Exception as e:
-                self.logger.bind(
-                    error=str(e),
-                    api_path=request.url.path
-                ).error("MongoDB 로그 저장 실패")
-            
-            return response
-            
-        except Exception as e:
-            response_time = (time.time() - start_time) * 1000
-            client_host = request.client.host if request.client else None
-            
-            try:
-                await LogRepository.create(
-                    called_api=request.url.path,
-                    method=request.method,
-                    status_code=500,
-                    response_time=response_time,
-                    ip_address=client_host
-                )
-            except Exception as log_error:
-                self.logger.bind(
-                    error=str(log_error),
-                    api_path=request.url.path
-                ).error("MongoDB 에러 로그 저장 실패")
-            
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status_code = 500
             raise
+        finally:
+            response_time = (time.perf_counter() - start_time) * 1000
+
+            await self.log_writer.write(
+                called_api=scope["path"],
+                method=scope["method"],
+                status_code=status_code,
+                user_id=get_scope_state(scope).get("user_id"),
+                response_time=response_time,
+                ip_address=get_client_host(scope)
+            )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """보안 헤더 추가 미들웨어"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        return response
\ No newline at end of file
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Content-Type-Options"] = "nosniff"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -28,7 +28,15 @@ class LogRepository:
         )
         await log.insert()
         return log
-    
+
+    @staticmethod
+    async def create_many(logs: List[Log]) -> int:
+        """여러 로그를 한 번의 insert_many로 저장"""
+        if not logs:
+            return 0
+        await Log.insert_many(logs)
+        return len(logs)
+
     @staticmethod
     async def find_by_id(log_id: PydanticObjectId) -> Optional[Log]:
         """ID로 로그 조회"""
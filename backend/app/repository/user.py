@@ -1,32 +1,111 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, delete, func, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.database.model.user import User
 from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO
 
 
+# 대량 생성용 임시 staging 테이블 (트랜잭션 종료 시 삭제)
+_STAGING_TABLE = "user_import_staging"
+
+_CREATE_STAGING_SQL = text(f"""
+    CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+        line integer NOT NULL,
+        email varchar(255) NOT NULL,
+        name varchar(255) NOT NULL
+    ) ON COMMIT DROP
+""")
+
+# staging -> user 병합 후 생성되지 않은 행(기존 사용자 또는 파일 내 중복)의 줄 번호 반환
+_MERGE_STAGING_SQL = text(f"""
+    WITH inserted AS (
+        INSERT INTO "user" (email, name)
+        SELECT DISTINCT ON (email) email, name FROM {_STAGING_TABLE} ORDER BY email, line
+        ON CONFLICT (email) DO NOTHING
+        RETURNING email
+    )
+    SELECT s.line FROM (
+        SELECT line, email, row_number() OVER (PARTITION BY email ORDER BY line) AS rn
+        FROM {_STAGING_TABLE}
+    ) s
+    WHERE s.rn > 1 OR NOT EXISTS (SELECT 1 FROM inserted i WHERE i.email = s.email)
+    ORDER BY s.line
+""")
+
+
 class UserRepository:
     """User Repository"""
     
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, user_data: UserCreateDTO) -> UserDTO:
-        """사용자 생성"""
-        try:
-            user = User(
-                email=user_data.email,
-                name=user_data.name
-            )
-            self.session.add(user)
-            await self.session.flush()
-            await self.session.refresh(user)
-            return UserDTO.from_orm(user)
-        except IntegrityError:
-            await self.session.rollback()
-            raise ValueError(f"User with email {user_data.email} already exists")
+    async def create(self, user_data: UserCreateDTO) -> Optional[UserDTO]:
+        """사용자 생성 (INSERT ... ON CONFLICT DO NOTHING RETURNING 1회, 이미 존재하면 None)"""
+        result = await self.session.execute(
+            self._insert(User)
+            .values(email=user_data.email, name=user_data.name)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        user = result.scalar_one_or_none()
+        return UserDTO.from_orm(user) if user else None
+
+    async def bulk_create(self, rows: List[Tuple[int, str, str]]) -> List[int]:
+        """
+        사용자 대량 생성 (이미 존재하는 이메일은 건너뜀)
+
+        Args:
+            rows: (줄 번호, email, name) 목록
+
+        Returns:
+            List[int]: 생성되지 않은 행의 줄 번호 (기존 사용자 또는 rows 내 중복)
+        """
+        if not rows:
+            return []
+        if self.session.bind.dialect.name == "postgresql":
+            return await self._bulk_create_copy(rows)
+        return await self._bulk_create_values(rows)
+
+    async def _bulk_create_copy(self, rows: List[Tuple[int, str, str]]) -> List[int]:
+        """asyncpg COPY 로 staging 테이블에 적재 후 user 에 병합"""
+        await self.session.execute(_CREATE_STAGING_SQL)
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _STAGING_TABLE, records=rows, columns=["line", "email", "name"]
+        )
+        result = await self.session.execute(_MERGE_STAGING_SQL)
+        duplicate_lines = list(result.scalars().all())
+        await self.session.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
+        return duplicate_lines
+
+    async def _bulk_create_values(self, rows: List[Tuple[int, str, str]]) -> List[int]:
+        """다중 VALUES INSERT ... ON CONFLICT DO NOTHING (COPY 미지원 DB용)"""
+        result = await self.session.execute(
+            self._insert(User)
+            .values([{"email": email, "name": name} for _, email, name in rows])
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.email)
+        )
+        inserted = set(result.scalars().all())
+
+        duplicate_lines = []
+        for line, email, _ in rows:
+            if email in inserted:
+                inserted.discard(email)  # 같은 이메일의 이후 행은 중복
+            else:
+                duplicate_lines.append(line)
+        return duplicate_lines
+
+    def _insert(self, table):
+        """방언별 INSERT (ON CONFLICT 지원: PostgreSQL, SQLite)"""
+        if self.session.bind.dialect.name == "sqlite":
+            return sqlite_insert(table)
+        return pg_insert(table)
 
     async def get_by_email(self, email: str) -> Optional[UserDTO]:
         """이메일로 사용자 조회"""
@@ -42,13 +121,36 @@ class UserRepository:
             select(User)
             .offset(skip)
             .limit(limit)
-            .order_by(User.created_at.desc())
+            .order_by(User.created_at.desc(), User.email.desc())
         )
         users = result.scalars().all()
         return [UserDTO.from_orm(user) for user in users]
 
+    async def get_page_after(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[UserDTO]:
+        """keyset 페이지네이션 조회 (after 의 (created_at, email) 다음 행부터, ix_user_created_at_email 사용)"""
+        query = select(User).order_by(User.created_at.desc(), User.email.desc()).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(User.created_at, User.email) < tuple_(*after))
+        result = await self.session.execute(query)
+        users = result.scalars().all()
+        return [UserDTO.from_orm(user) for user in users]
+
+    async def stream_all(self, batch_size: int = 5000) -> AsyncIterator[Sequence[Tuple[str, str, datetime]]]:
+        """
+        전체 사용자를 (email, name, created_at) 행 묶음으로 스트리밍 조회
+        
+        서버 사이드 커서로 batch_size 씩 가져오며, ORM 객체를 만들지 않아 행 수와 무관하게 메모리가 일정합니다.
+        """
+        result = await self.session.stream(
+            select(User.email, User.name, User.created_at)
+            .order_by(User.created_at.desc(), User.email.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
     async def update(self, email: str, user_data: UserUpdateDTO) -> Optional[UserDTO]:
-        """사용자 정보 업데이트"""
+        """사용자 정보 업데이트 (UPDATE ... RETURNING 1회, 대상이 없으면 None)"""
         
         update_data = {k: v for k, v in user_data.model_dump().items() if v is not None}
         
@@ -65,7 +167,7 @@ class UserRepository:
         return UserDTO.from_orm(user) if user else None
 
     async def delete(self, email: str) -> bool:
-        """사용자 삭제"""
+        """사용자 삭제 (삭제된 행이 없으면 False)"""
         result = await self.session.execute(
             delete(User).where(User.email == email)
         )
@@ -82,4 +184,18 @@ class UserRepository:
     async def count_all(self) -> int:
         """전체 사용자 수 조회"""
         result = await self.session.execute(select(func.count(User.email)))
-        return result.scalar()
\ No newline at end of file
+        return result.scalar()
+
+    async def count_estimated(self) -> int:
+        """전체 사용자 수 근사치 조회 (PostgreSQL 통계 pg_class.reltuples, 그 외 DB 나 통계가 없으면 정확한 수)"""
+        if self.session.bind.dialect.name != "postgresql":
+            return await self.count_all()
+        result = await self.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": f'"{User.__tablename__}"'},
+        )
+        estimate = result.scalar()
+        # 한 번도 VACUUM/ANALYZE 되지 않은 테이블은 -1 (PG14+) 또는 0
+        if estimate is None or estimate <= 0:
+            return await self.count_all()
+        return estimate
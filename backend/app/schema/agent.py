@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class AgentQuestionRequest(BaseModel):
+    """에이전트 질문 요청 스키마"""
+    question: str = Field(..., min_length=1, description="질문", example="환불은 언제까지 가능한가요?")
+    session_id: str = Field(..., min_length=1, max_length=255, description="대화 세션 ID (대화 히스토리 thread_id)", example="session-1")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "question": "환불은 언제까지 가능한가요?",
+                "session_id": "session-1"
+            }
+        }
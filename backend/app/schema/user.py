@@ -52,7 +52,8 @@ class UserResponse(BaseModel):
 class UserListResponse(BaseModel):
     """User 목록 응답 스키마"""
     users: List[UserResponse] = Field(..., description="사용자 목록")
-    total: int = Field(..., description="전체 사용자 수")
+    total: Optional[int] = Field(None, description="전체 사용자 수 (count=estimated 면 근사치, count=none 이면 null)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (커서 페이징, 마지막 페이지면 null)")
 
     class Config:
         json_schema_extra = {
@@ -69,7 +70,37 @@ class UserListResponse(BaseModel):
                         "created_at": "2024-01-02T00:00:00"
                     }
                 ],
-                "total": 2
+                "total": 2,
+                "next_cursor": None
+            }
+        }
+
+
+class UserImportErrorResponse(BaseModel):
+    """User Import 실패 행 스키마"""
+    line: int = Field(..., description="입력 줄 번호 (1부터)")
+    error: str = Field(..., description="실패 사유")
+
+
+class UserImportResponse(BaseModel):
+    """User Import 응답 스키마"""
+    total: int = Field(..., description="처리한 행 수")
+    inserted: int = Field(..., description="생성된 사용자 수")
+    failed: int = Field(..., description="실패한 행 수 (검증 실패 + 중복)")
+    errors: List[UserImportErrorResponse] = Field(..., description="실패 행 목록")
+    errors_truncated: bool = Field(..., description="실패 행 목록이 잘렸는지 여부")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 3,
+                "inserted": 1,
+                "failed": 2,
+                "errors": [
+                    {"line": 2, "error": "email: value is not a valid email address"},
+                    {"line": 3, "error": "User already exists"}
+                ],
+                "errors_truncated": False
             }
         }
 
@@ -1,80 +1,244 @@
-from typing import List, Optional, Tuple
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.session import UnitOfWork, transactional
+from app.core.cache import TwoTierCache
+from app.core.counter import CachedCounter, CountMode
+from app.database.session import Propagation, UnitOfWork, transactional
 from app.repository.user import UserRepository
-from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO
+from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO, UserImportErrorDTO, UserImportResultDTO
+from app.util.cursor import encode_cursor, decode_cursor
+from app.util.record_io import iter_encoded, iter_records
 
 
 class UserService:
-    """User Service"""
+    """User Service
     
-    def __init__(self, uow: UnitOfWork = None):
+    조회 메서드는 read_only 트랜잭션이므로 replica 가 설정되어 있으면 replica 에서 읽습니다.
+    cache 가 주입되면 이메일 조회는 read-through, 생성/수정/삭제는 커밋 이후 캐시에 반영합니다.
+    counter 가 주입되면 목록의 정확한 전체 수는 Redis 에 캐시하고 생성/삭제 시 증감합니다.
+    """
+    
+    def __init__(
+        self,
+        uow: UnitOfWork = None,
+        cache: Optional[TwoTierCache[UserDTO]] = None,
+        counter: Optional[CachedCounter] = None,
+    ):
         self.uow = uow
+        self.cache = cache
+        self.counter = counter
 
-    @transactional
     async def create_user(self, user_data: UserCreateDTO) -> UserDTO:
         """사용자 생성"""
-        async with self.uow as session:
-            user_repo = UserRepository(session)
-            
-            existing_user = await user_repo.get_by_email(user_data.email)
-            if existing_user:
-                raise ValueError(f"User with email {user_data.email} already exists")
-            
-            return await user_repo.create(user_data)
+        user = await self._create_user(user_data)
+        if self.cache:
+            await self.cache.set(user.email, user)
+        if self.counter:
+            await self.counter.incr(1)
+        return user
+
+    @transactional
+    async def _create_user(self, user_data: UserCreateDTO) -> UserDTO:
+        return await self.create_user_with_session(self.uow.session, user_data)
 
     async def create_user_with_session(self, session: AsyncSession, user_data: UserCreateDTO) -> UserDTO:
         """사용자 생성 (컨트롤러 레벨 트랜잭션용)"""
         user_repo = UserRepository(session)
         
-        existing_user = await user_repo.get_by_email(user_data.email)
-        if existing_user:
+        created_user = await user_repo.create(user_data)
+        if not created_user:
             raise ValueError(f"User with email {user_data.email} already exists")
         
-        return await user_repo.create(user_data)
+        return created_user
+
+    async def import_users(
+        self,
+        chunks: AsyncIterator[bytes],
+        fmt: str = "ndjson",
+        batch_size: int = 5000,
+        max_errors: int = 1000,
+    ) -> UserImportResultDTO:
+        """
+        사용자 대량 생성 (NDJSON/CSV 스트림)
+        
+        행 단위로 검증하면서 batch_size 만큼 모이면 배치별 트랜잭션으로 적재합니다.
+        검증 실패/중복 행은 건너뛰고 결과에 줄 번호와 사유를 남깁니다. (최대 max_errors 건)
+        """
+        result = UserImportResultDTO()
+        batch: List[Tuple[int, str, str]] = []
+        
+        def add_error(line: int, error: str) -> None:
+            result.failed += 1
+            if len(result.errors) < max_errors:
+                result.errors.append(UserImportErrorDTO(line=line, error=error))
+            else:
+                result.errors_truncated = True
+        
+        async def flush() -> None:
+            duplicate_lines = await self._bulk_create(batch)
+            duplicates = set(duplicate_lines)
+            for line in duplicate_lines:
+                add_error(line, "User already exists")
+            
+            inserted = [email for line, email, _ in batch if line not in duplicates]
+            result.inserted += len(inserted)
+            if self.cache:
+                await self.cache.invalidate_many(inserted)
+            if self.counter:
+                await self.counter.incr(len(inserted))
+            batch.clear()
+        
+        async for line, record in iter_records(chunks, fmt):
+            result.total += 1
+            if isinstance(record, ValueError):
+                add_error(line, str(record))
+                continue
+            try:
+                user_data = UserCreateDTO.model_validate(record)
+            except ValidationError as e:
+                add_error(line, "; ".join(
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+                ))
+                continue
+            
+            batch.append((line, user_data.email, user_data.name))
+            if len(batch) >= batch_size:
+                await flush()
+        
+        if batch:
+            await flush()
+        
+        result.errors.sort(key=lambda error: error.line)
+        return result
+
+    @transactional(propagation=Propagation.REQUIRES_NEW)
+    async def _bulk_create(self, rows: List[Tuple[int, str, str]]) -> List[int]:
+        # 배치마다 커밋 (업로드 크기와 무관하게 트랜잭션/메모리 크기 유지)
+        return await UserRepository(self.uow.session).bulk_create(rows)
+
+    async def export_users(self, fmt: str = "ndjson", gzip: bool = False, batch_size: int = 5000) -> AsyncIterator[bytes]:
+        """
+        전체 사용자를 NDJSON/CSV 바이트 청크로 스트리밍 (응답 스트림이 끝날 때까지 세션 유지)
+        """
+        async with self.uow.propagate(Propagation.REQUIRES_NEW, read_only=True) as session:
+            rows = UserRepository(session).stream_all(batch_size=batch_size)
+            async for chunk in iter_encoded(rows, ("email", "name", "created_at"), fmt, gzip=gzip):
+                yield chunk
+
+    async def after_user_created(self, user: UserDTO) -> None:
+        """생성된 사용자를 캐시/카운터에 반영 (컨트롤러 레벨 트랜잭션 커밋 이후 호출)"""
+        if self.cache:
+            await self.cache.invalidate(user.email)
+        if self.counter:
+            await self.counter.incr(1)
 
-    @transactional
     async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
         """이메일로 사용자 조회"""
-        async with self.uow as session:
-            user_repo = UserRepository(session)
-            return await user_repo.get_by_email(email)
+        if self.cache:
+            return await self.cache.get_or_load(email, lambda: self._get_user_by_email(email))
+        return await self._get_user_by_email(email)
 
-    @transactional
-    async def get_all_users(self, skip: int = 0, limit: int = 100) -> Tuple[List[UserDTO], int]:
-        """모든 사용자 조회 (페이징 포함)"""
-        async with self.uow as session:
-            user_repo = UserRepository(session)
-            
-            users = await user_repo.get_all(skip=skip, limit=limit)
-            total = await user_repo.count_all()
-            
+    @transactional(read_only=True)
+    async def _get_user_by_email(self, email: str) -> Optional[UserDTO]:
+        user_repo = UserRepository(self.uow.session)
+        return await user_repo.get_by_email(email)
+
+    async def get_all_users(
+        self, skip: int = 0, limit: int = 100, count_mode: CountMode = CountMode.EXACT
+    ) -> Tuple[List[UserDTO], Optional[int]]:
+        """모든 사용자 조회 (페이징 포함, count_mode=none 이면 total 은 None)"""
+        return await self._get_page_with_count(
+            lambda user_repo: user_repo.get_all(skip=skip, limit=limit), count_mode
+        )
+
+    async def get_users_by_cursor(
+        self, cursor: Optional[str] = None, limit: int = 100, count_mode: CountMode = CountMode.EXACT
+    ) -> Tuple[List[UserDTO], Optional[int], Optional[str]]:
+        """사용자 목록 조회 (커서 페이징, 다음 페이지가 없으면 next_cursor 는 None)"""
+        after = decode_cursor(cursor) if cursor else None
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        users, total = await self._get_page_with_count(
+            lambda user_repo: user_repo.get_page_after(limit=limit + 1, after=after), count_mode
+        )
+        
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].email)
+        return users, total, next_cursor
+
+    async def _get_page_with_count(
+        self,
+        fetch_page: Callable[[UserRepository], Awaitable[List[UserDTO]]],
+        count_mode: CountMode,
+    ) -> Tuple[List[UserDTO], Optional[int]]:
+        if count_mode == CountMode.EXACT and self.counter:
+            # 캐시된 전체 수 조회(miss 시 별도 세션에서 COUNT)를 페이지 조회와 동시에 실행
+            (users, _), total = await asyncio.gather(
+                self._get_page(fetch_page, CountMode.NONE),
+                self.counter.get(self._count_all_users),
+            )
             return users, total
+        return await self._get_page(fetch_page, count_mode)
+
+    @transactional(read_only=True)
+    async def _get_page(
+        self,
+        fetch_page: Callable[[UserRepository], Awaitable[List[UserDTO]]],
+        count_mode: CountMode,
+    ) -> Tuple[List[UserDTO], Optional[int]]:
+        user_repo = UserRepository(self.uow.session)
+        
+        users = await fetch_page(user_repo)
+        total = None
+        if count_mode == CountMode.EXACT:
+            total = await user_repo.count_all()
+        elif count_mode == CountMode.ESTIMATED:
+            total = await user_repo.count_estimated()
+        
+        return users, total
+
+    @transactional(propagation=Propagation.REQUIRES_NEW, read_only=True)
+    async def _count_all_users(self) -> int:
+        # 페이지 조회와 동시에 실행되므로 별도 세션 사용
+        return await UserRepository(self.uow.session).count_all()
 
-    @transactional
     async def update_user(self, email: str, user_data: UserUpdateDTO) -> Optional[UserDTO]:
         """사용자 정보 업데이트"""
-        async with self.uow as session:
-            user_repo = UserRepository(session)
-            
-            existing_user = await user_repo.get_by_email(email)
-            if not existing_user:
-                raise ValueError(f"User with email {email} not found")
-            
-            if not any(v is not None for v in user_data.model_dump().values()):
-                raise ValueError("No data provided for update")
-            
-            return await user_repo.update(email, user_data)
+        user = await self._update_user(email, user_data)
+        if self.cache:
+            await self.cache.set(email, user)
+        return user
 
     @transactional
+    async def _update_user(self, email: str, user_data: UserUpdateDTO) -> Optional[UserDTO]:
+        if not any(v is not None for v in user_data.model_dump().values()):
+            raise ValueError("No data provided for update")
+        
+        user_repo = UserRepository(self.uow.session)
+        
+        updated_user = await user_repo.update(email, user_data)
+        if not updated_user:
+            raise ValueError(f"User with email {email} not found")
+        
+        return updated_user
+
     async def delete_user(self, email: str) -> bool:
         """사용자 삭제"""
-        async with self.uow as session:
-            user_repo = UserRepository(session)
-            
-            existing_user = await user_repo.get_by_email(email)
-            if not existing_user:
-                raise ValueError(f"User with email {email} not found")
-            
-            return await user_repo.delete(email)
\ No newline at end of file
+        deleted = await self._delete_user(email)
+        if self.cache:
+            await self.cache.invalidate(email)
+        if self.counter and deleted:
+            await self.counter.incr(-1)
+        return deleted
+
+    @transactional
+    async def _delete_user(self, email: str) -> bool:
+        user_repo = UserRepository(self.uow.session)
+        
+        if not await user_repo.delete(email):
+            raise ValueError(f"User with email {email} not found")
+        
+        return True
@@ -0,0 +1,20 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, email: str) -> str:
+    """(created_at, email) 정렬 키를 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps([created_at.isoformat(), email], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """커서 문자열을 (created_at, email) 로 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, email = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), str(email)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
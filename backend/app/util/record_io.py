@@ -0,0 +1,134 @@
+"""
+NDJSON / CSV 스트림 읽기/쓰기
+
+읽기: 요청 본문 청크를 줄 단위로 나눠 한 줄씩 레코드로 변환합니다. (본문 전체를 메모리에 올리지 않음)
+      CSV 는 첫 줄을 헤더로 사용하며, 따옴표 안의 줄바꿈은 지원하지 않습니다.
+쓰기: 행 묶음을 NDJSON/CSV 바이트 청크로 인코딩하고, 필요하면 gzip 으로 압축하며 흘려보냅니다.
+"""
+import codecs
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+RECORD_FORMATS = ("ndjson", "csv")
+MAX_LINE_LENGTH = 1024 * 1024
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """바이트 청크 스트림을 (줄 번호, 줄) 로 변환 (빈 줄 제외, 줄 번호는 1부터)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_no = 0
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_no += 1
+            line = line.rstrip("\r")
+            if line.strip():
+                yield line_no, line
+        if len(buffer) > MAX_LINE_LENGTH:
+            raise ValueError(f"Line {line_no + 1} exceeds {MAX_LINE_LENGTH} characters")
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer.strip():
+        yield line_no + 1, buffer.rstrip("\r")
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], fmt: str
+) -> AsyncIterator[Tuple[int, Union[Dict[str, Any], ValueError]]]:
+    """
+    (줄 번호, 레코드) 를 순서대로 반환합니다. 파싱할 수 없는 줄은 레코드 대신 ValueError 를 반환합니다.
+
+    Args:
+        chunks: 요청 본문 바이트 청크
+        fmt: "ndjson" 또는 "csv"
+    """
+    if fmt not in RECORD_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+    header: Optional[List[str]] = None
+    async for line_no, line in iter_lines(chunks):
+        if fmt == "ndjson":
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, ValueError(f"Invalid JSON: {e.msg}")
+                continue
+            if not isinstance(record, dict):
+                yield line_no, ValueError("Each line must be a JSON object")
+                continue
+            yield line_no, record
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_no, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield line_no, dict(zip(header, values))
+
+
+RECORD_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _to_text(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_records(rows: Iterable[Sequence[Any]], columns: Sequence[str], fmt: str) -> bytes:
+    """행 묶음을 NDJSON 또는 CSV(헤더 제외) 바이트로 인코딩"""
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps(dict(zip(columns, map(_to_text, row))), ensure_ascii=False) + "\n" for row in rows
+        ).encode()
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows([_to_text(value) for value in row] for row in rows)
+        return buffer.getvalue().encode()
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+async def iter_encoded(
+    batches: AsyncIterator[Sequence[Sequence[Any]]],
+    columns: Sequence[str],
+    fmt: str,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    행 묶음 스트림을 인코딩된 바이트 청크 스트림으로 변환합니다. (CSV 는 헤더 먼저)
+
+    Args:
+        batches: 행 묶음 스트림 (예: 서버 사이드 커서 partition)
+        columns: 컬럼 이름
+        fmt: "ndjson" 또는 "csv"
+        gzip: gzip 압축 여부 (청크 단위로 압축하며 흘려보냄)
+    """
+    if fmt not in RECORD_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    if fmt == "csv":
+        yield emit(encode_records([columns], columns, fmt))
+
+    async for rows in batches:
+        chunk = emit(encode_records(rows, columns, fmt))
+        if chunk:
+            yield chunk
+
+    if compressor:
+        yield compressor.flush()
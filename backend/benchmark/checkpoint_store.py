@@ -0,0 +1,127 @@
+"""
+LangGraph 체크포인트 저장소 벤치마크
+
+저장소(sqlite / postgres / redis)별로 대화 히스토리 크기의 체크포인트를
+- put: aput + aput_writes (노드 1회 실행분)
+- get: aget_tuple (최신 체크포인트 조회, 그래프 실행 시작 시 1회)
+지연(p50/p95/p99)과 처리량을 측정합니다. --concurrency 개 세션이 동시에 실행되는 상황을 흉내 냅니다.
+sqlite 는 연결 하나로 쓰기가 직렬화되므로 동시 세션이 늘면 지연이 비례해 늘어납니다.
+
+실행 (postgres 는 settings.POSTGRES_URL 과 `alembic upgrade head`, redis 는 settings.REDIS_URL 필요):
+    uv run python -m benchmark.checkpoint_store --backends sqlite postgres redis --sessions 200 --concurrency 16
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, List
+
+import aiosqlite
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.base.id import uuid6
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.setting import settings
+from app.core.graph.savers import PostgresCheckpointSaver, RedisCheckpointSaver
+from app.core.redis import close_redis
+
+
+def make_checkpoint(turns: int) -> dict:
+    """turns 턴 분량 메시지를 가진 체크포인트"""
+    checkpoint = empty_checkpoint()
+    checkpoint["id"] = str(uuid6(clockseq=0))
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"질문 {i} " + "가" * 200, id=str(uuid.uuid4())))
+        messages.append(AIMessage(content=f"답변 {i} " + "나" * 600, id=str(uuid.uuid4())))
+    checkpoint["channel_values"] = {"messages": messages, "summary": ""}
+    return checkpoint
+
+
+def percentile(values: List[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def run(name: str, saver: Any, sessions: int, turns: int, steps: int, concurrency: int) -> None:
+    puts: List[float] = []
+    gets: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    run_id = uuid.uuid4().hex[:8]
+
+    async def session(index: int) -> None:
+        async with semaphore:
+            config = {"configurable": {"thread_id": f"bench-{run_id}-{index}", "checkpoint_ns": ""}}
+            start = time.perf_counter()
+            await saver.aget_tuple(config)
+            gets.append(time.perf_counter() - start)
+            for step in range(steps):
+                checkpoint = make_checkpoint(turns)
+                start = time.perf_counter()
+                config = await saver.aput(config, checkpoint, {"source": "loop", "step": step}, {})
+                await saver.aput_writes(config, [("messages", checkpoint["channel_values"]["messages"][-2:])], task_id=str(uuid.uuid4()))
+                puts.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            assert await saver.aget_tuple(config) is not None
+            gets.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    puts_ms = sorted(p * 1000 for p in puts)
+    gets_ms = sorted(g * 1000 for g in gets)
+    print(
+        f"{name:<9} "
+        f"put p50 {statistics.median(puts_ms):7.2f}ms  p95 {percentile(puts_ms, 0.95):7.2f}ms  p99 {percentile(puts_ms, 0.99):7.2f}ms  "
+        f"get p50 {statistics.median(gets_ms):7.2f}ms  p95 {percentile(gets_ms, 0.95):7.2f}ms  "
+        f"{len(puts) / elapsed:8.0f} puts/s"
+    )
+
+
+async def main(backends: List[str], sessions: int, turns: int, steps: int, concurrency: int, keep_last: int) -> None:
+    for backend in backends:
+        if backend == "sqlite":
+            with tempfile.TemporaryDirectory() as tmp:
+                conn = await aiosqlite.connect(Path(tmp) / "checkpoint.db")
+                saver = AsyncSqliteSaver(conn)
+                await saver.setup()
+                await run("sqlite", saver, sessions, turns, steps, concurrency)
+                await conn.close()
+        elif backend == "postgres":
+            engine = create_async_engine(settings.POSTGRES_URL, pool_size=concurrency)
+            saver = PostgresCheckpointSaver(engine, keep_last=keep_last)
+            await saver.setup()
+            try:
+                await run("postgres", saver, sessions, turns, steps, concurrency)
+            finally:
+                async with engine.begin() as conn:
+                    await conn.execute(text("DELETE FROM graph_checkpoint_writes WHERE thread_id LIKE 'bench-%'"))
+                    await conn.execute(text("DELETE FROM graph_checkpoints WHERE thread_id LIKE 'bench-%'"))
+                await engine.dispose()
+        elif backend == "redis":
+            saver = RedisCheckpointSaver(keep_last=keep_last, thread_ttl=600)
+            try:
+                await run("redis", saver, sessions, turns, steps, concurrency)
+            finally:
+                await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LangGraph 체크포인트 저장소 벤치마크")
+    parser.add_argument("--backends", nargs="+", choices=["sqlite", "postgres", "redis"], default=["sqlite", "postgres", "redis"])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=10, help="체크포인트당 대화 턴 수 (상태 크기)")
+    parser.add_argument("--steps", type=int, default=5, help="세션당 체크포인트 기록 수 (그래프 노드 수)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--keep-last", type=int, default=settings.GRAPH_CHECKPOINT_KEEP_LAST)
+    args = parser.parse_args()
+
+    logger.remove()
+    asyncio.run(main(args.backends, args.sessions, args.turns, args.steps, args.concurrency, args.keep_last))
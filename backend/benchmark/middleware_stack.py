@@ -0,0 +1,141 @@
+"""
+미들웨어 스택 벤치마크
+
+- before: 기존 BaseHTTPMiddleware 5단 스택 (동일한 헤더/로깅 작업)
+- after : app.middleware 의 순수 ASGI 미들웨어 스택
+
+trivial endpoint(GET /ping)에 대해 요청당 평균 지연과 처리량을 비교합니다.
+네트워크 영향을 제거하기 위해 httpx.ASGITransport 로 앱을 직접 호출합니다.
+
+실행:
+    uv run python -m benchmark.middleware_stack --requests 5000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Callable
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from loguru import logger
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.auth import BearerTokenAuthMiddleware
+from app.middleware.tracking import (
+    RequestIDMiddleware,
+    ErrorTrackingMiddleware,
+    MongoDBLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+# ---------- before: BaseHTTPMiddleware 스택 ----------
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyBearerTokenAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        return await call_next(request)
+
+
+class LegacyErrorTrackingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+
+class LegacyMongoDBLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        _ = (request.url.path, request.method, response.status_code, (time.time() - start_time) * 1000)
+        return response
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        return response
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if legacy:
+        stack = [
+            LegacySecurityHeadersMiddleware,
+            LegacyMongoDBLoggingMiddleware,
+            LegacyErrorTrackingMiddleware,
+            LegacyBearerTokenAuthMiddleware,
+            LegacyRequestIDMiddleware,
+        ]
+    else:
+        stack = [
+            SecurityHeadersMiddleware,
+            MongoDBLoggingMiddleware,
+            ErrorTrackingMiddleware,
+            BearerTokenAuthMiddleware,
+            RequestIDMiddleware,
+        ]
+
+    for middleware in stack:
+        app.add_middleware(middleware)
+
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> float:
+    """requests 건을 concurrency 개 동시 실행하고 총 소요 시간(초)을 반환"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 워밍업
+        for _ in range(50):
+            await client.get("/ping")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one():
+            async with semaphore:
+                response = await client.get("/ping")
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_one() for _ in range(requests)))
+        return time.perf_counter() - start
+
+
+async def main(requests: int, concurrency: int) -> None:
+    for label, legacy in (("before (BaseHTTPMiddleware)", True), ("after  (pure ASGI)", False)):
+        elapsed = await run(build_app(legacy), requests, concurrency)
+        print(
+            f"{label:<30} "
+            f"{requests / elapsed:>10.0f} req/s  "
+            f"{elapsed / requests * 1e6:>8.1f} us/req"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미들웨어 스택 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    # 요청 로그 출력이 결과를 왜곡하지 않도록 로그 핸들러 제거
+    logger.remove()
+
+    asyncio.run(main(args.requests, args.concurrency))
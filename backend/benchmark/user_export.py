@@ -0,0 +1,77 @@
+"""
+사용자 export 스트리밍 벤치마크
+
+시드 데이터(기본 100만 명)를 UserService.export_users 로 끝까지 읽으며
+형식(NDJSON/CSV) x gzip 조합별 처리량(rows/s, MB/s)과 스트리밍 중 RSS 증가량을 측정합니다.
+RSS 가 행 수에 비례해 늘지 않으면 서버 사이드 커서 + 청크 인코딩이 동작하는 것입니다.
+
+실행 (settings.POSTGRES_URL 의 PostgreSQL, 마이그레이션 적용 필요):
+    uv run python -m benchmark.user_export --users 1000000
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config.setting import settings
+from app.database.session import UnitOfWork
+from app.service.user import UserService
+from benchmark.user_pagination import CLEANUP_SQL, seed
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def current_rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE / 1e6
+
+
+async def run(service: UserService, fmt: str, gzip: bool, batch_size: int) -> None:
+    rss_start = current_rss_mb()
+    rss_peak = rss_start
+    total_bytes = 0
+    lines = 0
+
+    start = time.perf_counter()
+    async for chunk in service.export_users(fmt=fmt, gzip=gzip, batch_size=batch_size):
+        total_bytes += len(chunk)
+        if not gzip:
+            lines += chunk.count(b"\n")
+        rss_peak = max(rss_peak, current_rss_mb())
+    elapsed = time.perf_counter() - start
+
+    rows = f"{lines / elapsed:>9.0f} rows/s" if not gzip else f"{'-':>9} rows/s"
+    print(
+        f"{fmt:<6} gzip={str(gzip):<5}  "
+        f"{elapsed:6.2f}s  {rows}  {total_bytes / elapsed / 1e6:7.1f} MB/s  "
+        f"out {total_bytes / 1e6:8.1f} MB  rss +{rss_peak - rss_start:6.1f} MB"
+    )
+
+
+async def main(users: int, batch_size: int, keep: bool) -> None:
+    engine = create_async_engine(settings.POSTGRES_URL)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    service = UserService(uow=UnitOfWork(session_factory))
+    try:
+        await seed(session_factory, users)
+        for fmt in ("ndjson", "csv"):
+            for gzip in (False, True):
+                await run(service, fmt, gzip, batch_size)
+    finally:
+        if not keep:
+            async with session_factory() as session:
+                await session.execute(CLEANUP_SQL)
+                await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 export 스트리밍 벤치마크")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=settings.USER_EXPORT_BATCH_SIZE)
+    parser.add_argument("--keep", action="store_true", help="시드 데이터 유지")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.batch_size, args.keep))
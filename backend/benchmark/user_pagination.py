@@ -0,0 +1,107 @@
+"""
+사용자 목록 페이지네이션 벤치마크
+
+100만 명 시드 데이터에서 1페이지와 10,000페이지 조회 지연을 비교합니다.
+
+- offset: UserRepository.get_all(skip, limit)   → OFFSET 만큼 스캔 후 버림
+- cursor: UserRepository.get_page_after(limit, after) → ix_user_created_at_email 에서 바로 시작
+
+cursor 측정용 커서는 (측정 밖에서) 직전 페이지 마지막 행으로 만듭니다.
+시드 데이터는 bench-*@bench.local 이메일로 생성되며, --keep 이 없으면 종료 시 삭제합니다.
+
+실행 (settings.POSTGRES_URL 의 PostgreSQL, 마이그레이션 적용 필요):
+    uv run python -m benchmark.user_pagination --users 1000000 --pages 1 10000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config.setting import settings
+from app.repository.user import UserRepository
+
+SEED_SQL = text("""
+    INSERT INTO "user" (email, name, created_at)
+    SELECT 'bench-' || g || '@bench.local', 'Bench User ' || g, now() - g * interval '1 second'
+    FROM generate_series(:start, :stop) AS g
+    ON CONFLICT DO NOTHING
+""")
+CLEANUP_SQL = text("""DELETE FROM "user" WHERE email LIKE 'bench-%@bench.local'""")
+
+
+async def seed(session_factory: async_sessionmaker, users: int, chunk: int = 100_000) -> None:
+    start = time.perf_counter()
+    for offset in range(1, users + 1, chunk):
+        async with session_factory() as session:
+            await session.execute(SEED_SQL, {"start": offset, "stop": min(offset + chunk - 1, users)})
+            await session.commit()
+    async with session_factory() as session:
+        await session.execute(text('ANALYZE "user"'))
+        await session.commit()
+    print(f"seeded {users} users in {time.perf_counter() - start:.1f}s")
+
+
+async def measure(fn: Callable[[], Awaitable[object]], repeat: int) -> List[float]:
+    await fn()  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(session: AsyncSession, page: int, limit: int, repeat: int) -> None:
+    repo = UserRepository(session)
+    skip = (page - 1) * limit
+
+    # 직전 페이지 마지막 행으로 커서 생성 (측정 제외)
+    after = None
+    if page > 1:
+        last = (await repo.get_all(skip=skip - 1, limit=1))[0]
+        after = (last.created_at, last.email)
+
+    offset_ms = await measure(lambda: repo.get_all(skip=skip, limit=limit), repeat)
+    cursor_ms = await measure(lambda: repo.get_page_after(limit=limit, after=after), repeat)
+
+    offset_rows = await repo.get_all(skip=skip, limit=limit)
+    cursor_rows = await repo.get_page_after(limit=limit, after=after)
+    assert [u.email for u in offset_rows] == [u.email for u in cursor_rows]
+
+    print(
+        f"page {page:>6}  "
+        f"offset p50 {statistics.median(offset_ms):8.2f}ms  "
+        f"cursor p50 {statistics.median(cursor_ms):8.2f}ms"
+    )
+
+
+async def main(users: int, pages: List[int], limit: int, repeat: int, keep: bool) -> None:
+    engine = create_async_engine(settings.POSTGRES_URL)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        await seed(session_factory, users)
+        async with session_factory() as session:
+            for page in pages:
+                await run(session, page, limit, repeat)
+    finally:
+        if not keep:
+            async with session_factory() as session:
+                await session.execute(CLEANUP_SQL)
+                await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 목록 페이지네이션 벤치마크")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10_000])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="시드 데이터 유지")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.pages, args.limit, args.repeat, args.keep))
@@ -0,0 +1,46 @@
+"""add user (created_at, email) index for keyset pagination
+
+Revision ID: 7b1e4c9a2d3f
+Revises: 23c65e963f26
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1e4c9a2d3f'
+down_revision: Union[str, Sequence[str], None] = '23c65e963f26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keyset 비교 (created_at, email) < (:created_at, :email) 는 NULL 을 건너뛰므로 NOT NULL 보장
+    op.execute(sa.text('UPDATE "user" SET created_at = now() WHERE created_at IS NULL'))
+    op.alter_column('user', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.text('now()'),
+               nullable=False)
+    # 대용량 테이블에서 쓰기 잠금 없이 생성 (CONCURRENTLY 는 트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_created_at_email',
+            'user',
+            [sa.text('created_at DESC'), sa.text('email DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_created_at_email', table_name='user')
+    op.alter_column('user', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.text('now()'),
+               nullable=True)
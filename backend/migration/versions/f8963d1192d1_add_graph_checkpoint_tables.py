@@ -0,0 +1,53 @@
+"""add graph checkpoint tables for the postgres checkpoint backend
+
+Revision ID: f8963d1192d1
+Revises: 7b1e4c9a2d3f
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8963d1192d1'
+down_revision: Union[str, Sequence[str], None] = '7b1e4c9a2d3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('graph_checkpoints',
+    sa.Column('thread_id', sa.Text(), nullable=False),
+    sa.Column('checkpoint_ns', sa.Text(), server_default='', nullable=False),
+    sa.Column('checkpoint_id', sa.Text(), nullable=False),
+    sa.Column('parent_checkpoint_id', sa.Text(), nullable=True),
+    sa.Column('type', sa.Text(), nullable=False),
+    sa.Column('checkpoint', sa.LargeBinary(), nullable=False),
+    sa.Column('metadata_type', sa.Text(), nullable=False),
+    sa.Column('metadata', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id')
+    )
+    op.create_index('ix_graph_checkpoints_created_at', 'graph_checkpoints', ['created_at'], unique=False)
+    op.create_table('graph_checkpoint_writes',
+    sa.Column('thread_id', sa.Text(), nullable=False),
+    sa.Column('checkpoint_ns', sa.Text(), server_default='', nullable=False),
+    sa.Column('checkpoint_id', sa.Text(), nullable=False),
+    sa.Column('task_id', sa.Text(), nullable=False),
+    sa.Column('idx', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('channel', sa.Text(), nullable=False),
+    sa.Column('type', sa.Text(), nullable=False),
+    sa.Column('value', sa.LargeBinary(), nullable=False),
+    sa.PrimaryKeyConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', 'task_id', 'idx')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('graph_checkpoint_writes')
+    op.drop_index('ix_graph_checkpoints_created_at', table_name='graph_checkpoints')
+    op.drop_table('graph_checkpoints')
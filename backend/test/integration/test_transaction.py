@@ -0,0 +1,201 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database.session import Base, Propagation, UnitOfWork, get_current_session, get_read_routing_stats
+from app.dto.user import UserCreateDTO, UserUpdateDTO
+from app.service.user import UserService
+
+
+@pytest.fixture
+def pool_checkouts(test_engine):
+    """테스트 중 커넥션 풀 체크아웃 횟수"""
+    checkouts = []
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(connection_record)
+
+    event.listen(test_engine.sync_engine, "checkout", on_checkout)
+    yield checkouts
+    event.remove(test_engine.sync_engine, "checkout", on_checkout)
+
+
+@pytest.fixture
+async def replica_session_factory(tmp_path):
+    """primary 와 분리된 replica 역할의 SQLite 데이터베이스"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def count_users(test_session) -> int:
+    result = await test_session.execute(text("SELECT COUNT(*) FROM user"))
+    return result.scalar()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestTransactionPropagation:
+    """UnitOfWork / @transactional 트랜잭션 전파 통합 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user_service_integration, test_uow):
+        """각 테스트 메서드 실행 전 설정"""
+        self.user_service = user_service_integration
+        self.uow = test_uow
+
+    async def test_service_call_checks_out_one_connection(self, pool_checkouts):
+        """@transactional 서비스 호출 1회는 커넥션 1회 체크아웃"""
+        # When
+        await self.user_service.create_user(UserCreateDTO(email="one@tx.com", name="One"))
+
+        # Then
+        assert len(pool_checkouts) == 1
+        assert get_current_session() is None
+
+    async def test_request_transaction_checks_out_one_connection(self, pool_checkouts, test_session):
+        """요청 단위 트랜잭션 안의 여러 서비스 호출은 같은 세션/커넥션 사용 (REQUIRED)"""
+        # When - 컨트롤러 레벨 트랜잭션 안에서 생성/수정/조회
+        async with self.uow as session:
+            await self.user_service.create_user(UserCreateDTO(email="req@tx.com", name="Req"))
+            await self.user_service.update_user("req@tx.com", UserUpdateDTO(name="Updated"))
+            user = await self.user_service.get_user_by_email("req@tx.com")
+
+            assert get_current_session() is session
+
+        # Then
+        assert len(pool_checkouts) == 1
+        assert user.name == "Updated"
+        assert await count_users(test_session) == 1
+
+    async def test_required_rolls_back_joined_work(self, test_session):
+        """참여한 호출의 예외가 바깥으로 전파되면 전체 롤백"""
+        # When
+        with pytest.raises(ValueError, match="already exists"):
+            async with self.uow:
+                await self.user_service.create_user(UserCreateDTO(email="dup@tx.com", name="First"))
+                await self.user_service.create_user(UserCreateDTO(email="dup@tx.com", name="Second"))
+
+        # Then
+        assert await count_users(test_session) == 0
+
+    async def test_requires_new_commits_independently(self, test_session):
+        """REQUIRES_NEW 는 바깥 트랜잭션이 롤백되어도 커밋 유지"""
+        # When
+        with pytest.raises(RuntimeError):
+            async with self.uow as outer:
+                async with self.uow.propagate(Propagation.REQUIRES_NEW) as inner:
+                    assert inner is not outer
+                    await self.user_service.create_user(UserCreateDTO(email="new@tx.com", name="New"))
+                assert get_current_session() is outer
+                raise RuntimeError("outer failed")
+
+        # Then
+        assert await count_users(test_session) == 1
+
+    async def test_nested_rolls_back_to_savepoint(self, test_session):
+        """NESTED 실패 시 SAVEPOINT 까지만 롤백하고 바깥 트랜잭션은 커밋"""
+        # When
+        async with self.uow as outer:
+            await self.user_service.create_user(UserCreateDTO(email="outer@tx.com", name="Outer"))
+            with pytest.raises(ValueError):
+                async with self.uow.propagate(Propagation.NESTED) as inner:
+                    assert inner is outer
+                    await self.user_service.create_user(UserCreateDTO(email="inner@tx.com", name="Inner"))
+                    raise ValueError("inner failed")
+
+        # Then
+        result = await test_session.execute(text("SELECT email FROM user"))
+        assert [row.email for row in result] == ["outer@tx.com"]
+
+    async def test_session_outside_transaction_raises(self):
+        """트랜잭션 밖에서 uow.session 접근 시 RuntimeError"""
+        # When & Then
+        with pytest.raises(RuntimeError, match="No active transaction"):
+            UnitOfWork(self.uow.session_factory).session
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestReadReplicaRouting:
+    """read_only 트랜잭션 replica 라우팅 통합 테스트"""
+
+    async def add_replica_user(self, replica_session_factory, email: str) -> None:
+        async with replica_session_factory() as session:
+            await session.execute(
+                text("INSERT INTO user (email, name, created_at) VALUES (:email, 'Replica', CURRENT_TIMESTAMP)"),
+                {"email": email},
+            )
+            await session.commit()
+
+    async def test_read_only_routed_to_replica(self, test_session_factory, replica_session_factory):
+        """읽기 전용 조회는 replica 에서 읽는지 테스트"""
+        # Given - replica 에만 존재하는 사용자
+        await self.add_replica_user(replica_session_factory, "replica@tx.com")
+        service = UserService(uow=UnitOfWork(test_session_factory, replica=replica_session_factory))
+
+        # When
+        user = await service.get_user_by_email("replica@tx.com")
+        users, total = await service.get_all_users()
+
+        # Then
+        assert user.name == "Replica"
+        assert [u.email for u in users] == ["replica@tx.com"]
+        assert total == 1
+
+    async def test_read_after_write_sticks_to_primary(self, test_session_factory, replica_session_factory):
+        """같은 요청에서 쓰기 이후의 조회는 primary 에서 읽는지 테스트 (read-your-writes)"""
+        # Given
+        service = UserService(uow=UnitOfWork(test_session_factory, replica=replica_session_factory))
+        sticky_before = get_read_routing_stats()["sticky"]
+
+        # When
+        await service.create_user(UserCreateDTO(email="write@tx.com", name="Writer"))
+        user = await service.get_user_by_email("write@tx.com")
+
+        # Then - replica 에는 없지만 primary 에서 조회됨
+        assert user is not None
+        assert get_read_routing_stats()["sticky"] == sticky_before + 1
+
+    async def test_read_only_without_sticky_window_uses_replica(self, test_session_factory, replica_session_factory):
+        """sticky_seconds=0 이면 쓰기 직후에도 replica 에서 읽는지 테스트"""
+        # Given
+        uow = UnitOfWork(test_session_factory, replica=replica_session_factory, sticky_seconds=0)
+        service = UserService(uow=uow)
+
+        # When
+        await service.create_user(UserCreateDTO(email="lag@tx.com", name="Lagging"))
+        user = await service.get_user_by_email("lag@tx.com")
+
+        # Then - replica 에 아직 반영되지 않은 상태
+        assert user is None
+
+    async def test_replica_failure_falls_back_to_primary(self, test_session_factory, tmp_path, sample_user_in_db):
+        """replica 연결 실패 시 primary 로 대체하는지 테스트"""
+        # Given - 열 수 없는 replica
+        broken_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        broken_factory = async_sessionmaker(bind=broken_engine, class_=AsyncSession)
+        service = UserService(uow=UnitOfWork(test_session_factory, replica=broken_factory))
+        fallback_before = get_read_routing_stats()["fallback"]
+
+        # When
+        user = await service.get_user_by_email(sample_user_in_db.email)
+        await service.get_user_by_email(sample_user_in_db.email)
+
+        # Then - 첫 실패 이후에는 replica 를 건너뜀
+        assert user.email == sample_user_in_db.email
+        assert get_read_routing_stats()["fallback"] == fallback_before + 1
+        await broken_engine.dispose()
+
+    async def test_write_inside_replica_transaction_raises(self, test_session_factory, replica_session_factory):
+        """replica 트랜잭션 안에서 쓰기 트랜잭션 참여 시 RuntimeError"""
+        # Given
+        uow = UnitOfWork(test_session_factory, replica=replica_session_factory)
+        service = UserService(uow=uow)
+
+        # When & Then
+        with pytest.raises(RuntimeError, match="read-only replica"):
+            async with uow.propagate(Propagation.REQUIRED, read_only=True):
+                await service.create_user(UserCreateDTO(email="ro@tx.com", name="ReadOnly"))
@@ -1,6 +1,12 @@
+import gzip
+import json
 import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
 from sqlalchemy import text
 
+from app.core.counter import CountMode
+from app.database.model.user import User
 from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO
 
 
@@ -80,6 +86,129 @@ class TestUserServiceIntegration:
         assert len(users_page2) == 1
         assert total_count == 3
 
+    async def test_get_users_by_cursor_walks_all_pages(self, test_session):
+        """커서 페이징으로 created_at 동률을 포함한 전체 목록 순회 통합 테스트"""
+        # Given - created_at 이 같은 사용자 포함
+        rows = [
+            ("a@cursor.com", datetime(2024, 1, 3)),
+            ("b@cursor.com", datetime(2024, 1, 2)),
+            ("c@cursor.com", datetime(2024, 1, 2)),
+            ("d@cursor.com", datetime(2024, 1, 2)),
+            ("e@cursor.com", datetime(2024, 1, 1)),
+        ]
+        test_session.add_all([User(email=email, name="Cursor User", created_at=created_at) for email, created_at in rows])
+        await test_session.commit()
+        
+        # When - 2개씩 마지막 페이지까지 조회
+        emails, cursor, pages = [], None, 0
+        while True:
+            users, total, cursor = await self.user_service.get_users_by_cursor(cursor=cursor, limit=2)
+            emails.extend(user.email for user in users)
+            pages += 1
+            if cursor is None:
+                break
+        
+        # Then - (created_at DESC, email DESC) 순서, 중복/누락 없음
+        assert emails == ["a@cursor.com", "d@cursor.com", "c@cursor.com", "b@cursor.com", "e@cursor.com"]
+        assert pages == 3
+        assert total == 5
+
+    async def test_get_users_by_invalid_cursor(self):
+        """잘못된 커서 전달 시 ValueError"""
+        # When & Then
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await self.user_service.get_users_by_cursor(cursor="not-a-cursor")
+
+    async def test_get_all_users_count_modes(self, multiple_users_in_db):
+        """count_mode 별 전체 수 (SQLite 에서 estimated 는 정확한 수로 대체)"""
+        # When
+        _, exact = await self.user_service.get_all_users(count_mode=CountMode.EXACT)
+        _, estimated = await self.user_service.get_all_users(count_mode=CountMode.ESTIMATED)
+        _, none = await self.user_service.get_all_users(count_mode=CountMode.NONE)
+        
+        # Then
+        assert exact == 3
+        assert estimated == 3
+        assert none is None
+
+    async def test_get_all_users_cached_count_miss_uses_separate_session(self, multiple_users_in_db):
+        """카운트 캐시 miss 시 별도 세션에서 COUNT 후 페이지와 함께 반환"""
+        # Given - 캐시가 비어 있는 카운터
+        async def load_count(loader):
+            return await loader()
+        
+        self.user_service.counter = AsyncMock()
+        self.user_service.counter.get.side_effect = load_count
+        
+        # When
+        users, total = await self.user_service.get_all_users(limit=2)
+        
+        # Then
+        assert len(users) == 2
+        assert total == 3
+
+    async def test_import_users_reports_failed_rows(self, sample_user_in_db, test_session):
+        """대량 생성 시 검증 실패/중복 행은 건너뛰고 줄 번호와 사유 보고"""
+        # Given - 배치 크기 2 로 여러 배치에 걸친 입력
+        body = "\n".join([
+            '{"email": "bulk1@example.com", "name": "Bulk 1"}',
+            '{"email": "not-an-email", "name": "Invalid"}',
+            f'{{"email": "{sample_user_in_db.email}", "name": "Existing"}}',
+            '{"email": "bulk2@example.com", "name": "Bulk 2"}',
+            'not-json',
+            '{"email": "bulk1@example.com", "name": "Duplicate in file"}',
+            '{"email": "bulk3@example.com", "name": "Bulk 3"}',
+        ]).encode()
+        
+        async def chunks():
+            for i in range(0, len(body), 16):
+                yield body[i:i + 16]
+        
+        # When
+        result = await self.user_service.import_users(chunks(), fmt="ndjson", batch_size=2)
+        
+        # Then
+        assert result.total == 7
+        assert result.inserted == 3
+        assert result.failed == 4
+        assert [error.line for error in result.errors] == [2, 3, 5, 6]
+        assert "already exists" in result.errors[1].error
+        
+        count = await test_session.execute(text("SELECT count(*) FROM user WHERE email LIKE 'bulk%'"))
+        assert count.scalar() == 3
+
+    async def test_import_users_csv_truncates_errors(self):
+        """CSV 입력과 실패 행 목록 최대 개수"""
+        # Given
+        body = b"email,name\nbad1,A\nbad2,B\nbad3,C\ncsv@example.com,CSV User\n"
+        
+        async def chunks():
+            yield body
+        
+        # When
+        result = await self.user_service.import_users(chunks(), fmt="csv", max_errors=2)
+        
+        # Then
+        assert result.inserted == 1
+        assert result.failed == 3
+        assert len(result.errors) == 2
+        assert result.errors_truncated is True
+
+    async def test_export_users_streams_all_rows(self, multiple_users_in_db):
+        """전체 사용자를 배치 단위로 스트리밍 (NDJSON, CSV + gzip)"""
+        # When - batch_size 보다 많은 행
+        ndjson = b"".join([chunk async for chunk in self.user_service.export_users(fmt="ndjson", batch_size=2)])
+        csv_gz = b"".join([chunk async for chunk in self.user_service.export_users(fmt="csv", gzip=True, batch_size=2)])
+        
+        # Then
+        records = [json.loads(line) for line in ndjson.decode().splitlines()]
+        assert sorted(record["email"] for record in records) == sorted(user.email for user in multiple_users_in_db)
+        assert set(records[0]) == {"email", "name", "created_at"}
+        
+        csv_lines = gzip.decompress(csv_gz).decode().splitlines()
+        assert csv_lines[0] == "email,name,created_at"
+        assert len(csv_lines) == 4
+
     async def test_get_all_users_empty_database(self):
         """빈 데이터베이스에서 사용자 목록 조회 통합 테스트"""
         # When
@@ -22,6 +22,8 @@ def mock_uow():
     
     uow.__aenter__ = AsyncMock(return_value=mock_session)
     uow.__aexit__ = AsyncMock(return_value=None)
+    uow.session = mock_session
+    uow.propagate.return_value = uow
     
     return uow
 
@@ -46,6 +48,7 @@ def mock_user_repository(mock_repository_factory):
         get_by_email=None,
         get_all=[],
         count_all=0,
+        count_estimated=0,
         create=None,
         update=None,
         delete=False,
@@ -82,6 +85,8 @@ def service_di_factory(monkeypatch):
         mock_session = AsyncMock()
         mock_uow.__aenter__ = AsyncMock(return_value=mock_session)
         mock_uow.__aexit__ = AsyncMock(return_value=None)
+        mock_uow.session = mock_session
+        mock_uow.propagate.return_value = mock_uow
 
         # 서비스 인스턴스 생성
         service = service_cls(uow=mock_uow)
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import pytest
+from typing import Any, Dict, List, Optional, Tuple
+
+pytest.importorskip("chromadb")
+pytest.importorskip("langgraph.checkpoint.sqlite")
+pytest.importorskip("langchain_community")
+pytest.importorskip("socketio")
+
+from app.api.v1.agent import realtime
+from app.api.v1.agent import stream as stream_module
+from app.api.v1.agent.stream import format_sse, stream_answer
+from app.schema.agent import AgentQuestionRequest
+
+
+TOKENS = [
+    {"event": "retrieval", "data": {"documents": 2}},
+    {"event": "token", "data": {"content": "7일"}},
+    {"event": "token", "data": {"content": " 이내"}},
+]
+DONE = {"event": "done", "data": {"answer": "7일 이내", "cache_hit": False}}
+
+
+class StubOrchestrator:
+    """정해진 이벤트를 내보내는 테스트용 그래프 (error 가 있으면 마지막에 발생, blocked 가 있으면 set 될 때까지 대기)"""
+
+    def __init__(
+        self,
+        events: List[Dict[str, Any]],
+        error: Optional[Exception] = None,
+        blocked: Optional[asyncio.Event] = None,
+    ):
+        self.events = events
+        self.error = error
+        self.blocked = blocked
+        self.cancelled = False
+
+    async def astream(self, question: str, session_id: str):
+        for event in self.events:
+            yield event
+        if self.blocked:
+            try:
+                await self.blocked.wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        if self.error:
+            raise self.error
+
+
+@pytest.fixture
+def use_graph(monkeypatch):
+    """stream_events 가 사용할 그래프 지정"""
+    def _use(orchestrator: StubOrchestrator) -> StubOrchestrator:
+        monkeypatch.setattr(stream_module, "get_example_graph", lambda: orchestrator)
+        return orchestrator
+    return _use
+
+
+def parse_sse(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """SSE 본문을 (event, data) 목록으로 변환"""
+    messages = []
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        messages.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return messages
+
+
+@pytest.mark.unit
+class TestAgentStreamEndpoint:
+    """SSE 스트리밍 엔드포인트 단위 테스트"""
+
+    async def read(self) -> str:
+        response = await stream_answer(AgentQuestionRequest(question="환불 규정은?", session_id="session-1"))
+        assert response.media_type == "text/event-stream"
+        assert response.headers["x-accel-buffering"] == "no"
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    def test_format_sse_keeps_unicode(self):
+        """이벤트 이름/데이터 줄과 빈 줄로 구분하고 한글은 이스케이프하지 않음"""
+        # When & Then
+        assert format_sse({"event": "token", "data": {"content": "7일"}}) == 'event: token\ndata: {"content": "7일"}\n\n'
+
+    async def test_events_are_sent_in_order(self, use_graph):
+        """그래프 이벤트를 순서대로 보내고 done 으로 끝냄"""
+        # Given
+        use_graph(StubOrchestrator(TOKENS + [DONE]))
+
+        # When
+        messages = parse_sse(await self.read())
+
+        # Then
+        assert [event for event, _ in messages] == ["retrieval", "token", "token", "done"]
+        assert messages[-1][1] == DONE["data"]
+
+    async def test_graph_error_ends_with_error_event(self, use_graph):
+        """실행 중 오류는 보낸 토큰 뒤에 error 이벤트로 전달하고 상세 내용은 숨김"""
+        # Given
+        use_graph(StubOrchestrator(TOKENS, error=RuntimeError("secret connection string")))
+
+        # When
+        messages = parse_sse(await self.read())
+
+        # Then
+        assert [event for event, _ in messages] == ["retrieval", "token", "token", "error"]
+        assert messages[-1][1] == {"detail": "Internal server error"}
+
+
+@pytest.mark.unit
+class TestAgentRealtime:
+    """Socket.IO ask/disconnect 핸들러 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정 (emit 기록)"""
+        self.emitted: List[Tuple[str, Any, str]] = []
+
+        async def emit(event: str, data: Any = None, to: Optional[str] = None, **kwargs) -> None:
+            self.emitted.append((event, data, to))
+
+        monkeypatch.setattr(realtime.sio, "emit", emit)
+        monkeypatch.setattr(realtime, "_running", {})
+
+    async def test_ask_emits_events_in_order(self, use_graph):
+        """그래프 이벤트를 같은 이름으로 요청한 연결에만 순서대로 emit"""
+        # Given
+        use_graph(StubOrchestrator(TOKENS + [DONE]))
+
+        # When
+        await realtime.ask("sid-1", {"question": "환불 규정은?", "session_id": "session-1"})
+
+        # Then
+        assert [(event, to) for event, _, to in self.emitted] == [
+            ("retrieval", "sid-1"), ("token", "sid-1"), ("token", "sid-1"), ("done", "sid-1"),
+        ]
+        assert realtime._running == {}
+
+    async def test_ask_emits_error_after_tokens(self, use_graph):
+        """실행 중 오류는 보낸 토큰 뒤에 error 로 emit"""
+        # Given
+        use_graph(StubOrchestrator(TOKENS, error=RuntimeError("llm failed")))
+
+        # When
+        await realtime.ask("sid-1", {"question": "환불 규정은?", "session_id": "session-1"})
+
+        # Then
+        assert [event for event, _, _ in self.emitted] == ["retrieval", "token", "token", "error"]
+        assert self.emitted[-1][1] == {"detail": "Internal server error"}
+
+    async def test_invalid_request_emits_error(self, use_graph):
+        """요청 검증 실패는 그래프를 실행하지 않고 error 로 emit"""
+        # Given
+        use_graph(StubOrchestrator(TOKENS + [DONE]))
+
+        # When
+        await realtime.ask("sid-1", {"question": "", "session_id": "session-1"})
+
+        # Then
+        (event, data, to), = self.emitted
+        assert (event, to) == ("error", "sid-1")
+        assert data["detail"][0]["loc"] == ("question",)
+
+    async def test_second_question_is_rejected_while_running(self, use_graph):
+        """같은 연결에서 실행 중이면 새 질문은 거절하고, 연결이 끊기면 실행 취소"""
+        # Given - 첫 토큰 이후 대기하는 실행
+        orchestrator = use_graph(StubOrchestrator(TOKENS[:1], blocked=asyncio.Event()))
+        running = asyncio.create_task(realtime.ask("sid-1", {"question": "첫 질문", "session_id": "session-1"}))
+        await asyncio.sleep(0.01)
+
+        # When
+        await realtime.ask("sid-1", {"question": "두 번째 질문", "session_id": "session-1"})
+        await realtime.disconnect("sid-1")
+        with pytest.raises(asyncio.CancelledError):
+            await running
+
+        # Then
+        assert [event for event, _, _ in self.emitted] == ["retrieval", "error"]
+        assert self.emitted[-1][1] == {"detail": "Another question is in progress"}
+        assert orchestrator.cancelled
+        assert realtime._running == {}
@@ -0,0 +1,107 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.log_writer import ApiLogWriter
+
+
+@pytest.mark.unit
+class TestApiLogWriter:
+    """ApiLogWriter 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        self.mock_create_many = AsyncMock(side_effect=lambda logs: len(logs))
+        monkeypatch.setattr("app.core.log_writer.LogRepository.create_many", self.mock_create_many)
+        # beanie 초기화 없이 Document 생성이 불가하므로 dict로 대체
+        monkeypatch.setattr("app.core.log_writer.Log", lambda **fields: fields)
+
+    async def test_flush_by_batch_size(self):
+        """batch_size 만큼 모이면 insert_many 1회로 저장"""
+        # Given
+        writer = ApiLogWriter(queue_size=100, batch_size=5, flush_interval=10)
+        await writer.start()
+
+        # When
+        for i in range(5):
+            await writer.write(called_api=f"/api/{i}", method="GET", status_code=200)
+        await asyncio.sleep(0.05)
+
+        # Then
+        self.mock_create_many.assert_called_once()
+        assert len(self.mock_create_many.call_args.args[0]) == 5
+        assert writer.flushed_count == 5
+
+        await writer.stop()
+
+    async def test_stop_flushes_remaining(self):
+        """종료 시 남은 로그를 모두 flush"""
+        # Given
+        writer = ApiLogWriter(queue_size=100, batch_size=50, flush_interval=0.05)
+        await writer.start()
+
+        # When
+        for i in range(3):
+            await writer.write(called_api="/health", method="GET", status_code=200)
+        await writer.stop()
+
+        # Then
+        assert writer.flushed_count == 3
+        assert writer.get_stats()["queued"] == 0
+
+    async def test_drop_policy_when_full(self):
+        """drop 정책 - 큐가 가득 차면 버리고 dropped 카운트 증가"""
+        # Given - flusher를 띄우지 않고 큐만 생성
+        writer = ApiLogWriter(queue_size=2, batch_size=10, overflow_policy="drop")
+        writer._queue = asyncio.Queue(maxsize=2)
+
+        # When
+        results = [await writer.write(called_api="/api", status_code=200) for _ in range(4)]
+
+        # Then
+        assert results == [True, True, False, False]
+        assert writer.enqueued_count == 2
+        assert writer.dropped_count == 2
+
+    async def test_sample_policy_under_pressure(self, monkeypatch):
+        """sample 정책 - 큐 절반 이상 적재 시 sample_rate 비율만 적재"""
+        # Given
+        writer = ApiLogWriter(queue_size=4, overflow_policy="sample", sample_rate=0.5)
+        writer._queue = asyncio.Queue(maxsize=4)
+        monkeypatch.setattr("app.core.log_writer.random.random", lambda: 0.9)
+
+        # When
+        results = [await writer.write(called_api="/api", status_code=200) for _ in range(3)]
+
+        # Then - 처음 2건은 적재, 이후에는 샘플링에서 제외
+        assert results == [True, True, False]
+        assert writer.dropped_count == 1
+
+    async def test_write_before_start_is_dropped(self):
+        """시작 전 적재 요청은 버려짐"""
+        # Given
+        writer = ApiLogWriter()
+
+        # When
+        result = await writer.write(called_api="/api", status_code=200)
+
+        # Then
+        assert result is False
+        assert writer.dropped_count == 1
+
+    async def test_flush_failure_counted(self):
+        """insert_many 실패 시 failed 카운트 증가"""
+        # Given
+        self.mock_create_many.side_effect = RuntimeError("mongo down")
+        writer = ApiLogWriter(queue_size=10, batch_size=1, flush_interval=10)
+        await writer.start()
+
+        # When
+        await writer.write(called_api="/api", status_code=200)
+        await asyncio.sleep(0.05)
+        await writer.stop()
+
+        # Then
+        assert writer.failed_count == 1
+        assert writer.flushed_count == 0
@@ -0,0 +1,151 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+
+from app.core.graph import checkpoint as checkpoint_module
+from app.core.graph.checkpoint import CheckpointMaintainer
+
+
+class FakeSaver:
+    """AsyncSqliteSaver 와 같은 테이블/연결/락을 가진 테스트용 saver"""
+
+    def __init__(self, conn: aiosqlite.Connection):
+        self.conn = conn
+        self.lock = asyncio.Lock()
+
+    async def setup(self) -> None:
+        await self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT, type TEXT, checkpoint BLOB, metadata BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            CREATE TABLE IF NOT EXISTS writes (
+                thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL DEFAULT '', checkpoint_id TEXT NOT NULL,
+                task_id TEXT NOT NULL, idx INTEGER NOT NULL, channel TEXT NOT NULL, type TEXT, value BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+            );
+            """
+        )
+
+
+class FakeLock:
+    """테스트용 락 (항상 즉시 획득)"""
+
+    @asynccontextmanager
+    async def lock(self, name: str, **kwargs):
+        yield True
+
+
+async def add_checkpoints(conn: aiosqlite.Connection, thread_id: str, count: int) -> None:
+    for i in range(count):
+        checkpoint_id = f"{i:04d}"
+        await conn.execute(
+            "INSERT INTO checkpoints (thread_id, checkpoint_id, checkpoint) VALUES (?, ?, ?)",
+            (thread_id, checkpoint_id, b"x" * 4096),
+        )
+        await conn.execute(
+            "INSERT INTO writes (thread_id, checkpoint_id, task_id, idx, channel) VALUES (?, ?, 'task', 0, 'messages')",
+            (thread_id, checkpoint_id),
+        )
+    await conn.commit()
+
+
+async def count_rows(conn: aiosqlite.Connection, table: str, thread_id: str) -> int:
+    async with conn.execute(f"SELECT COUNT(*) FROM {table} WHERE thread_id = ?", (thread_id,)) as cursor:
+        return (await cursor.fetchone())[0]
+
+
+@pytest.mark.unit
+class TestCheckpointMaintainer:
+    """CheckpointMaintainer 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, monkeypatch, tmp_path):
+        """각 테스트 메서드 실행 전 설정"""
+        monkeypatch.setattr(checkpoint_module, "get_redis_lock", lambda: FakeLock())
+        self.conn = await aiosqlite.connect(tmp_path / "checkpoint.db")
+        self.maintainer = CheckpointMaintainer(FakeSaver(self.conn), name="test", keep_last=2, thread_ttl=60)
+        await self.maintainer.configure()
+        yield
+        await self.conn.close()
+
+    async def test_configure_sets_pragmas(self):
+        """WAL / incremental auto_vacuum 설정 테스트"""
+        # When
+        async with self.conn.execute("PRAGMA journal_mode") as cursor:
+            journal_mode = (await cursor.fetchone())[0]
+        async with self.conn.execute("PRAGMA auto_vacuum") as cursor:
+            auto_vacuum = (await cursor.fetchone())[0]
+
+        # Then
+        assert journal_mode == "wal"
+        assert auto_vacuum == 2
+
+    async def test_prune_keeps_latest_checkpoints(self):
+        """스레드별 최근 keep_last 개만 남기고 writes 도 함께 삭제"""
+        # Given
+        await add_checkpoints(self.conn, "a", 5)
+        await add_checkpoints(self.conn, "b", 1)
+
+        # When
+        await self.maintainer.run()
+
+        # Then
+        async with self.conn.execute("SELECT checkpoint_id FROM checkpoints WHERE thread_id = 'a' ORDER BY 1") as cursor:
+            assert [row[0] for row in await cursor.fetchall()] == ["0003", "0004"]
+        assert await count_rows(self.conn, "writes", "a") == 2
+        assert await count_rows(self.conn, "checkpoints", "b") == 1
+        assert self.maintainer.get_stats()["pruned_checkpoints"] == 3
+        assert self.maintainer.get_stats()["pruned_writes"] == 3
+
+    async def test_vacuum_releases_all_free_pages(self):
+        """삭제로 생긴 빈 페이지를 모두 반환"""
+        # Given
+        await add_checkpoints(self.conn, "a", 50)
+
+        # When
+        await self.maintainer.run()
+
+        # Then
+        async with self.conn.execute("PRAGMA freelist_count") as cursor:
+            assert (await cursor.fetchone())[0] == 0
+
+    async def test_idle_threads_expire(self):
+        """thread_ttl 동안 실행되지 않은 스레드 삭제"""
+        # Given
+        await add_checkpoints(self.conn, "idle", 1)
+        await add_checkpoints(self.conn, "active", 1)
+        await self.maintainer.touch("idle")
+        await self.maintainer.touch("active")
+        await self.conn.execute(
+            "UPDATE checkpoint_thread_activity SET updated_at = ? WHERE thread_id = 'idle'",
+            (time.time() - 120,),
+        )
+        await self.conn.commit()
+
+        # When
+        await self.maintainer.run()
+
+        # Then
+        assert await count_rows(self.conn, "checkpoints", "idle") == 0
+        assert await count_rows(self.conn, "writes", "idle") == 0
+        assert await count_rows(self.conn, "checkpoints", "active") == 1
+        assert self.maintainer.get_stats()["expired_threads"] == 1
+
+    async def test_delete_thread_removes_all_tables(self):
+        """스레드 삭제 시 checkpoints/writes/활동 기록 모두 삭제"""
+        # Given
+        await add_checkpoints(self.conn, "a", 3)
+        await self.maintainer.touch("a")
+
+        # When
+        await self.maintainer.delete_thread("a")
+
+        # Then
+        for table in ("checkpoints", "writes", "checkpoint_thread_activity"):
+            assert await count_rows(self.conn, table, "a") == 0
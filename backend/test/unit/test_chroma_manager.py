@@ -0,0 +1,279 @@
+import pytest
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+pytest.importorskip("chromadb")
+pytest.importorskip("langchain_chroma")
+pytest.importorskip("langchain_openai")
+
+from langchain_core.documents import Document
+
+from app.config.setting import settings
+from app.core.chroma_manager import ChromaManager, IngestProgress
+
+
+class FakeEmbeddings:
+    """호출된 배치를 기록하는 테스트용 임베딩 (본문에 "fail" 이 있으면 해당 요청 실패)"""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        if any("fail" in text for text in texts):
+            raise RuntimeError("embedding failed")
+        return [[float(len(text))] for text in texts]
+
+
+class FakeCollection:
+    """테스트용 인메모리 Chroma 컬렉션 (upsert/update 는 Chroma 처럼 metadata 병합, None 값은 키 삭제)"""
+
+    def __init__(self):
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.writes: List[List[str]] = []   # add/upsert/update 호출별 id
+        self.updated_metadatas: List[Dict[str, Any]] = []
+
+    def get(self, ids, include):
+        found = [id_ for id_ in ids if id_ in self.items]
+        return {
+            "ids": found,
+            "documents": [self.items[id_]["document"] for id_ in found],
+            "metadatas": [self.items[id_]["metadata"] or None for id_ in found],
+        }
+
+    def add(self, ids, embeddings, documents, metadatas=None):
+        duplicated = [id_ for id_ in ids if id_ in self.items]
+        if duplicated:
+            raise ValueError(f"Duplicated ids: {duplicated}")
+        self.upsert(ids, embeddings, documents, metadatas)
+
+    def upsert(self, ids, embeddings, documents, metadatas=None):
+        self.writes.append(list(ids))
+        for i, id_ in enumerate(ids):
+            item = self.items.setdefault(id_, {"metadata": {}})
+            item["embedding"] = embeddings[i]
+            item["document"] = documents[i]
+            self._merge(item, metadatas[i] if metadatas else None)
+
+    def update(self, ids, metadatas):
+        self.writes.append(list(ids))
+        self.updated_metadatas += metadatas
+        for id_, metadata in zip(ids, metadatas):
+            self._merge(self.items[id_], metadata)
+
+    @staticmethod
+    def _merge(item: Dict[str, Any], metadata: Optional[Dict[str, Any]]) -> None:
+        if metadata:
+            merged = {**item["metadata"], **metadata}
+            item["metadata"] = {key: value for key, value in merged.items() if value is not None}
+
+
+def make_documents(count: int, start: int = 0) -> List[Document]:
+    """doc-000 형식 id 와 index metadata 를 가진 문서 (본문 30바이트 = 추정 11토큰)"""
+    return [
+        Document(id=f"doc-{i:03d}", page_content=f"{'a' * 26}{i:04d}", metadata={"index": i})
+        for i in range(start, start + count)
+    ]
+
+
+def create_manager(collection: FakeCollection, embeddings: FakeEmbeddings) -> ChromaManager:
+    """초기화된 상태로 "docs" 컬렉션을 가진 ChromaManager (검색 결과 캐시 미사용)"""
+    manager = ChromaManager()
+    manager.search_cache = None
+    manager.embeddings = embeddings
+    manager.client = object()
+    manager._initialized = True
+    manager.collections["docs"] = SimpleNamespace(_collection=collection)
+    return manager
+
+
+@pytest.mark.unit
+class TestChromaManagerIngest:
+    """ChromaManager 대량 적재 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        monkeypatch.setattr(settings, "CHROMA_INGEST_WRITE_BATCH_SIZE", 10)
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_TOKENS", 100000)
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_SIZE", 512)
+        monkeypatch.setattr(settings, "CHROMA_INGEST_CONCURRENCY", 2)
+        self.collection = FakeCollection()
+        self.embeddings = FakeEmbeddings()
+        self.manager = create_manager(self.collection, self.embeddings)
+
+    async def test_embedding_requests_respect_token_budget(self, monkeypatch):
+        """추정 토큰 합이 예산을 넘기 전에 요청을 나누고, 예산보다 큰 문서는 단독 요청"""
+        # Given - 예산 25토큰: 11토큰 문서 2개까지 한 요청
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_TOKENS", 25)
+        documents = make_documents(2) + [Document(id="doc-big", page_content="b" * 300)] + make_documents(1, start=2)
+
+        # When
+        result = await self.manager.add_documents(documents, "docs")
+
+        # Then
+        assert [len(call) for call in self.embeddings.calls] == [2, 1, 1]
+        assert self.embeddings.calls[1] == ["b" * 300]
+        assert (result.written, result.failed) == (4, 0)
+
+    async def test_embedding_requests_respect_document_limit(self, monkeypatch):
+        """요청당 문서 수 한도로도 요청을 나눔"""
+        # Given
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_SIZE", 3)
+
+        # When
+        result = await self.manager.add_documents(make_documents(7), "docs")
+
+        # Then - 쓰기 배치(10개)는 1번 기록
+        assert [len(call) for call in self.embeddings.calls] == [3, 3, 1]
+        assert len(self.collection.writes) == 1
+        assert result.written == 7
+
+    async def test_add_documents_resumes_after_interruption(self):
+        """같은 입력으로 다시 실행하면 이미 기록된 문서는 임베딩 없이 건너뜀"""
+        # Given - 앞의 3개만 기록된 상태에서 중단
+        documents = make_documents(6)
+        await self.manager.add_documents(documents[:3], "docs")
+        self.embeddings.calls.clear()
+
+        # When
+        resumed = await self.manager.add_documents(documents, "docs")
+        repeated = await self.manager.add_documents(documents, "docs")
+
+        # Then
+        assert self.embeddings.calls == [[d.page_content for d in documents[3:]]]
+        assert (resumed.skipped, resumed.written, resumed.failed) == (3, 3, 0)
+        assert (repeated.skipped, repeated.written) == (6, 0)
+        assert set(self.collection.items) == {d.id for d in documents}
+
+    async def test_progress_reported_per_write_batch(self, monkeypatch):
+        """쓰기 배치마다 기록 수와 마지막 id 를 보고"""
+        # Given
+        monkeypatch.setattr(settings, "CHROMA_INGEST_WRITE_BATCH_SIZE", 2)
+        reports = []
+
+        def progress(state: IngestProgress) -> None:
+            reports.append((state.written, state.last_id))
+
+        # When
+        result = await self.manager.add_documents(make_documents(5), "docs", progress=progress)
+
+        # Then
+        assert reports == [(2, "doc-001"), (4, "doc-003"), (5, "doc-004")]
+        assert (result.received, result.written, result.last_id) == (5, 5, "doc-004")
+
+    async def test_document_without_id_is_reported_failed(self, monkeypatch):
+        """id 없는 문서는 실패로 집계하고 앞뒤 배치는 그대로 적재"""
+        # Given - 두 번째 쓰기 배치에 id 없는 문서
+        monkeypatch.setattr(settings, "CHROMA_INGEST_WRITE_BATCH_SIZE", 2)
+        documents = make_documents(2) + [Document(page_content="no id")] + make_documents(1, start=3)
+
+        # When
+        result = await self.manager.add_documents(documents, "docs")
+
+        # Then
+        assert (result.received, result.written, result.failed) == (4, 3, 1)
+        assert set(self.collection.items) == {"doc-000", "doc-001", "doc-003"}
+        assert result.last_id == "doc-003"
+
+    async def test_failed_embedding_request_is_counted(self, monkeypatch):
+        """실패한 임베딩 요청의 문서만 실패로 집계하고 나머지는 기록"""
+        # Given
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_SIZE", 1)
+        documents = make_documents(2) + [Document(id="doc-fail", page_content="fail")]
+
+        # When
+        result = await self.manager.add_documents(documents, "docs")
+
+        # Then
+        assert (result.written, result.failed) == (2, 1)
+        assert "doc-fail" not in self.collection.items
+
+
+@pytest.mark.unit
+class TestChromaManagerUpdate:
+    """ChromaManager 문서 일괄 업데이트 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정 (doc-000 ~ doc-003 저장)"""
+        monkeypatch.setattr(settings, "CHROMA_INGEST_WRITE_BATCH_SIZE", 10)
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_TOKENS", 100000)
+        monkeypatch.setattr(settings, "CHROMA_INGEST_EMBED_BATCH_SIZE", 512)
+        self.collection = FakeCollection()
+        self.embeddings = FakeEmbeddings()
+        self.manager = create_manager(self.collection, self.embeddings)
+        await self.manager.upsert_documents(make_documents(4), "docs")
+        self.embeddings.calls.clear()
+        self.collection.writes.clear()
+
+    async def test_same_content_updates_metadata_without_embedding(self):
+        """본문이 같으면 임베딩 없이 metadata 만 갱신"""
+        # Given
+        document = make_documents(1)[0]
+        document.metadata = {"index": 0, "tag": "faq"}
+
+        # When
+        result = await self.manager.update_documents([document], "docs")
+
+        # Then
+        assert result == {"embedded": 0, "metadata_only": 1}
+        assert self.embeddings.calls == []
+        assert self.collection.items["doc-000"]["metadata"] == {"index": 0, "tag": "faq"}
+
+    async def test_removed_metadata_keys_are_deleted(self):
+        """새 metadata 에 없는 기존 키는 None 으로 지정해 삭제"""
+        # Given
+        self.collection.items["doc-000"]["metadata"] = {"index": 0, "tag": "faq", "draft": True}
+        document = make_documents(1)[0]
+        document.metadata = {"tag": "faq"}
+
+        # When
+        await self.manager.update_documents([document], "docs")
+
+        # Then
+        assert self.collection.updated_metadatas == [{"tag": "faq", "index": None, "draft": None}]
+        assert self.collection.items["doc-000"]["metadata"] == {"tag": "faq"}
+
+    async def test_changed_content_is_embedded_again(self):
+        """본문이 바뀐 문서와 새 문서만 임베딩해 upsert"""
+        # Given
+        changed = Document(id="doc-001", page_content="changed", metadata={"index": 1})
+        created = Document(id="doc-new", page_content="new", metadata={"index": 9})
+
+        # When
+        result = await self.manager.update_documents(make_documents(1) + [changed, created], "docs")
+
+        # Then
+        assert result == {"embedded": 2, "metadata_only": 1}
+        assert self.embeddings.calls == [["changed", "new"]]
+        assert self.collection.items["doc-001"]["document"] == "changed"
+        assert self.collection.items["doc-new"]["embedding"] == [3.0]
+
+    async def test_upserts_are_batched(self, monkeypatch):
+        """쓰기 배치 크기 단위로 조회/임베딩/upsert"""
+        # Given
+        monkeypatch.setattr(settings, "CHROMA_INGEST_WRITE_BATCH_SIZE", 2)
+        documents = [Document(id=f"doc-{i:03d}", page_content=f"updated {i}", metadata={"index": i}) for i in range(5)]
+
+        # When
+        result = await self.manager.update_documents(documents, "docs")
+
+        # Then
+        assert result == {"embedded": 5, "metadata_only": 0}
+        assert [len(call) for call in self.embeddings.calls] == [2, 2, 1]
+        assert self.collection.writes == [["doc-000", "doc-001"], ["doc-002", "doc-003"], ["doc-004"]]
+
+    async def test_document_without_id_writes_nothing(self, monkeypatch):
+        """id 없는 문서가 있으면 어떤 배치도 기록하지 않고 실패"""
+        # Given - id 없는 문서가 두 번째 배치에 있음
+        monkeypatch.setattr(settings, "CHROMA_INGEST_WRITE_BATCH_SIZE", 1)
+        documents = [Document(id="doc-000", page_content="updated"), Document(page_content="no id")]
+
+        # When
+        result = await self.manager.update_documents(documents, "docs")
+
+        # Then
+        assert result is None
+        assert self.collection.writes == []
+        assert self.embeddings.calls == []
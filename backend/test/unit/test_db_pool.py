@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.pool import InstrumentedAsyncQueuePool
+from app.database.session import get_engine_pool_stats
+
+
+@pytest.fixture
+async def small_pool_engine(tmp_path):
+    """커넥션 1개, overflow 없는 계측 풀 엔진"""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInstrumentedAsyncQueuePool:
+    """InstrumentedAsyncQueuePool 단위 테스트"""
+
+    async def test_checkout_is_recorded(self, small_pool_engine):
+        """체크아웃 수와 대기 시간이 기록되는지 테스트"""
+        # When
+        for _ in range(3):
+            async with small_pool_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        # Then
+        stats = get_engine_pool_stats(small_pool_engine)
+        assert stats["checkouts"] == 3
+        assert stats["timeouts"] == 0
+        assert stats["checked_out"] == 0
+        assert stats["size"] == 1
+        assert stats["max_overflow"] == 0
+        assert stats["wait_seconds_max"] >= 0
+
+    async def test_exhausted_pool_records_timeout(self, small_pool_engine):
+        """풀이 고갈되면 타임아웃이 기록되는지 테스트"""
+        # Given - 유일한 커넥션 점유
+        async with small_pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+            # When & Then
+            with pytest.raises(exc.TimeoutError):
+                async with small_pool_engine.connect():
+                    pass
+
+            stats = get_engine_pool_stats(small_pool_engine)
+            assert stats["checked_out"] == 1
+            assert stats["timeouts"] == 1
+            assert stats["checkouts"] == 1
@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from typing import Dict, Optional
+
+from app.core.lock.base import DistributedLock
+
+
+class InMemoryLock(DistributedLock):
+    """테스트용 인메모리 락 (TTL 만료 없음)"""
+
+    def __init__(self):
+        self.held: Dict[str, int] = {}
+        self.extend_calls = 0
+        self.extend_result = True
+
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
+        if name in self.held:
+            return False
+        self.held[name] = ttl
+        return True
+
+    async def release(self, name: str) -> bool:
+        return self.held.pop(name, None) is not None
+
+    async def extend(self, name: str, ttl: int) -> bool:
+        self.extend_calls += 1
+        return self.extend_result
+
+    async def is_locked(self, name: str) -> bool:
+        return name in self.held
+
+
+@pytest.mark.unit
+class TestDistributedLockWatchdog:
+    """DistributedLock.lock() watchdog 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.lock = InMemoryLock()
+
+    async def test_watchdog_renews_while_body_runs(self):
+        """본문 실행 중 주기적으로 TTL 연장"""
+        # When
+        async with self.lock.lock("job", ttl=1, watchdog=True, renew_interval=0.01) as acquired:
+            assert acquired
+            await asyncio.sleep(0.055)
+
+        # Then
+        assert self.lock.extend_calls >= 3
+        assert not await self.lock.is_locked("job")
+
+    async def test_watchdog_stops_on_exit(self):
+        """컨텍스트 종료 후에는 연장하지 않음"""
+        # Given
+        async with self.lock.lock("job", ttl=1, watchdog=True, renew_interval=0.01):
+            await asyncio.sleep(0.025)
+        calls = self.lock.extend_calls
+
+        # When
+        await asyncio.sleep(0.03)
+
+        # Then
+        assert self.lock.extend_calls == calls
+
+    async def test_lease_lost_reported(self):
+        """연장 실패 시 on_lease_lost 콜백 호출"""
+        # Given
+        self.lock.extend_result = False
+        lost = []
+
+        async def on_lost(name: str):
+            lost.append(name)
+
+        # When
+        async with self.lock.lock("job", ttl=1, watchdog=True, renew_interval=0.01, on_lease_lost=on_lost):
+            await asyncio.sleep(0.05)
+
+        # Then - 한 번 보고 후 watchdog 종료
+        assert lost == ["job"]
+        assert self.lock.extend_calls == 1
+
+    async def test_no_watchdog_when_not_acquired(self):
+        """획득 실패 시 watchdog 미실행"""
+        # Given
+        await self.lock.acquire("job")
+
+        # When
+        async with self.lock.lock("job", ttl=1, watchdog=True, renew_interval=0.01) as acquired:
+            await asyncio.sleep(0.03)
+
+        # Then
+        assert acquired is False
+        assert self.lock.extend_calls == 0
+        assert await self.lock.is_locked("job")
+
+    async def test_default_has_no_watchdog(self):
+        """watchdog 미사용 시 기존 동작 유지"""
+        # When
+        async with self.lock.lock("job", ttl=1) as acquired:
+            await asyncio.sleep(0.02)
+
+        # Then
+        assert acquired is True
+        assert self.lock.extend_calls == 0
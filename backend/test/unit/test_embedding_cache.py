@@ -0,0 +1,163 @@
+import sqlite3
+import pytest
+
+from app.core.embedding_cache import EmbeddingCache
+
+
+class FakeEmbedder:
+    """호출된 텍스트를 기록하는 가짜 임베딩 함수"""
+
+    def __init__(self):
+        self.calls = []
+
+    def vector(self, text: str):
+        return [float(len(text)), 0.5, -0.25]
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [self.vector(text) for text in texts]
+
+    async def aembed(self, texts):
+        return self(texts)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "embeddings.sqlite3")
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """EmbeddingCache 단위 테스트"""
+
+    def test_cached_texts_are_not_embedded_again(self, cache_path):
+        """이미 임베딩한 텍스트는 다시 임베딩하지 않는지 테스트"""
+        # Given
+        cache = EmbeddingCache(cache_path, "model-a")
+        embedder = FakeEmbedder()
+
+        # When - 첫 배치(배치 내 중복 포함) 후 같은 텍스트 재요청
+        first = cache.get_or_embed(["hello", "world", "hello"], embedder)
+        second = cache.get_or_embed(["world", "hello"], embedder)
+
+        # Then
+        assert embedder.calls == [["hello", "world"]]
+        assert first == [embedder.vector("hello"), embedder.vector("world"), embedder.vector("hello")]
+        assert second == [embedder.vector("world"), embedder.vector("hello")]
+        assert cache.get_stats()["l1_hits"] == 2
+        assert cache.get_stats()["misses"] == 2
+
+    def test_key_uses_model_and_normalized_text(self, cache_path):
+        """키는 모델 이름과 공백 정규화된 텍스트로 결정되는지 테스트"""
+        # Given
+        cache_a = EmbeddingCache(cache_path, "model-a")
+        cache_b = EmbeddingCache(cache_path, "model-b")
+
+        # When & Then
+        assert cache_a.key("hello   world\n") == cache_a.key(" hello world")
+        assert cache_a.key("hello world") != cache_b.key("hello world")
+
+    def test_persistent_tier_survives_new_instance(self, cache_path):
+        """새 인스턴스(재시작/다른 워커)에서 디스크 캐시를 사용하는지 테스트"""
+        # Given
+        EmbeddingCache(cache_path, "model-a").get_or_embed(["persist me"], FakeEmbedder())
+        cache = EmbeddingCache(cache_path, "model-a")
+        embedder = FakeEmbedder()
+
+        # When
+        vectors = cache.get_or_embed(["persist me"], embedder)
+
+        # Then - float16 으로 저장되어도 정확히 표현 가능한 값
+        assert embedder.calls == []
+        assert vectors == [embedder.vector("persist me")]
+        assert cache.get_stats()["l2_hits"] == 1
+
+    def test_float16_storage_is_compact(self, cache_path):
+        """float16 은 차원당 2바이트로 저장되는지 테스트"""
+        # Given
+        cache = EmbeddingCache(cache_path, "model-a", dtype="float16")
+
+        # When
+        cache.get_or_embed(["compact"], lambda texts: [[0.1] * 3072 for _ in texts])
+
+        # Then
+        size = cache._db.execute("SELECT length(vector) FROM embedding").fetchone()[0]
+        assert size == 3072 * 2
+
+    def test_unsupported_dtype_raises(self, cache_path):
+        """지원하지 않는 dtype 은 ValueError"""
+        # When & Then
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            EmbeddingCache(cache_path, "model-a", dtype="int8")
+
+    @pytest.mark.asyncio
+    async def test_async_path_shares_cache(self, cache_path):
+        """비동기 경로도 같은 캐시를 사용하는지 테스트"""
+        # Given
+        cache = EmbeddingCache(cache_path, "model-a")
+        embedder = FakeEmbedder()
+        cache.get_or_embed(["shared"], embedder)
+
+        # When
+        vectors = await cache.aget_or_embed(["shared", "new"], embedder.aembed)
+
+        # Then
+        assert embedder.calls == [["shared"], ["new"]]
+        assert vectors == [embedder.vector("shared"), embedder.vector("new")]
+
+    def test_prune_removes_entries_unused_past_max_age(self, cache_path):
+        """마지막 사용 후 max_age 가 지난 항목만 삭제하는지 테스트"""
+        # Given
+        cache = EmbeddingCache(cache_path, "model-a", max_age=3600)
+        cache.get_or_embed(["old", "fresh"], FakeEmbedder())
+        cache._db.execute("UPDATE embedding SET last_used = last_used - 7200 WHERE key = ?", (cache.key("old"),))
+        cache._db.commit()
+
+        # When
+        pruned = cache.prune()
+
+        # Then - 새 인스턴스(L1 없음)에서 삭제된 항목만 다시 임베딩
+        embedder = FakeEmbedder()
+        EmbeddingCache(cache_path, "model-a", max_age=3600).get_or_embed(["old", "fresh"], embedder)
+        assert pruned == 1
+        assert embedder.calls == [["old"]]
+        assert cache.get_stats()["pruned"] == 1
+
+    def test_prune_keeps_most_recently_used_entries(self, cache_path):
+        """max_entries 를 넘으면 L2 에서 가장 오래 사용하지 않은 항목부터 삭제하는지 테스트"""
+        # Given - a, b, c 순서로 저장 후 새 인스턴스에서 a 를 조회해 사용 시각 갱신
+        writer = EmbeddingCache(cache_path, "model-a", max_entries=2)
+        for index, text in enumerate(["a", "b", "c"]):
+            writer.get_or_embed([text], FakeEmbedder())
+            writer._db.execute("UPDATE embedding SET last_used = ? WHERE key = ?", (1000.0 + index, writer.key(text)))
+        writer._db.commit()
+        cache = EmbeddingCache(cache_path, "model-a", max_entries=2)
+        cache.get_or_embed(["a"], FakeEmbedder())
+
+        # When
+        pruned = cache.prune()
+
+        # Then
+        keys = {row[0] for row in cache._db.execute("SELECT key FROM embedding")}
+        assert pruned == 1
+        assert keys == {cache.key("a"), cache.key("c")}
+
+    def test_existing_file_without_usage_column_is_migrated(self, cache_path):
+        """이전 버전 파일은 사용 시각 컬럼과 auto_vacuum 을 추가해 그대로 사용하는지 테스트"""
+        # Given - last_used 컬럼이 없는 이전 버전 파일
+        EmbeddingCache(cache_path, "model-a").close()
+        conn = sqlite3.connect(cache_path)
+        conn.execute("PRAGMA auto_vacuum=NONE")
+        conn.execute("DROP TABLE embedding")
+        conn.execute("CREATE TABLE embedding (key TEXT PRIMARY KEY, dtype TEXT NOT NULL, vector BLOB NOT NULL)")
+        conn.execute("VACUUM")
+        conn.close()
+
+        # When
+        cache = EmbeddingCache(cache_path, "model-a", max_entries=10)
+        cache.get_or_embed(["migrated"], FakeEmbedder())
+
+        # Then
+        assert cache._db.execute("PRAGMA auto_vacuum").fetchone() == (2,)
+        assert cache._db.execute("SELECT last_used > 0 FROM embedding").fetchone() == (1,)
+        assert cache.prune() == 0
@@ -0,0 +1,250 @@
+import pytest
+from typing import Any, Dict, List, Optional, Tuple
+
+pytest.importorskip("chromadb")
+pytest.importorskip("langgraph.checkpoint.sqlite")
+pytest.importorskip("langchain_community")
+
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage, RemoveMessage
+
+from app.config.setting import settings
+from app.core.graph.example import graph_orchestrator as orchestrator_module
+from app.core.graph.example.graph_orchestrator import GraphOrchestrator
+
+
+class StubGraph:
+    """정해진 (stream_mode, chunk) 목록을 내보내는 테스트용 컴파일 그래프 (error 가 있으면 마지막에 발생)"""
+
+    def __init__(self, chunks: List[Tuple[str, Any]], error: Optional[Exception] = None):
+        self.chunks = chunks
+        self.error = error
+        self.calls: List[Dict[str, Any]] = []
+
+    async def astream(self, input_data, config, stream_mode):
+        self.calls.append({"input": input_data, "config": config, "stream_mode": stream_mode})
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+
+class FakeMaintainer:
+    """스레드 실행 기록만 남기는 테스트용 체크포인트 유지보수"""
+
+    def __init__(self):
+        self.touched: List[str] = []
+
+    async def touch(self, thread_id: str) -> None:
+        self.touched.append(thread_id)
+
+
+class FakeResponseCache:
+    """저장 호출만 기록하는 테스트용 응답 캐시"""
+
+    def __init__(self):
+        self.stored: List[Tuple[str, str, str, int]] = []
+
+    async def store(self, question: str, session_id: str, answer: str, tokens: int = 0) -> None:
+        self.stored.append((question, session_id, answer, tokens))
+
+
+class StubLLMManager:
+    """글자 수를 토큰 수로 세는 테스트용 LLM 매니저 (trim_messages 의 token_counter)"""
+
+    def get_model(self, model_name: str):
+        return lambda messages: sum(len(message.content) for message in messages)
+
+
+class StubChain:
+    """입력을 기록하고 고정 요약을 반환하는 테스트용 체인"""
+
+    def __init__(self):
+        self.inputs: List[Dict[str, Any]] = []
+
+    async def ainvoke(self, inputs: Dict[str, Any]) -> str:
+        self.inputs.append(inputs)
+        return "새 요약"
+
+
+class StubChainManager:
+    """history_summary 체인만 제공하는 테스트용 체인 매니저"""
+
+    def __init__(self):
+        self.summary_chain = StubChain()
+
+    def get_chain(self, name: str) -> StubChain:
+        assert name == "history_summary"
+        return self.summary_chain
+
+
+def conversation(turns: int) -> List[BaseMessage]:
+    """질문/답변 각 10글자(=10토큰)인 대화 (id: h1, a1, h2, a2, ...)"""
+    messages: List[BaseMessage] = []
+    for turn in range(1, turns + 1):
+        messages.append(HumanMessage(content=f"question{turn:02d}", id=f"h{turn}"))
+        messages.append(AIMessage(content=f"answer-{turn:03d}", id=f"a{turn}"))
+    return messages
+
+
+def token(content: str, node: str = "ExampleResponse") -> Tuple[str, Any]:
+    return "messages", (AIMessageChunk(content=content), {"langgraph_node": node})
+
+
+@pytest.mark.unit
+class TestGraphOrchestratorStream:
+    """GraphOrchestrator.astream 이벤트 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+        self.orchestrator = GraphOrchestrator(prompt_manager=None, chain_manager=None)
+        self.orchestrator.checkpoint_maintainer = FakeMaintainer()
+        self.orchestrator.response_cache = FakeResponseCache()
+
+    async def collect(self, graph: StubGraph) -> List[Dict[str, Any]]:
+        self.orchestrator._graph = graph
+        return [event async for event in self.orchestrator.astream("환불 규정은?", "session-1")]
+
+    async def test_events_are_streamed_in_order(self):
+        """검색 완료 → 응답 노드 토큰 → done 순서로 전달하고 다른 노드/빈 토큰은 제외"""
+        # Given
+        graph = StubGraph([
+            ("updates", {"RetrieveDocument": {"documents": [Document(page_content="a"), Document(page_content="b")]}}),
+            token("무시", node="RetrieveDocument"),
+            token("7일"),
+            token(""),
+            token(" 이내"),
+            ("updates", {"ExampleResponse": {"answer": AIMessage(content="7일 이내")}}),
+        ])
+
+        # When
+        events = await self.collect(graph)
+
+        # Then
+        assert [event["event"] for event in events] == ["retrieval", "token", "token", "done"]
+        assert events[0]["data"] == {"documents": 2}
+        assert [event["data"]["content"] for event in events[1:3]] == ["7일", " 이내"]
+        done = events[-1]["data"]
+        assert done["answer"] == "7일 이내"
+        assert done["cache_hit"] is False
+        assert done["time_to_first_token"] is not None
+        assert graph.calls[0]["config"] == {"configurable": {"thread_id": "session-1"}}
+        assert graph.calls[0]["stream_mode"] == ["updates", "messages"]
+        assert self.orchestrator.checkpoint_maintainer.touched == ["session-1"]
+        assert self.orchestrator.response_cache.stored == [("환불 규정은?", "session-1", "7일 이내", 0)]
+
+    async def test_cache_hit_streams_whole_answer(self):
+        """응답 캐시 hit 이면 cache_hit → 전체 답변 token 1개 → done 순서로 전달하고 다시 저장하지 않음"""
+        # Given
+        graph = StubGraph([
+            ("updates", {"ResponseCache": {"cache_hit": True, "answer": AIMessage(content="캐시 답변")}}),
+        ])
+
+        # When
+        events = await self.collect(graph)
+
+        # Then
+        assert [event["event"] for event in events] == ["cache_hit", "token", "done"]
+        assert events[1]["data"] == {"content": "캐시 답변"}
+        assert events[-1]["data"]["cache_hit"] is True
+        assert self.orchestrator.response_cache.stored == []
+
+    async def test_graph_error_stops_before_done(self):
+        """그래프 실행 중 오류는 이미 보낸 토큰 뒤에 전파되고 done 은 보내지 않음"""
+        # Given
+        graph = StubGraph([token("7일")], error=RuntimeError("llm failed"))
+        events: List[Dict[str, Any]] = []
+
+        # When
+        self.orchestrator._graph = graph
+        with pytest.raises(RuntimeError, match="llm failed"):
+            async for event in self.orchestrator.astream("환불 규정은?", "session-1"):
+                events.append(event)
+
+        # Then
+        assert [event["event"] for event in events] == ["token"]
+        assert self.orchestrator.response_cache.stored == []
+
+
+@pytest.mark.unit
+class TestGraphOrchestratorHistory:
+    """대화 히스토리 토큰 한도 정리(삭제/요약) 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+        monkeypatch.setattr(orchestrator_module, "get_llm_manager", lambda: StubLLMManager())
+        self.chain_manager = StubChainManager()
+        self.orchestrator = GraphOrchestrator(prompt_manager=None, chain_manager=self.chain_manager)
+
+    def test_history_within_limit_is_kept(self, monkeypatch):
+        """한도 안이면 삭제할 메시지 없음"""
+        # Given
+        monkeypatch.setattr(settings, "AGENT_HISTORY_MAX_TOKENS", 60)
+
+        # When
+        result = self.orchestrator._trim_history({"messages": conversation(3)})
+
+        # Then
+        assert result == {}
+
+    def test_oldest_turns_are_removed(self, monkeypatch):
+        """한도를 넘은 오래된 대화는 RemoveMessage 로 삭제하고 최근 대화를 유지"""
+        # Given - 45토큰: 최근 2턴(40토큰)까지 유지
+        monkeypatch.setattr(settings, "AGENT_HISTORY_MAX_TOKENS", 45)
+        messages = conversation(3)
+
+        # When
+        kept, _ = self.orchestrator._split_history(messages)
+        result = self.orchestrator._trim_history({"messages": messages})
+
+        # Then
+        assert [message.id for message in kept] == ["h2", "a2", "h3", "a3"]
+        assert all(isinstance(message, RemoveMessage) for message in result["messages"])
+        assert [message.id for message in result["messages"]] == ["h1", "a1"]
+
+    def test_kept_history_starts_on_human_message(self, monkeypatch):
+        """한도 경계가 답변에 걸리면 그 답변도 삭제해 유지 히스토리가 질문으로 시작"""
+        # Given - 35토큰: a2, h3, a3 까지 들어가지만 a2 로 시작할 수 없음
+        monkeypatch.setattr(settings, "AGENT_HISTORY_MAX_TOKENS", 35)
+        messages = conversation(3)
+
+        # When
+        kept, removed = self.orchestrator._split_history(messages)
+
+        # Then
+        assert isinstance(kept[0], HumanMessage)
+        assert [message.id for message in kept] == ["h3", "a3"]
+        assert [message.id for message in removed] == ["h1", "a1", "h2", "a2"]
+
+    async def test_summary_folds_removed_turns(self, monkeypatch):
+        """요약 모드는 밀려난 대화를 기존 요약과 합친 새 요약으로 저장하고 메시지 삭제"""
+        # Given
+        monkeypatch.setattr(settings, "AGENT_HISTORY_MAX_TOKENS", 45)
+        state = {"messages": conversation(3), "summary": "이전 요약"}
+
+        # When
+        result = await self.orchestrator._summarize_history(state)
+
+        # Then
+        assert result["summary"] == "새 요약"
+        assert [message.id for message in result["messages"]] == ["h1", "a1"]
+        assert self.chain_manager.summary_chain.inputs == [{
+            "summary": "이전 요약",
+            "history": "질문1 - question01\n\n답변2 - answer-001",
+        }]
+
+    async def test_summary_skipped_within_limit(self, monkeypatch):
+        """한도 안이면 요약 체인을 호출하지 않음"""
+        # Given
+        monkeypatch.setattr(settings, "AGENT_HISTORY_MAX_TOKENS", 60)
+
+        # When
+        result = await self.orchestrator._summarize_history({"messages": conversation(3)})
+
+        # Then
+        assert result == {}
+        assert self.chain_manager.summary_chain.inputs == []
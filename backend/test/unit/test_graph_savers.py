@@ -0,0 +1,424 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+
+pytest.importorskip("langgraph.checkpoint.base")
+
+from langgraph.checkpoint.base import ERROR, empty_checkpoint
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.graph import savers as savers_module
+from app.core.graph.savers import PostgresCheckpointSaver, RedisCheckpointSaver
+from app.database.model.graph_checkpoint import GraphCheckpoint, GraphCheckpointWrite
+from app.database.session import Base
+
+
+class FakePipeline:
+    """명령을 모았다가 execute 에서 순서대로 실행하는 테스트용 파이프라인 (중간에 다른 명령이 끼어들지 않음)"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: List[Any] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.redis, name), args, kwargs))
+        return queue
+
+    async def execute(self) -> List[Any]:
+        return [await command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (hash/set/score 0 sorted set 과 TTL 기록만 지원)"""
+
+    def __init__(self):
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.sets: Dict[str, Set[str]] = {}
+        self.zsets: Dict[str, List[str]] = {}   # score 가 모두 0 이므로 사전순 정렬 목록
+        self.ttls: Dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    @staticmethod
+    def _range(items: List[str], start: int, stop: int) -> List[str]:
+        size = len(items)
+        start = max(start + size if start < 0 else start, 0)
+        stop = stop + size if stop < 0 else stop
+        return items[start:stop + 1]
+
+    async def hset(self, key, field=None, value=None, mapping=None) -> int:
+        values = dict(mapping or {})
+        if field is not None:
+            values[field] = value
+        self.hashes.setdefault(key, {}).update(values)
+        return len(values)
+
+    async def hsetnx(self, key, field, value) -> int:
+        data = self.hashes.setdefault(key, {})
+        if field in data:
+            return 0
+        data[field] = value
+        return 1
+
+    async def hgetall(self, key) -> Dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def sadd(self, key, *members) -> int:
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def smembers(self, key) -> Set[str]:
+        return set(self.sets.get(key, set()))
+
+    async def zadd(self, key, mapping) -> int:
+        members = self.zsets.setdefault(key, [])
+        added = [member for member in mapping if member not in members]
+        members.extend(added)
+        members.sort()
+        return len(added)
+
+    async def zrange(self, key, start, stop) -> List[str]:
+        return self._range(self.zsets.get(key, []), start, stop)
+
+    async def zremrangebyrank(self, key, start, stop) -> int:
+        removed = self._range(self.zsets.get(key, []), start, stop)
+        self.zsets[key] = [member for member in self.zsets.get(key, []) if member not in removed]
+        return len(removed)
+
+    async def zrevrangebylex(self, key, max, min, start=None, num=None) -> List[str]:
+        members = list(reversed(self.zsets.get(key, [])))
+        if max.startswith("("):
+            members = [member for member in members if member < max[1:]]
+        if start is not None:
+            members = members[start:start + num]
+        return members
+
+    async def expire(self, key, seconds) -> bool:
+        self.ttls[key] = seconds
+        return True
+
+    async def delete(self, *keys) -> int:
+        deleted = 0
+        for key in keys:
+            for store in (self.hashes, self.sets, self.zsets):
+                deleted += store.pop(key, None) is not None
+            self.ttls.pop(key, None)
+        return deleted
+
+
+class FakeLock:
+    """테스트용 락 (항상 즉시 획득)"""
+
+    @asynccontextmanager
+    async def lock(self, name: str, **kwargs):
+        yield True
+
+
+def thread_config(thread_id: str = "thread-1", checkpoint_id: Optional[str] = None) -> Dict[str, Any]:
+    configurable = {"thread_id": thread_id, "checkpoint_ns": ""}
+    if checkpoint_id:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+async def put_checkpoints(saver, thread_id: str, ids: List[str]) -> None:
+    """ids 순서대로 부모-자식으로 이어진 체크포인트 기록 (step = 순번, 짝수 step 은 source=loop)"""
+    parent: Optional[str] = None
+    for step, checkpoint_id in enumerate(ids):
+        checkpoint = {**empty_checkpoint(), "id": checkpoint_id}
+        metadata = {"step": step, "source": "loop" if step % 2 == 0 else "input"}
+        await saver.aput(thread_config(thread_id, parent), checkpoint, metadata, {})
+        parent = checkpoint_id
+
+
+class SaverContract:
+    """PostgreSQL / Redis saver 공통 동작 (하위 클래스가 make_saver, count_writes, maintain 제공)"""
+
+    async def make_saver(self, keep_last: int = 0, thread_ttl: int = 0):
+        raise NotImplementedError
+
+    async def maintain(self, saver) -> None:
+        """keep_last 정리를 주기 작업에서 하는 저장소는 여기서 실행"""
+
+    async def count_writes(self, thread_id: str) -> int:
+        raise NotImplementedError
+
+    async def test_round_trip(self):
+        """기록한 체크포인트/메타데이터/부모/pending writes 를 그대로 조회"""
+        # Given
+        saver = await self.make_saver()
+        await put_checkpoints(saver, "thread-1", ["0001", "0002"])
+        await saver.aput_writes(thread_config("thread-1", "0002"), [("messages", "안녕"), ("answer", 7)], "task-1")
+
+        # When
+        latest = await saver.aget_tuple(thread_config("thread-1"))
+        first = await saver.aget_tuple(thread_config("thread-1", "0001"))
+        missing = await saver.aget_tuple(thread_config("thread-2"))
+
+        # Then
+        assert latest.checkpoint["id"] == "0002"
+        assert latest.metadata == {"step": 1, "source": "input"}
+        assert latest.config == thread_config("thread-1", "0002")
+        assert latest.parent_config == thread_config("thread-1", "0001")
+        assert latest.pending_writes == [("task-1", "messages", "안녕"), ("task-1", "answer", 7)]
+        assert first.parent_config is None
+        assert first.pending_writes == []
+        assert missing is None
+
+    async def test_list_before_limit_filter(self):
+        """최신순으로 before 이전, limit 개수, metadata filter 를 적용"""
+        # Given
+        saver = await self.make_saver()
+        await put_checkpoints(saver, "thread-1", ["0001", "0002", "0003", "0004", "0005"])
+
+        async def ids(**kwargs) -> List[str]:
+            return [item.checkpoint["id"] async for item in saver.alist(thread_config("thread-1"), **kwargs)]
+
+        # When & Then
+        assert await ids() == ["0005", "0004", "0003", "0002", "0001"]
+        assert await ids(before=thread_config("thread-1", "0004")) == ["0003", "0002", "0001"]
+        assert await ids(limit=2) == ["0005", "0004"]
+        assert await ids(filter={"source": "loop"}) == ["0005", "0003", "0001"]
+        assert await ids(filter={"source": "loop"}, limit=2) == ["0005", "0003"]
+        assert await ids(filter={"source": "loop"}, before=thread_config("thread-1", "0005"), limit=1) == ["0003"]
+
+    async def test_regular_writes_keep_first(self):
+        """일반 채널은 같은 task/idx 를 다시 기록해도 최초 값 유지"""
+        # Given
+        saver = await self.make_saver()
+        await put_checkpoints(saver, "thread-1", ["0001"])
+        config = thread_config("thread-1", "0001")
+
+        # When
+        await saver.aput_writes(config, [("messages", "first")], "task-1")
+        await saver.aput_writes(config, [("messages", "second")], "task-1")
+
+        # Then
+        assert (await saver.aget_tuple(config)).pending_writes == [("task-1", "messages", "first")]
+
+    async def test_special_writes_overwrite(self):
+        """에러 등 WRITES_IDX_MAP 채널은 다시 기록하면 덮어씀"""
+        # Given
+        saver = await self.make_saver()
+        await put_checkpoints(saver, "thread-1", ["0001"])
+        config = thread_config("thread-1", "0001")
+
+        # When
+        await saver.aput_writes(config, [(ERROR, "first")], "task-1")
+        await saver.aput_writes(config, [(ERROR, "second")], "task-1")
+
+        # Then
+        assert (await saver.aget_tuple(config)).pending_writes == [("task-1", ERROR, "second")]
+
+    async def test_keep_last_removes_old_checkpoints_and_writes(self):
+        """기록 시 스레드별 최근 keep_last 개만 남기고 밀려난 체크포인트의 writes 도 삭제"""
+        # Given
+        saver = await self.make_saver(keep_last=2)
+        await put_checkpoints(saver, "thread-1", ["0001"])
+        await saver.aput_writes(thread_config("thread-1", "0001"), [("messages", "old")], "task-1")
+        await put_checkpoints(saver, "thread-2", ["0001"])
+
+        # When
+        await put_checkpoints(saver, "thread-1", ["0002", "0003"])
+        await saver.aput_writes(thread_config("thread-1", "0003"), [("messages", "new")], "task-1")
+        await self.maintain(saver)
+
+        # Then - 다른 스레드는 그대로
+        assert [item.checkpoint["id"] async for item in saver.alist(thread_config("thread-1"))] == ["0003", "0002"]
+        assert await saver.aget_tuple(thread_config("thread-1", "0001")) is None
+        assert await self.count_writes("thread-1") == 1
+        assert (await saver.aget_tuple(thread_config("thread-2"))).checkpoint["id"] == "0001"
+
+    async def test_put_same_checkpoint_does_not_over_evict(self):
+        """이미 있는 id 를 다시 기록해도 keep_last 개를 유지"""
+        # Given
+        saver = await self.make_saver(keep_last=2)
+        await put_checkpoints(saver, "thread-1", ["0001", "0002"])
+
+        # When
+        await saver.aput(thread_config("thread-1", "0001"), {**empty_checkpoint(), "id": "0002"}, {"step": 9}, {})
+        await self.maintain(saver)
+
+        # Then
+        assert [item.checkpoint["id"] async for item in saver.alist(thread_config("thread-1"))] == ["0002", "0001"]
+        assert (await saver.aget_tuple(thread_config("thread-1"))).metadata == {"step": 9}
+
+    async def test_delete_thread_removes_only_that_thread(self):
+        """스레드 삭제는 해당 스레드의 체크포인트와 writes 만 삭제"""
+        # Given
+        saver = await self.make_saver()
+        for thread_id in ("thread-1", "thread-2"):
+            await put_checkpoints(saver, thread_id, ["0001", "0002"])
+            await saver.aput_writes(thread_config(thread_id, "0002"), [("messages", "hi")], "task-1")
+
+        # When
+        await saver.delete_thread("thread-1")
+
+        # Then
+        assert await saver.aget_tuple(thread_config("thread-1")) is None
+        assert await self.count_writes("thread-1") == 0
+        assert (await saver.aget_tuple(thread_config("thread-2"))).checkpoint["id"] == "0002"
+        assert await self.count_writes("thread-2") == 1
+        assert saver.get_stats()["deleted_threads"] == 1
+
+    async def test_sync_api_delegates_from_other_thread(self):
+        """동기 API 는 다른 스레드에서 호출하면 비동기 구현에 위임하고, 이벤트 루프에서 호출하면 오류"""
+        # Given
+        saver = await self.make_saver()
+        await put_checkpoints(saver, "thread-1", ["0001", "0002"])
+
+        # When
+        latest = await asyncio.to_thread(saver.get_tuple, thread_config("thread-1"))
+        listed = await asyncio.to_thread(lambda: [item.checkpoint["id"] for item in saver.list(thread_config("thread-1"))])
+
+        # Then
+        assert latest.checkpoint["id"] == "0002"
+        assert listed == ["0002", "0001"]
+        with pytest.raises(asyncio.InvalidStateError):
+            saver.get_tuple(thread_config("thread-1"))
+
+
+@pytest.mark.unit
+class TestPostgresCheckpointSaver(SaverContract):
+    """PostgresCheckpointSaver 단위 테스트 (같은 SQLAlchemy Core 쿼리를 SQLite 엔진으로 실행)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path, monkeypatch):
+        """각 테스트 메서드 실행 전 설정 (마이그레이션 대신 모델로 테이블 생성)"""
+        monkeypatch.setattr(savers_module, "get_redis_lock", lambda: FakeLock())
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'checkpoint.db'}")
+        async with self.engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[GraphCheckpoint.__table__, GraphCheckpointWrite.__table__],
+            )
+        yield
+        await self.engine.dispose()
+
+    async def make_saver(self, keep_last: int = 0, thread_ttl: int = 0) -> PostgresCheckpointSaver:
+        saver = PostgresCheckpointSaver(self.engine, keep_last=keep_last, thread_ttl=thread_ttl)
+        await saver.configure()
+        return saver
+
+    async def maintain(self, saver: PostgresCheckpointSaver) -> None:
+        await saver.run()
+
+    async def count_writes(self, thread_id: str) -> int:
+        async with self.engine.connect() as conn:
+            return await conn.scalar(
+                select(func.count()).select_from(GraphCheckpointWrite).where(GraphCheckpointWrite.thread_id == thread_id)
+            )
+
+    async def test_setup_requires_migration(self, tmp_path):
+        """테이블이 없으면 마이그레이션 안내와 함께 실패"""
+        # Given
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}")
+
+        # When & Then
+        with pytest.raises(RuntimeError, match="alembic upgrade head"):
+            await PostgresCheckpointSaver(engine).configure()
+        await engine.dispose()
+
+    async def test_put_does_not_prune(self):
+        """기록 시에는 INSERT 만 하고 keep_last 정리는 주기 작업에서 실행"""
+        # Given
+        saver = await self.make_saver(keep_last=2)
+
+        # When
+        await put_checkpoints(saver, "thread-1", ["0001", "0002", "0003"])
+        before = [item.checkpoint["id"] async for item in saver.alist(thread_config("thread-1"))]
+        await saver.run()
+        after = [item.checkpoint["id"] async for item in saver.alist(thread_config("thread-1"))]
+
+        # Then
+        assert before == ["0003", "0002", "0001"]
+        assert after == ["0003", "0002"]
+        assert saver.get_stats()["pruned_checkpoints"] == 1
+
+    async def test_keep_last_removes_orphaned_writes(self):
+        """남은 체크포인트에 속하지 않는 writes 는 체크포인트가 없어도 정리"""
+        # Given - 기록되지 않은 체크포인트의 writes
+        saver = await self.make_saver(keep_last=2)
+        await saver.aput_writes(thread_config("thread-1", "0000"), [("messages", "orphan")], "task-1")
+        await put_checkpoints(saver, "thread-1", ["0001"])
+
+        # When
+        await saver.run()
+
+        # Then
+        assert await self.count_writes("thread-1") == 0
+        assert saver.get_stats()["pruned_writes"] == 1
+
+    async def test_run_deletes_expired_threads(self):
+        """마지막 기록 후 thread_ttl 이 지난 스레드만 삭제"""
+        # Given - thread-1 은 2분 전 기록
+        saver = await self.make_saver(thread_ttl=60)
+        for thread_id in ("thread-1", "thread-2"):
+            await put_checkpoints(saver, thread_id, ["0001"])
+            await saver.aput_writes(thread_config(thread_id, "0001"), [("messages", "hi")], "task-1")
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                update(GraphCheckpoint)
+                .where(GraphCheckpoint.thread_id == "thread-1")
+                .values(created_at=datetime.now(timezone.utc) - timedelta(minutes=2))
+            )
+
+        # When
+        await saver.run()
+
+        # Then
+        assert await saver.aget_tuple(thread_config("thread-1")) is None
+        assert await self.count_writes("thread-1") == 0
+        assert await saver.aget_tuple(thread_config("thread-2")) is not None
+        assert saver.get_stats()["expired_threads"] == 1
+
+
+@pytest.mark.unit
+class TestRedisCheckpointSaver(SaverContract):
+    """RedisCheckpointSaver 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        self.redis = FakeRedis()
+
+        async def get_fake_redis():
+            return self.redis
+
+        monkeypatch.setattr(savers_module, "get_redis_client", get_fake_redis)
+
+    async def make_saver(self, keep_last: int = 0, thread_ttl: int = 0) -> RedisCheckpointSaver:
+        saver = RedisCheckpointSaver(keep_last=keep_last, thread_ttl=thread_ttl)
+        await saver.configure()
+        return saver
+
+    async def count_writes(self, thread_id: str) -> int:
+        prefix = f"graph:checkpoint:writes:{thread_id}:"
+        return sum(len(fields) for key, fields in self.redis.hashes.items() if key.startswith(prefix))
+
+    async def test_put_refreshes_ttl_of_kept_keys(self):
+        """기록마다 이전 체크포인트를 포함한 namespace 키 전체의 TTL 갱신"""
+        # Given
+        saver = await self.make_saver(keep_last=2, thread_ttl=60)
+        await put_checkpoints(saver, "thread-1", ["0001"])
+        await saver.aput_writes(thread_config("thread-1", "0001"), [("messages", "hi")], "task-1")
+        self.redis.ttls.clear()
+
+        # When
+        await put_checkpoints(saver, "thread-1", ["0002"])
+
+        # Then
+        assert set(self.redis.ttls) == {
+            "graph:checkpoint:thread:thread-1",
+            "graph:checkpoint:index:thread-1:",
+            "graph:checkpoint:thread-1::0001",
+            "graph:checkpoint:writes:thread-1::0001",
+            "graph:checkpoint:thread-1::0002",
+            "graph:checkpoint:writes:thread-1::0002",
+        }
+        assert set(self.redis.ttls.values()) == {60}
@@ -0,0 +1,35 @@
+import pytest
+
+from app.core.local_cache import MISSING, LocalTTLCache
+
+
+@pytest.mark.unit
+class TestLocalTTLCache:
+    """L1 캐시 단위 테스트"""
+
+    def test_lru_eviction(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        # Given
+        l1 = LocalTTLCache(max_size=2, ttl=60)
+        l1.set("a", 1)
+        l1.set("b", 2)
+        l1.get("a")
+
+        # When
+        l1.set("c", 3)
+
+        # Then
+        assert l1.get("b") is MISSING
+        assert l1.get("a") == 1
+        assert l1.evictions == 1
+
+    def test_ttl_expiry(self):
+        """TTL 이 지나면 조회되지 않음"""
+        # Given
+        l1 = LocalTTLCache(max_size=2, ttl=0)
+
+        # When
+        l1.set("a", 1)
+
+        # Then
+        assert l1.get("a") is MISSING
@@ -0,0 +1,79 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from app.core.metrics import generate_metrics
+from app.middleware.metrics import PrometheusMetricsMiddleware
+
+
+@pytest.mark.unit
+class TestPrometheusMetricsMiddleware:
+    """PrometheusMetricsMiddleware 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """각 테스트 메서드 실행 전 설정"""
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"item_id": item_id}
+
+        app.add_middleware(PrometheusMetricsMiddleware)
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    @staticmethod
+    def _sample(name, labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    async def test_route_label_uses_template(self):
+        """라우트 라벨은 raw path 가 아닌 템플릿 경로"""
+        # Given
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = self._sample("http_requests_total", labels)
+
+        # When
+        await self.client.get("/items/a")
+        await self.client.get("/items/b")
+
+        # Then
+        assert self._sample("http_requests_total", labels) == before + 2
+        assert self._sample("http_requests_total", {**labels, "route": "/items/a"}) == 0
+        assert self._sample(
+            "http_request_duration_seconds_count",
+            {"method": "GET", "route": "/items/{item_id}"}
+        ) >= 2
+
+    async def test_unmatched_route_grouped(self):
+        """매칭되지 않는 경로는 하나의 라벨로 묶임"""
+        # Given
+        labels = {"method": "GET", "route": PrometheusMetricsMiddleware.UNMATCHED_ROUTE, "status": "404"}
+        before = self._sample("http_requests_total", labels)
+
+        # When
+        await self.client.get("/unknown/1")
+        await self.client.get("/unknown/2")
+
+        # Then
+        assert self._sample("http_requests_total", labels) == before + 2
+
+    async def test_in_progress_gauge_returns_to_zero(self):
+        """요청 완료 후 in-flight 게이지 복귀"""
+        # When
+        await self.client.get("/items/a")
+
+        # Then
+        assert self._sample("http_requests_in_progress", {"method": "GET"}) == 0
+
+    async def test_generate_metrics_exposition(self):
+        """/metrics 노출 포맷 생성"""
+        # Given
+        await self.client.get("/items/a")
+
+        # When
+        content, content_type = generate_metrics()
+
+        # Then
+        assert content_type.startswith("text/plain")
+        assert b'http_requests_total{method="GET",route="/items/{item_id}",status="200"}' in content
@@ -0,0 +1,84 @@
+import gzip
+import pytest
+from datetime import datetime
+
+from app.util.record_io import iter_encoded, iter_lines, iter_records
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.unit
+class TestRecordIO:
+    """NDJSON/CSV 스트림 읽기 단위 테스트"""
+
+    async def test_lines_split_across_chunks(self):
+        """청크 경계에 걸친 줄과 멀티바이트 문자 처리"""
+        # Given - "홍" 의 UTF-8 바이트가 청크 사이에서 나뉨
+        name = "홍길동".encode()
+        chunks = _chunks(b'{"a":1}\r\n{"b":', b'2}\n\n' + name[:1], name[1:] + b"\n", b"tail")
+
+        # When
+        lines = await _collect(iter_lines(chunks))
+
+        # Then - 빈 줄은 건너뛰고 줄 번호는 유지
+        assert lines == [(1, '{"a":1}'), (2, '{"b":2}'), (4, "홍길동"), (5, "tail")]
+
+    async def test_ndjson_invalid_lines_reported(self):
+        """파싱 실패 줄은 ValueError 로 반환"""
+        # Given
+        chunks = _chunks(b'{"email":"a@b.com"}\nnot-json\n[1,2]\n')
+
+        # When
+        records = await _collect(iter_records(chunks, "ndjson"))
+
+        # Then
+        assert records[0] == (1, {"email": "a@b.com"})
+        assert isinstance(records[1][1], ValueError)
+        assert isinstance(records[2][1], ValueError)
+
+    async def test_csv_uses_header(self):
+        """CSV 첫 줄을 헤더로 사용"""
+        # Given
+        chunks = _chunks(b'email,name\na@b.com,"Kim, Cheolsu"\nb@b.com\n')
+
+        # When
+        records = await _collect(iter_records(chunks, "csv"))
+
+        # Then
+        assert records[0] == (2, {"email": "a@b.com", "name": "Kim, Cheolsu"})
+        assert records[1][0] == 3
+        assert isinstance(records[1][1], ValueError)
+
+    async def test_unsupported_format(self):
+        """지원하지 않는 형식"""
+        # When & Then
+        with pytest.raises(ValueError, match="Unsupported format"):
+            await _collect(iter_records(_chunks(b""), "xml"))
+
+    async def test_encode_round_trip(self):
+        """인코딩한 NDJSON/CSV 를 다시 읽으면 같은 레코드"""
+        # Given
+        columns = ("email", "name", "created_at")
+        rows = [("a@b.com", "Kim, Cheolsu", datetime(2024, 1, 1, 12, 0)), ("c@d.com", "홍길동", datetime(2024, 1, 2))]
+
+        async def batches():
+            yield rows[:1]
+            yield rows[1:]
+
+        for fmt in ("ndjson", "csv"):
+            # When
+            encoded = await _collect(iter_encoded(batches(), columns, fmt, gzip=True))
+            records = await _collect(iter_records(_chunks(gzip.decompress(b"".join(encoded))), fmt))
+
+            # Then
+            assert [record for _, record in records] == [
+                {"email": "a@b.com", "name": "Kim, Cheolsu", "created_at": "2024-01-01T12:00:00"},
+                {"email": "c@d.com", "name": "홍길동", "created_at": "2024-01-02T00:00:00"},
+            ]
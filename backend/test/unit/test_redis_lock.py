@@ -0,0 +1,318 @@
+import asyncio
+import pytest
+from typing import Dict, List, Optional, Set
+
+from app.core.lock import redis_lock as redis_lock_module
+from app.core.lock.redis_lock import RedisLock
+
+
+class FakePubSub:
+    """테스트용 pub/sub (subscribe/unsubscribe/get_message 만 지원)"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.channels: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages: bool = True, timeout: float = 1.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        self.closed = True
+        self.redis.pubsubs.remove(self)
+
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (락 스크립트/pub/sub 지원, TTL 만료 없음)"""
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+        self.pubsubs: List[FakePubSub] = []
+        self.set_calls: List[str] = []       # SET NX 를 시도한 토큰
+        self.published: List[str] = []
+        self.publish_enabled = True
+
+    async def set(self, key, value, nx=False, ex=None) -> Optional[bool]:
+        self.set_calls.append(value)
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key) -> Optional[str]:
+        return self.data.get(key)
+
+    async def exists(self, key) -> int:
+        return int(key in self.data)
+
+    async def eval(self, script, numkeys, key, token, arg):
+        if self.data.get(key) != token:
+            return 0
+        if "publish" in script:
+            del self.data[key]
+            self.publish(arg)
+        return 1
+
+    def publish(self, channel: str) -> None:
+        self.published.append(channel)
+        if not self.publish_enabled:
+            return
+        for pubsub in self.pubsubs:
+            if channel in pubsub.channels:
+                pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": "released"})
+
+    def pubsub(self, ignore_subscribe_messages: bool = True) -> FakePubSub:
+        pubsub = FakePubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+
+async def hold(lock: RedisLock, name: str, release: asyncio.Event) -> bool:
+    """별도 태스크(토큰 맵)에서 락을 획득해 release 가 set 될 때까지 보유"""
+    acquired = await lock.acquire(name, ttl=30)
+    if acquired:
+        await release.wait()
+        await lock.release(name)
+    return acquired
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    redis = FakeRedis()
+
+    async def get_fake_redis():
+        return redis
+
+    monkeypatch.setattr(redis_lock_module, "get_redis_client", get_fake_redis)
+    return redis
+
+
+@pytest.mark.unit
+class TestLockReleaseNotifier:
+    """해제 알림 대기 / 백오프 폴백 단위 테스트 (프로세스 2개 = RedisLock 인스턴스 2개)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_redis):
+        """각 테스트 메서드 실행 전 설정"""
+        self.redis = fake_redis
+        self.owner = RedisLock()
+        self.waiter = RedisLock()
+
+    async def start_owner(self) -> asyncio.Event:
+        release = asyncio.Event()
+        self.owner_task = asyncio.create_task(hold(self.owner, "job", release))
+        await asyncio.sleep(0.01)
+        assert await self.owner.is_locked("job")
+        return release
+
+    async def test_waiter_wakes_on_publish(self, monkeypatch):
+        """해제 메시지를 받으면 백오프를 기다리지 않고 바로 재시도"""
+        # Given - 백오프가 길어 알림 없이는 제시간에 획득할 수 없음
+        monkeypatch.setattr(RedisLock, "BACKOFF_BASE", 10.0)
+        monkeypatch.setattr(RedisLock, "BACKOFF_MAX", 10.0)
+        release = await self.start_owner()
+        waiter = asyncio.create_task(self.waiter.acquire("job", ttl=30, timeout=5))
+        await asyncio.sleep(0.05)
+
+        # When
+        release.set()
+        acquired = await asyncio.wait_for(waiter, timeout=1.0)
+
+        # Then
+        assert acquired is True
+        assert self.redis.published == ["lock:released:job"]
+        # 소유자 1회 + 대기자 첫 시도, 구독 직후 재시도, 알림 후 재시도
+        assert len(self.redis.set_calls) == 4
+
+    async def test_waiter_polls_without_message(self, monkeypatch):
+        """해제 메시지가 없어도(TTL 만료 등) 백오프 재시도로 획득"""
+        # Given
+        monkeypatch.setattr(RedisLock, "BACKOFF_BASE", 0.01)
+        monkeypatch.setattr(RedisLock, "BACKOFF_MAX", 0.02)
+        self.redis.publish_enabled = False
+        await self.start_owner()
+        waiter = asyncio.create_task(self.waiter.acquire("job", ttl=30, timeout=5))
+        await asyncio.sleep(0.05)
+
+        # When - 소유자 키 만료
+        del self.redis.data["lock:job"]
+        acquired = await asyncio.wait_for(waiter, timeout=1.0)
+
+        # Then
+        assert acquired is True
+        assert len(self.redis.set_calls) > 4
+        self.owner_task.cancel()
+
+    async def test_timeout_returns_false(self, monkeypatch):
+        """타임아웃까지 해제되지 않으면 실패하고 구독 정리"""
+        # Given
+        monkeypatch.setattr(RedisLock, "BACKOFF_BASE", 0.01)
+        await self.start_owner()
+
+        # When
+        acquired = await self.waiter.acquire("job", ttl=30, timeout=0.1)
+
+        # Then
+        assert acquired is False
+        assert self.waiter._notifier._waiters == {}
+        self.owner_task.cancel()
+
+    async def test_cancelled_waiter_unsubscribes(self):
+        """대기 중 취소되면 대기자/구독을 정리하고 리스너 종료"""
+        # Given
+        await self.start_owner()
+        waiter = asyncio.create_task(self.waiter.acquire("job", ttl=30, timeout=5))
+        await asyncio.sleep(0.05)
+        notifier = self.waiter._notifier
+        pubsub = notifier._pubsub
+        assert pubsub.channels == {"lock:released:job"}
+
+        # When
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(1.1)   # 리스너는 get_message timeout(1초) 후 대기자 없음을 확인하고 종료
+
+        # Then
+        assert notifier._waiters == {}
+        assert pubsub.channels == set()
+        assert pubsub.closed
+        assert notifier._listener is None
+        assert self.waiter._local == {}
+        self.owner_task.cancel()
+
+
+@pytest.mark.unit
+class TestRedisLockLocalQueue:
+    """같은 프로세스 내 같은 이름 대기자의 로컬 FIFO 대기열 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_redis, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        monkeypatch.setattr(RedisLock, "BACKOFF_BASE", 0.01)
+        monkeypatch.setattr(RedisLock, "BACKOFF_MAX", 0.02)
+        self.redis = fake_redis
+        self.lock = RedisLock()
+
+    async def test_waiters_acquire_in_fifo_order(self):
+        """먼저 대기한 코루틴부터 순서대로 획득"""
+        # Given
+        order: List[int] = []
+        release = asyncio.Event()
+        owner = asyncio.create_task(hold(self.lock, "job", release))
+        await asyncio.sleep(0.01)
+
+        async def waiter(index: int) -> None:
+            assert await self.lock.acquire("job", ttl=30, timeout=0)
+            order.append(index)
+            await asyncio.sleep(0.01)
+            await self.lock.release("job")
+
+        waiters = []
+        for index in range(3):
+            waiters.append(asyncio.create_task(waiter(index)))
+            await asyncio.sleep(0.01)
+
+        # When
+        release.set()
+        await asyncio.wait_for(asyncio.gather(owner, *waiters), timeout=2.0)
+
+        # Then
+        assert order == [0, 1, 2]
+        assert self.lock._local == {}
+
+    async def test_only_queue_head_contends_in_redis(self):
+        """다른 프로세스가 보유 중일 때 로컬 대기열 선두만 SET NX 를 시도"""
+        # Given - 다른 프로세스(인스턴스)가 보유
+        release = asyncio.Event()
+        other = asyncio.create_task(hold(RedisLock(), "job", release))
+        await asyncio.sleep(0.01)
+        owner_token = self.redis.data["lock:job"]
+
+        # When
+        waiters = [asyncio.create_task(self.lock.acquire("job", ttl=30, timeout=0.2)) for _ in range(3)]
+        results = await asyncio.gather(*waiters)
+
+        # Then - 선두 1개 토큰만 재시도, 나머지는 로컬 대기열에서 타임아웃
+        contenders = {token for token in self.redis.set_calls if token != owner_token}
+        assert results == [False, False, False]
+        assert len(contenders) == 1
+        assert self.lock._local == {}
+        release.set()
+        await other
+
+    async def test_timeout_budget_shared_between_local_and_remote(self):
+        """로컬 대기에 쓴 시간만큼 Redis 대기 시간이 줄어듦"""
+        # Given - 보유자는 해제 직후 다른 프로세스가 Redis 키를 가져간 상황을 만듦
+        async def owner_then_other_process() -> None:
+            await self.lock.acquire("job", ttl=30)
+            await asyncio.sleep(0.2)
+            await self.lock.release("job")
+            self.redis.data["lock:job"] = "other-process"
+
+        owner = asyncio.create_task(owner_then_other_process())
+        await asyncio.sleep(0.01)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        # When - 0.2초 후 로컬 대기열을 넘겨받고 Redis 에서 남은 시간만 대기
+        acquired = await self.lock.acquire("job", ttl=30, timeout=0.3)
+        await owner
+        elapsed = loop.time() - start
+
+        # Then - 전체 timeout(0.3초) 안에 실패 (로컬 0.2초 + Redis 0.3초가 아님)
+        assert acquired is False
+        assert elapsed < 0.4
+
+    async def test_release_without_token_frees_local_queue(self):
+        """토큰 없는 release 도 로컬 대기열을 넘겨 대기자가 멈추지 않음"""
+        # Given - 다른 태스크가 보유 (현재 태스크에는 토큰 없음)
+        owner = asyncio.create_task(self.lock.acquire("job", ttl=30))
+        assert await owner
+        waiter = asyncio.create_task(self.lock.acquire("job", ttl=30, timeout=1.0))
+        await asyncio.sleep(0.01)
+
+        # When
+        released = await self.lock.release("job")
+        del self.redis.data["lock:job"]      # 보유자 키 TTL 만료
+        acquired = await waiter
+
+        # Then
+        assert released is False
+        assert acquired is True
+
+    async def test_no_wait_fails_during_hand_off(self):
+        """해제 직후 넘겨받은 대기자가 아직 실행되지 않았어도 timeout=None 은 기다리지 않고 실패"""
+        # Given - 보유 중에 무제한 대기자가 줄을 섬 (획득 후 0.3초 보유)
+        assert await self.lock.acquire("job", ttl=30)
+
+        async def waiter() -> None:
+            assert await self.lock.acquire("job", ttl=30, timeout=0)
+            await asyncio.sleep(0.3)
+            await self.lock.release("job")
+
+        queued = asyncio.create_task(waiter())
+        await asyncio.sleep(0.01)
+        loop = asyncio.get_running_loop()
+
+        # When - 해제 직후 (대기자가 실행되기 전) 즉시 획득 시도
+        await self.lock.release("job")
+        start = loop.time()
+        acquired = await self.lock.acquire("job", ttl=30)
+        elapsed = loop.time() - start
+
+        # Then
+        assert acquired is False
+        assert elapsed < 0.1
+        await queued
+        assert self.lock._local == {}
@@ -0,0 +1,215 @@
+import math
+import pytest
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from app.core.graph.response_cache import SCOPE_GLOBAL, SemanticResponseCache
+
+
+# 질문별 고정 임베딩 (환불 질문 2개는 cosine 유사도 약 0.995)
+VECTORS = {
+    "환불은 언제까지 가능한가요?": [1.0, 0.0, 0.0],
+    "환불 언제까지 돼요?": [0.995, 0.0998, 0.0],
+    "배송은 얼마나 걸리나요?": [0.0, 1.0, 0.0],
+}
+
+
+class FakeEmbeddings:
+    """테스트용 임베딩 (VECTORS 조회)"""
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return VECTORS[text]
+
+
+def _match(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """Chroma where 필터 중 $and / 값 일치 / $gte / $lt 만 지원"""
+    if not where:
+        return True
+    if "$and" in where:
+        return all(_match(metadata, condition) for condition in where["$and"])
+    (field, condition), = where.items()
+    if isinstance(condition, dict):
+        (op, value), = condition.items()
+        return metadata[field] >= value if op == "$gte" else metadata[field] < value
+    return metadata[field] == condition
+
+
+class FakeCollection:
+    """테스트용 인메모리 Chroma 컬렉션 (cosine distance)"""
+
+    def __init__(self):
+        self.items: Dict[str, Dict[str, Any]] = {}
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        for id_, embedding, document, metadata in zip(ids, embeddings, documents, metadatas):
+            self.items[id_] = {"embedding": embedding, "document": document, "metadata": metadata}
+
+    def query(self, query_embeddings, n_results, where, include):
+        query = query_embeddings[0]
+
+        def distance(embedding):
+            dot = sum(a * b for a, b in zip(query, embedding))
+            return 1.0 - dot / (math.hypot(*query) * math.hypot(*embedding))
+
+        matched = sorted(
+            ((distance(item["embedding"]), id_, item) for id_, item in self.items.items() if _match(item["metadata"], where)),
+            key=lambda row: row[0],
+        )[:n_results]
+        return {
+            "ids": [[id_ for _, id_, _ in matched]],
+            "distances": [[d for d, _, _ in matched]],
+            "documents": [[item["document"] for _, _, item in matched]],
+            "metadatas": [[item["metadata"] for _, _, item in matched]],
+        }
+
+    def get(self, where, include):
+        return {"ids": [id_ for id_, item in self.items.items() if _match(item["metadata"], where)]}
+
+    def delete(self, ids=None, where=None):
+        targets = ids if ids is not None else self.get(where, [])["ids"]
+        for id_ in targets:
+            self.items.pop(id_, None)
+
+
+class FakeSearchCache:
+    """테스트용 검색 결과 캐시 (컬렉션 버전만 지원)"""
+
+    def __init__(self):
+        self.version = 0
+
+    async def get_version(self, collection_name: str) -> Optional[int]:
+        return self.version
+
+
+class FakeChromaManager:
+    """테스트용 ChromaManager (응답 캐시가 사용하는 속성만 지원)"""
+
+    def __init__(self, search_cache: Optional[FakeSearchCache] = None):
+        self.embeddings = FakeEmbeddings()
+        self.search_cache = search_cache
+        self.collection = FakeCollection()
+        self.collection_metadata = None
+
+    async def get_or_create_collection(self, collection_name, collection_metadata=None):
+        self.collection_metadata = collection_metadata
+        return SimpleNamespace(_collection=self.collection)
+
+
+@pytest.mark.unit
+class TestSemanticResponseCache:
+    """SemanticResponseCache 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.search_cache = FakeSearchCache()
+        self.manager = FakeChromaManager(self.search_cache)
+        self.cache = self.create_cache()
+
+    def create_cache(self, **kwargs) -> SemanticResponseCache:
+        return SemanticResponseCache(
+            self.manager,
+            collection_name="response_cache",
+            source_collection="faq",
+            threshold=0.95,
+            **kwargs,
+        )
+
+    async def test_similar_question_hits(self):
+        """유사도가 threshold 이상인 질문은 저장된 답변과 절약 토큰을 반환"""
+        # Given
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "7일 이내 가능합니다.", tokens=120)
+
+        # When
+        hit = await self.cache.lookup("환불 언제까지 돼요?", "session-1")
+        miss = await self.cache.lookup("배송은 얼마나 걸리나요?", "session-1")
+
+        # Then
+        assert hit["answer"] == "7일 이내 가능합니다."
+        assert hit["similarity"] >= 0.95
+        assert miss is None
+        assert self.manager.collection_metadata == {"hnsw:space": "cosine"}
+        stats = self.cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["saved_tokens"]) == (1, 1, 120)
+
+    async def test_same_question_overwrites_entry(self):
+        """같은 scope 의 같은 질문은 항목 하나로 덮어씀"""
+        # Given
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "이전 답변")
+
+        # When
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "새 답변")
+
+        # Then
+        assert len(self.manager.collection.items) == 1
+        assert (await self.cache.lookup("환불은 언제까지 가능한가요?", "session-1"))["answer"] == "새 답변"
+
+    async def test_scope(self):
+        """session scope 는 세션별로, global scope 는 전체 세션이 공유"""
+        # Given
+        global_cache = self.create_cache(scope=SCOPE_GLOBAL)
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "세션 답변")
+        await global_cache.store("배송은 얼마나 걸리나요?", "session-1", "공유 답변")
+
+        # When
+        other_session = await self.cache.lookup("환불은 언제까지 가능한가요?", "session-2")
+        shared = await global_cache.lookup("배송은 얼마나 걸리나요?", "session-2")
+
+        # Then
+        assert other_session is None
+        assert shared["answer"] == "공유 답변"
+
+    async def test_delete_session(self):
+        """세션 삭제 시 해당 세션 항목만 삭제"""
+        # Given
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "답변 1")
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-2", "답변 2")
+
+        # When
+        await self.cache.delete_session("session-1")
+
+        # Then
+        assert await self.cache.lookup("환불은 언제까지 가능한가요?", "session-1") is None
+        assert (await self.cache.lookup("환불은 언제까지 가능한가요?", "session-2"))["answer"] == "답변 2"
+
+    async def test_expired_entry_misses_and_is_purged(self):
+        """TTL 이 지난 항목은 조회되지 않고 purge 에서 삭제"""
+        # Given
+        cache = self.create_cache(ttl=60)
+        await cache.store("환불은 언제까지 가능한가요?", "session-1", "7일 이내 가능합니다.")
+        for item in self.manager.collection.items.values():
+            item["metadata"]["created_at"] -= 120
+
+        # When
+        result = await cache.lookup("환불은 언제까지 가능한가요?", "session-1")
+        await cache.purge()
+
+        # Then
+        assert result is None
+        assert self.manager.collection.items == {}
+        assert cache.get_stats()["purged"] == 1
+
+    async def test_source_collection_change_invalidates(self):
+        """원본 문서 컬렉션 버전이 바뀌면 이전 답변을 사용하지 않음"""
+        # Given
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "7일 이내 가능합니다.")
+
+        # When
+        self.search_cache.version += 1
+        result = await self.cache.lookup("환불은 언제까지 가능한가요?", "session-1")
+
+        # Then
+        assert result is None
+
+    async def test_unknown_version_bypasses(self):
+        """Redis 오류로 원본 버전을 알 수 없으면 캐시를 건너뜀"""
+        # Given
+        await self.cache.store("환불은 언제까지 가능한가요?", "session-1", "7일 이내 가능합니다.")
+        self.search_cache.version = None
+
+        # When
+        result = await self.cache.lookup("환불은 언제까지 가능한가요?", "session-1")
+
+        # Then
+        assert result is None
+        assert self.cache.get_stats()["bypassed"] == 1
@@ -0,0 +1,111 @@
+import pytest
+from typing import Dict, Optional
+
+from app.core import search_cache as search_cache_module
+from app.core.search_cache import SearchResultCache
+
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (get/set/incr 만 지원)"""
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key) -> Optional[str]:
+        self._check()
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self._check()
+        self.data[key] = value
+
+    async def incr(self, key) -> int:
+        self._check()
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+RESULTS = [{"id": "doc-1", "page_content": "환불은 7일 이내 가능합니다.", "metadata": {"source": "faq"}}]
+
+
+@pytest.mark.unit
+class TestSearchResultCache:
+    """SearchResultCache 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """각 테스트 메서드 실행 전 설정"""
+        self.redis = FakeRedis()
+
+        async def get_fake_redis():
+            return self.redis
+
+        monkeypatch.setattr(search_cache_module, "get_redis_client", get_fake_redis)
+        self.cache = SearchResultCache(version_ttl=0)
+
+    async def fill(self, cache: SearchResultCache, query: str = "환불 기간은?") -> None:
+        key, value = await cache.get("faq", query, 5)
+        assert value is None
+        await cache.set(key, RESULTS)
+
+    async def test_same_query_hits_l1_then_l2(self):
+        """같은 질의는 L1, 다른 워커에서는 L2 에서 조회"""
+        # Given
+        await self.fill(self.cache)
+
+        # When
+        _, local = await self.cache.get("faq", "  환불   기간은? ", 5)
+        _, shared = await SearchResultCache(version_ttl=0).get("faq", "환불 기간은?", 5)
+
+        # Then
+        assert local == RESULTS
+        assert shared == RESULTS
+        assert self.cache.get_stats()["l1_hits"] == 1
+
+    async def test_key_includes_k_and_filter(self):
+        """k 나 filter 가 다르면 다른 항목"""
+        # Given
+        await self.fill(self.cache)
+
+        # When
+        _, other_k = await self.cache.get("faq", "환불 기간은?", 10)
+        _, other_filter = await self.cache.get("faq", "환불 기간은?", 5, {"source": "faq"})
+
+        # Then
+        assert other_k is None
+        assert other_filter is None
+
+    async def test_bump_invalidates_collection(self):
+        """컬렉션 버전 증가 시 이전 결과는 다른 워커에서도 조회되지 않음"""
+        # Given
+        other = SearchResultCache(version_ttl=0)
+        await self.fill(self.cache)
+        await self.fill(self.cache, "배송 기간은?")
+
+        # When
+        await other.bump("faq")
+
+        # Then
+        assert (await self.cache.get("faq", "환불 기간은?", 5))[1] is None
+        assert (await other.get("faq", "배송 기간은?", 5))[1] is None
+        assert self.cache.get_stats()["misses"] == 3
+
+    async def test_redis_failure_bypasses_cache(self):
+        """Redis 오류로 버전을 알 수 없으면 캐시를 사용하지 않음"""
+        # Given
+        await self.fill(self.cache)
+        self.redis.fail = True
+
+        # When
+        key, value = await self.cache.get("faq", "환불 기간은?", 5)
+        await self.cache.bump("faq")
+
+        # Then
+        assert key is None and value is None
+        assert self.cache.get_stats()["bypassed"] == 1
+        assert self.cache.get_stats()["errors"] == 2
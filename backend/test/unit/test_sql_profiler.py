@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.profiling import OTHER_FINGERPRINT, SQLProfiler, fingerprint
+
+
+@pytest.fixture
+async def profiled_engine():
+    """SQLProfiler 를 등록한 인메모리 SQLite 엔진"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    profiler = SQLProfiler(slow_query_ms=10_000, n_plus_one_threshold=3, max_fingerprints=100)
+    profiler.install(engine)
+    yield engine, profiler
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    """statement fingerprint 정규화 단위 테스트"""
+
+    def test_literals_and_params_are_normalized(self):
+        """리터럴/바인드 파라미터가 ? 로 정규화되는지 테스트"""
+        # Given
+        statements = [
+            "SELECT * FROM \"user\" WHERE email = 'a@x.com' AND id = 10",
+            "SELECT *  FROM \"user\"\n WHERE email = $1 AND id = $2",
+            "SELECT * FROM \"user\" WHERE email = %(email)s AND id = %(id)s",
+        ]
+
+        # When
+        fingerprints = {fingerprint(statement) for statement in statements}
+
+        # Then
+        assert fingerprints == {"SELECT * FROM \"user\" WHERE email = ? AND id = ?"}
+
+    def test_in_lists_and_values_rows_are_collapsed(self):
+        """IN 목록/다중 VALUES 는 파라미터 개수와 무관하게 같은 fingerprint"""
+        # When & Then
+        assert fingerprint("SELECT 1 FROM t WHERE id IN (?, ?)") == fingerprint("SELECT 1 FROM t WHERE id IN (?, ?, ?, ?)")
+        assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == fingerprint("INSERT INTO t (a, b) VALUES (?, ?)")
+
+    def test_identifiers_with_digits_are_kept(self):
+        """숫자가 포함된 식별자는 유지되는지 테스트"""
+        # When & Then
+        assert fingerprint("SELECT t1.col2 FROM t1") == "SELECT t1.col2 FROM t1"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSQLProfiler:
+    """SQLProfiler 단위 테스트"""
+
+    async def test_statements_are_aggregated_per_request(self, profiled_engine):
+        """요청 단위 쿼리 수/DB 시간과 fingerprint 별 집계 테스트"""
+        # Given
+        engine, profiler = profiled_engine
+
+        # When
+        with profiler.track_request("req-1") as profile:
+            async with engine.connect() as conn:
+                for i in range(3):
+                    await conn.execute(text(f"SELECT {i}"))
+
+        # Then
+        assert profile.query_count == 3
+        assert profile.db_seconds > 0
+        assert profiler.statements["SELECT ?"].count == 3
+        assert profiler.get_top(1)[0]["fingerprint"] == "SELECT ?"
+        assert profiler.get_stats()["n_plus_one"] == 0
+
+    async def test_repeated_fingerprint_flags_n_plus_one(self, profiled_engine):
+        """같은 fingerprint 가 임계값을 넘으면 N+1 로 집계되는지 테스트"""
+        # Given
+        engine, profiler = profiled_engine
+
+        # When
+        with profiler.track_request("req-2"):
+            async with engine.connect() as conn:
+                for i in range(4):
+                    await conn.execute(text("SELECT :value"), {"value": i})
+
+        # Then
+        assert profiler.get_stats()["n_plus_one"] == 1
+
+    async def test_slow_queries_are_counted(self, profiled_engine):
+        """임계값 이상 걸린 쿼리가 느린 쿼리로 집계되는지 테스트"""
+        # Given
+        engine, profiler = profiled_engine
+        profiler.slow_query_seconds = 0
+
+        # When - 요청 밖에서도 전역 집계는 동작
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        # Then
+        assert profiler.get_stats()["slow_queries"] == 1
+        assert profiler.get_stats()["queries"] == 1
+
+    async def test_fingerprints_are_bounded(self):
+        """fingerprint 수가 최대치를 넘으면 <other> 로 합쳐지는지 테스트"""
+        # Given
+        profiler = SQLProfiler(slow_query_ms=10_000, max_fingerprints=2)
+
+        # When
+        for table in ("a", "b", "c", "d"):
+            profiler.record(f"SELECT * FROM {table}", 0.001)
+
+        # Then
+        assert len(profiler.statements) == 3
+        assert profiler.statements[OTHER_FINGERPRINT].count == 2
@@ -0,0 +1,273 @@
+import asyncio
+import pytest
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.core import cache as cache_module
+from app.core.cache import TwoTierCache
+from app.dto.user import UserDTO
+
+
+class FakePipeline:
+    """명령을 모았다가 execute 에서 순서대로 실행하는 테스트용 파이프라인"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: List[tuple] = []
+
+    def set(self, *args, **kwargs):
+        self.commands.append((self.redis.set, args, kwargs))
+
+    async def execute(self) -> List:
+        return [await command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (get/set/delete/publish/pipeline 만 지원, TTL 은 무시)"""
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+        self.published: List[tuple] = []
+        self.fail = False
+        self.fail_set = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        self._check()
+        if self.fail_set:
+            raise ConnectionError("redis write failed")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def publish(self, channel, message):
+        self._check()
+        self.published.append((channel, message))
+
+
+class FakeLock:
+    """테스트용 락 (항상 즉시 획득)"""
+
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
+        return True
+
+    async def release(self, name: str) -> bool:
+        return True
+
+
+@pytest.mark.unit
+class TestTwoTierCache:
+    """TwoTierCache 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, sample_user_dto):
+        """각 테스트 메서드 실행 전 설정"""
+        self.redis = FakeRedis()
+
+        async def get_fake_redis():
+            return self.redis
+
+        monkeypatch.setattr(cache_module, "get_redis_client", get_fake_redis)
+        monkeypatch.setattr(cache_module, "get_redis_lock", lambda: FakeLock())
+
+        self.cache = TwoTierCache(namespace="user", model=UserDTO, l1_max_size=2)
+        self.user = sample_user_dto
+        self.load_calls = 0
+
+    async def _loader(self) -> Optional[UserDTO]:
+        self.load_calls += 1
+        await asyncio.sleep(0.01)
+        return self.user
+
+    async def test_cold_key_loads_once(self):
+        """동시에 들어온 miss 는 loader 1회만 호출"""
+        # When
+        results = await asyncio.gather(*(
+            self.cache.get_or_load(self.user.email, self._loader) for _ in range(20)
+        ))
+
+        # Then
+        assert all(result == self.user for result in results)
+        assert self.load_calls == 1
+        assert self.cache.get_stats()["loads"] == 1
+
+    async def test_read_through_l1_then_l2(self):
+        """로드한 값은 L1, L1 만료/다른 워커에서는 L2 에서 조회"""
+        # Given
+        await self.cache.get_or_load(self.user.email, self._loader)
+
+        # When - 같은 워커
+        await self.cache.get_or_load(self.user.email, self._loader)
+        # When - 다른 워커 (L1 비어 있음, 같은 Redis)
+        other = TwoTierCache(namespace="user", model=UserDTO)
+        result = await other.get_or_load(self.user.email, self._loader)
+
+        # Then
+        assert result == self.user
+        assert self.load_calls == 1
+        assert self.cache.get_stats()["l1_hits"] == 1
+        assert other.get_stats()["l2_hits"] == 1
+
+    async def test_missing_value_cached(self):
+        """존재하지 않는 사용자(None)도 캐시"""
+        # Given
+        async def load_none():
+            self.load_calls += 1
+            return None
+
+        # When
+        first = await self.cache.get_or_load("none@example.com", load_none)
+        other = TwoTierCache(namespace="user", model=UserDTO)
+        second = await other.get_or_load("none@example.com", load_none)
+
+        # Then
+        assert first is None and second is None
+        assert self.load_calls == 1
+
+    async def test_invalidate_clears_and_publishes(self):
+        """무효화 시 L1/L2 삭제 후 다른 워커에 알림"""
+        # Given
+        await self.cache.get_or_load(self.user.email, self._loader)
+
+        # When
+        await self.cache.invalidate(self.user.email)
+        await self.cache.get_or_load(self.user.email, self._loader)
+
+        # Then
+        assert self.load_calls == 2
+        assert self.redis.published[-1][0] == self.cache.channel
+        assert self.redis.published[-1][1].endswith(f":{self.user.email}")
+
+    async def test_invalidate_many_leaves_tombstones(self):
+        """여러 키 무효화도 tombstone 을 남겨 진행 중인 채우기가 이전 값을 쓰지 못함"""
+        # Given
+        await self.cache.get_or_load(self.user.email, self._loader)
+
+        # When
+        await self.cache.invalidate_many([self.user.email, "other@example.com"])
+
+        # Then
+        assert sorted(self.redis.data.values()) == [cache_module._TOMBSTONE] * 2
+        assert await self.cache.get_or_load(self.user.email, self._loader) == self.user
+        assert self.load_calls == 2
+
+    async def test_invalidate_during_fill_is_not_overwritten(self):
+        """로드 중에 무효화(삭제)되면 로드한 이전 값을 L2/L1 에 다시 쓰지 않음"""
+        # Given - 삭제 전 값을 읽은 채 멈춘 로드
+        loaded = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def slow_loader() -> Optional[UserDTO]:
+            self.load_calls += 1
+            loaded.set()
+            await resume.wait()
+            return self.user
+
+        filling = asyncio.create_task(self.cache.get_or_load(self.user.email, slow_loader))
+        await loaded.wait()
+
+        # When - 삭제 후 로드 완료
+        await self.cache.invalidate(self.user.email)
+        resume.set()
+        stale = await filling
+
+        async def load_deleted() -> Optional[UserDTO]:
+            self.load_calls += 1
+            return None
+
+        other = TwoTierCache(namespace="user", model=UserDTO)
+        result = await other.get_or_load(self.user.email, load_deleted)
+
+        # Then - 다른 워커는 원본을 다시 조회해 삭제를 확인
+        assert stale == self.user
+        assert result is None
+        assert self.load_calls == 2
+        assert self.cache.get_stats()["l1_size"] == 0
+
+    async def test_set_during_fill_is_not_overwritten(self):
+        """로드 중에 갱신(set)되면 로드한 이전 값으로 덮어쓰지 않음"""
+        # Given
+        loaded = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def slow_loader() -> Optional[UserDTO]:
+            self.load_calls += 1
+            loaded.set()
+            await resume.wait()
+            return self.user
+
+        filling = asyncio.create_task(self.cache.get_or_load(self.user.email, slow_loader))
+        await loaded.wait()
+        updated = UserDTO(email=self.user.email, name="Updated", created_at=datetime(2024, 1, 1))
+
+        # When - 다른 워커가 갱신한 뒤 로드 완료
+        other = TwoTierCache(namespace="user", model=UserDTO)
+        await other.set(self.user.email, updated)
+        resume.set()
+        await filling
+
+        # Then - 두 워커 모두 새 값 조회
+        assert await self.cache.get_or_load(self.user.email, self._loader) == updated
+        assert await TwoTierCache(namespace="user", model=UserDTO).get_or_load(self.user.email, self._loader) == updated
+        assert self.load_calls == 1
+
+    async def test_remote_invalidation_drops_l1(self):
+        """다른 워커의 무효화 메시지만 L1 에서 제거"""
+        # Given
+        other = TwoTierCache(namespace="user", model=UserDTO)
+        await self.cache.get_or_load(self.user.email, self._loader)
+        updated = UserDTO(email=self.user.email, name="Updated", created_at=datetime(2024, 1, 1))
+
+        # When - 다른 워커가 갱신
+        await other.set(self.user.email, updated)
+        self.cache._on_invalidate(self.redis.published[-1][1])
+        result = await self.cache.get_or_load(self.user.email, self._loader)
+
+        # Then - L2 에서 새 값 조회
+        assert result == updated
+        assert self.load_calls == 1
+
+    async def test_failed_write_through_invalidates(self):
+        """L2 갱신 실패 시 이전 값을 남기지 않도록 무효화"""
+        # Given
+        await self.cache.get_or_load(self.user.email, self._loader)
+        updated = UserDTO(email=self.user.email, name="Updated", created_at=datetime(2024, 1, 1))
+        self.redis.fail_set = True
+
+        # When
+        await self.cache.set(self.user.email, updated)
+        result = await self.cache.get_or_load(self.user.email, self._loader)
+
+        # Then - L1/L2 모두 비어 원본을 다시 조회
+        assert self.load_calls == 2
+        assert result == self.user
+        assert self.cache.get_stats()["invalidations"] == 1
+        assert self.redis.published[-1][1].endswith(f":{self.user.email}")
+
+    async def test_redis_failure_falls_back_to_loader(self):
+        """Redis 장애 시 캐시 없이 원본 조회"""
+        # Given
+        self.redis.fail = True
+
+        # When
+        result = await self.cache.get_or_load(self.user.email, self._loader)
+
+        # Then
+        assert result == self.user
+        assert self.cache.get_stats()["errors"] >= 1
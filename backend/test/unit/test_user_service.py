@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock
 
+from app.core.counter import CountMode
 from app.dto.user import UserUpdateDTO, UserDTO
 
 
@@ -22,34 +23,31 @@ class TestUserServiceDI:
     async def test_create_user_success(self):
         """사용자 생성 성공 테스트 - DI 패턴"""
         # Given
-        self.mock_repository.get_by_email.return_value = None  # 기존 사용자 없음
         self.mock_repository.create.return_value = self.sample_user_dto
         
         # When
         result = await self.user_service.create_user(self.sample_user_create_dto)
         
-        # Then
+        # Then - 사전 조회 없이 INSERT 1회
         assert result == self.sample_user_dto
-        self.mock_repository.get_by_email.assert_called_once_with(self.sample_user_create_dto.email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.create.assert_called_once_with(self.sample_user_create_dto)
 
     async def test_create_user_already_exists(self):
         """사용자 생성 실패 - 이미 존재하는 이메일"""
         # Given
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto  # 이미 존재
+        self.mock_repository.create.return_value = None  # ON CONFLICT 로 삽입되지 않음
         
         # When & Then
         with pytest.raises(ValueError, match="already exists"):
             await self.user_service.create_user(self.sample_user_create_dto)
         
-        self.mock_repository.get_by_email.assert_called_once_with(self.sample_user_create_dto.email)
-        self.mock_repository.create.assert_not_called()
+        self.mock_repository.create.assert_called_once_with(self.sample_user_create_dto)
 
     async def test_create_user_with_session_success(self):
         """세션을 사용한 사용자 생성 성공 테스트"""
         # Given
         mock_session = AsyncMock()
-        self.mock_repository.get_by_email.return_value = None
         self.mock_repository.create.return_value = self.sample_user_dto
         
         # When
@@ -59,7 +57,7 @@ class TestUserServiceDI:
         
         # Then
         assert result == self.sample_user_dto
-        self.mock_repository.get_by_email.assert_called_once_with(self.sample_user_create_dto.email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.create.assert_called_once_with(self.sample_user_create_dto)
 
     async def test_get_user_by_email_found(self):
@@ -117,6 +115,49 @@ class TestUserServiceDI:
         # Then
         self.mock_repository.get_all.assert_called_once_with(skip=0, limit=100)
 
+    async def test_get_all_users_without_count(self, sample_user_list):
+        """count_mode=none 이면 전체 수를 계산하지 않음"""
+        # Given
+        self.mock_repository.get_all.return_value = sample_user_list
+        
+        # When
+        users, total = await self.user_service.get_all_users(count_mode=CountMode.NONE)
+        
+        # Then
+        assert users == sample_user_list
+        assert total is None
+        self.mock_repository.count_all.assert_not_called()
+        self.mock_repository.count_estimated.assert_not_called()
+
+    async def test_get_all_users_estimated_count(self, sample_user_list):
+        """count_mode=estimated 이면 근사치 조회"""
+        # Given
+        self.mock_repository.get_all.return_value = sample_user_list
+        self.mock_repository.count_estimated.return_value = 1000
+        
+        # When
+        users, total = await self.user_service.get_all_users(count_mode=CountMode.ESTIMATED)
+        
+        # Then
+        assert total == 1000
+        self.mock_repository.count_all.assert_not_called()
+
+    async def test_get_all_users_cached_count(self, sample_user_list):
+        """counter 가 주입되면 정확한 수는 캐시에서 조회"""
+        # Given
+        self.user_service.counter = AsyncMock()
+        self.user_service.counter.get.return_value = 42
+        self.mock_repository.get_all.return_value = sample_user_list
+        
+        # When
+        users, total = await self.user_service.get_all_users()
+        
+        # Then
+        assert users == sample_user_list
+        assert total == 42
+        self.user_service.counter.get.assert_awaited_once()
+        self.mock_repository.count_all.assert_not_called()
+
     async def test_update_user_success(self):
         """사용자 업데이트 성공 테스트"""
         # Given
@@ -127,7 +168,6 @@ class TestUserServiceDI:
             created_at=self.sample_user_dto.created_at
         )
         
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto
         self.mock_repository.update.return_value = updated_user
         
         # When
@@ -135,21 +175,20 @@ class TestUserServiceDI:
         
         # Then
         assert result == updated_user
-        self.mock_repository.get_by_email.assert_called_once_with(email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.update.assert_called_once_with(email, self.sample_user_update_dto)
 
     async def test_update_user_not_found(self):
         """사용자 업데이트 실패 - 사용자 없음"""
         # Given
         email = "nonexistent@example.com"
-        self.mock_repository.get_by_email.return_value = None
+        self.mock_repository.update.return_value = None  # 갱신된 행 없음
         
         # When & Then
         with pytest.raises(ValueError, match="not found"):
             await self.user_service.update_user(email, self.sample_user_update_dto)
         
-        self.mock_repository.get_by_email.assert_called_once_with(email)
-        self.mock_repository.update.assert_not_called()
+        self.mock_repository.update.assert_called_once_with(email, self.sample_user_update_dto)
 
     async def test_update_user_no_data(self):
         """사용자 업데이트 실패 - 업데이트할 데이터 없음"""
@@ -157,20 +196,16 @@ class TestUserServiceDI:
         email = "test@example.com"
         empty_update_dto = UserUpdateDTO()
         
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto
-        
         # When & Then
         with pytest.raises(ValueError, match="No data provided"):
             await self.user_service.update_user(email, empty_update_dto)
         
-        self.mock_repository.get_by_email.assert_called_once_with(email)
         self.mock_repository.update.assert_not_called()
 
     async def test_delete_user_success(self):
         """사용자 삭제 성공 테스트"""
         # Given
         email = "test@example.com"
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto
         self.mock_repository.delete.return_value = True
         
         # When
@@ -178,18 +213,65 @@ class TestUserServiceDI:
         
         # Then
         assert result is True
-        self.mock_repository.get_by_email.assert_called_once_with(email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.delete.assert_called_once_with(email)
 
     async def test_delete_user_not_found(self):
         """사용자 삭제 실패 - 사용자 없음"""
         # Given
         email = "nonexistent@example.com"
-        self.mock_repository.get_by_email.return_value = None
+        self.mock_repository.delete.return_value = False  # 삭제된 행 없음
         
         # When & Then
         with pytest.raises(ValueError, match="not found"):
             await self.user_service.delete_user(email)
         
-        self.mock_repository.get_by_email.assert_called_once_with(email)
-        self.mock_repository.delete.assert_not_called()
\ No newline at end of file
+        self.mock_repository.delete.assert_called_once_with(email)
+
+    async def test_get_user_by_email_uses_cache(self):
+        """캐시가 주입되면 캐시를 통해 조회"""
+        # Given
+        email = "test@example.com"
+        self.user_service.cache = AsyncMock()
+        self.user_service.cache.get_or_load.return_value = self.sample_user_dto
+        
+        # When
+        result = await self.user_service.get_user_by_email(email)
+        
+        # Then
+        assert result == self.sample_user_dto
+        self.user_service.cache.get_or_load.assert_called_once()
+        self.mock_repository.get_by_email.assert_not_called()
+
+    async def test_write_operations_update_cache(self):
+        """생성/수정은 캐시 갱신, 삭제는 캐시 무효화"""
+        # Given
+        email = "test@example.com"
+        self.user_service.cache = AsyncMock()
+        self.mock_repository.create.return_value = self.sample_user_dto
+        self.mock_repository.update.return_value = self.sample_user_dto
+        self.mock_repository.delete.return_value = True
+        
+        # When
+        await self.user_service.create_user(self.sample_user_create_dto)
+        await self.user_service.update_user(email, self.sample_user_update_dto)
+        await self.user_service.delete_user(email)
+        
+        # Then
+        assert self.user_service.cache.set.await_count == 2
+        self.user_service.cache.invalidate.assert_awaited_once_with(email)
+
+    async def test_write_operations_update_counter(self):
+        """생성/삭제 시 카운터 증감"""
+        # Given
+        email = "test@example.com"
+        self.user_service.counter = AsyncMock()
+        self.mock_repository.create.return_value = self.sample_user_dto
+        self.mock_repository.delete.return_value = True
+        
+        # When
+        await self.user_service.create_user(self.sample_user_create_dto)
+        await self.user_service.delete_user(email)
+        
+        # Then
+        assert [c.args for c in self.user_service.counter.incr.await_args_list] == [(1,), (-1,)]